@@ -4,8 +4,10 @@ import dataclasses
 import json
 import os
 from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import DefaultDict, Dict, List, Optional, Tuple, Union, cast
+from types import MappingProxyType
+from typing import DefaultDict, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 from marshmallow import EXCLUDE
 
@@ -46,20 +48,7 @@ class AbiParser:
 
         :param abi_list: Contract's ABI as a list of dictionaries.
         """
-        # prepend abi with core structures
-        core_structures = (
-            Path(os.path.dirname(__file__)) / "core_structures.json"
-        ).read_text("utf-8")
-        abi_list = json.loads(core_structures)["abi"] + abi_list
-        abi = [
-            ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list
-        ]
-        grouped = defaultdict(list)
-        for entry in abi:
-            assert isinstance(entry, dict)
-            grouped[entry["type"]].append(entry)
-
-        self._grouped = grouped
+        self._grouped = _group_by_type(abi_list)
 
     def parse(self) -> Abi:
         """
@@ -68,7 +57,7 @@ class AbiParser:
         :raises: AbiParsingError: on any parsing error.
         :return: Abi dataclass.
         """
-        structures, enums = self._parse_structures_and_enums()
+        structures, enums = self._parse_structures_and_enums(_get_core_structures())
         functions_dict = cast(
             Dict[str, FunctionDict],
             AbiParser._group_by_entry_name(
@@ -102,11 +91,16 @@ class AbiParser:
         raise RuntimeError("Tried to get type_parser before it was set.")
 
     def _parse_structures_and_enums(
-        self,
+        self, core_structures: Mapping[str, StructType]
     ) -> Tuple[Dict[str, StructType], Dict[str, EnumType]]:
         structs_dict = AbiParser._group_by_entry_name(
             self._grouped[STRUCT_ENTRY], "defined structures"
         )
+        for name in structs_dict:
+            if name in core_structures:
+                raise AbiParsingError(
+                    f"Name '{name}' was used more than once in defined structures."
+                )
         enums_dict = AbiParser._group_by_entry_name(
             self._grouped[ENUM_ENTRY], "defined enums"
         )
@@ -135,7 +129,11 @@ class AbiParser:
             enum_members[name] = enum["variants"]
 
         # Now parse the types of members and save them.
-        defined_structs_enums: Dict[str, Union[StructType, EnumType]] = dict(structs)
+        # Core structures are already parsed and shared by all parsers, they are only referenced.
+        defined_structs_enums: Dict[str, Union[StructType, EnumType]] = dict(
+            core_structures
+        )
+        defined_structs_enums.update(structs)
         defined_structs_enums.update(enums)
 
         self._type_parser = TypeParser(defined_structs_enums)
@@ -156,7 +154,7 @@ class AbiParser:
 
         self._check_for_cycles(defined_structs_enums)
 
-        return structs, enums
+        return {**core_structures, **structs}, enums
 
     @staticmethod
     def _check_for_cycles(structs: Dict[str, Union[StructType, EnumType]]):
@@ -208,6 +206,29 @@ class AbiParser:
         return grouped
 
 
+def _group_by_type(abi_list: List[Dict]) -> DefaultDict[str, List[Dict]]:
+    abi = [ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list]
+    grouped = defaultdict(list)
+    for entry in abi:
+        assert isinstance(entry, dict)
+        grouped[entry["type"]].append(entry)
+    return grouped
+
+
+@lru_cache(maxsize=None)
+def _get_core_structures() -> Mapping[str, StructType]:
+    """
+    Core structures are implicitly available in every ABI. They are loaded and parsed once per process
+    and the same StructType instances are shared by all parsed ABIs, so they must not be modified.
+    """
+    core_abi = json.loads(
+        (Path(os.path.dirname(__file__)) / "core_structures.json").read_text("utf-8")
+    )["abi"]
+    # pylint: disable=protected-access
+    structures, _ = AbiParser(core_abi)._parse_structures_and_enums({})
+    return MappingProxyType(structures)
+
+
 def _to_json(value):
     class DataclassSupportingEncoder(json.JSONEncoder):
         def default(self, o):
@@ -1,2 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
 from .model import Abi
-from .parser import AbiParser, AbiParsingError
+
+if TYPE_CHECKING:
+    from .parser import AbiParser, AbiParsingError
+
+__all__ = ["Abi", "AbiParser", "AbiParsingError"]
+
+
+def __getattr__(name: str) -> Any:
+    # The parser (importing lark and type parsers) is imported on first use, see PEP 562
+    if name in ("AbiParser", "AbiParsingError"):
+        from . import parser  # pylint: disable=import-outside-toplevel
+
+        return getattr(parser, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -234,6 +234,7 @@ class AbiParser:
             types=self._parse_members(
                 cast(List[TypedParameterDict], members_), event["name"]
             ),
+            kinds={member["name"]: member["kind"] for member in members_},
         )
 
     TypedParam = TypeVar(
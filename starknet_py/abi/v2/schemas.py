@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 from marshmallow_oneofschema.one_of_schema import OneOfSchema
 
 from starknet_py.abi.v2.shape import (
@@ -6,9 +6,11 @@ from starknet_py.abi.v2.shape import (
     DATA_KIND,
     ENUM_ENTRY,
     EVENT_ENTRY,
+    FLAT_KIND,
     FUNCTION_ENTRY,
     IMPL_ENTRY,
     INTERFACE_ENTRY,
+    KEY_KIND,
     L1_HANDLER_ENTRY,
     NESTED_KIND,
     STRUCT_ENTRY,
@@ -51,7 +53,11 @@ class L1HandlerAbiEntrySchema(FunctionBaseSchema):
 
 
 class EventStructMemberSchema(TypedParameterSchema):
-    kind = fields.Constant(DATA_KIND, data_key="kind", required=True)
+    kind = fields.String(
+        data_key="kind",
+        required=True,
+        validate=validate.OneOf([DATA_KIND, KEY_KIND, NESTED_KIND, FLAT_KIND]),
+    )
 
 
 class EventStructAbiEntrySchema(Schema):
@@ -64,7 +70,11 @@ class EventStructAbiEntrySchema(Schema):
 
 
 class EventEnumVariantSchema(TypedParameterSchema):
-    kind = fields.Constant(NESTED_KIND, data_key="kind", required=True)
+    kind = fields.String(
+        data_key="kind",
+        required=True,
+        validate=validate.OneOf([DATA_KIND, KEY_KIND, NESTED_KIND, FLAT_KIND]),
+    )
 
 
 class EventEnumAbiEntrySchema(Schema):
@@ -12,7 +12,9 @@ IMPL_ENTRY = "impl"
 INTERFACE_ENTRY = "interface"
 
 DATA_KIND = "data"
+KEY_KIND = "key"
 NESTED_KIND = "nested"
+FLAT_KIND = "flat"
 
 
 class TypeDict(TypedDict):
@@ -56,7 +58,7 @@ class EventBaseDict(TypedDict):
 
 
 class EventStructMemberDict(TypedParameterDict):
-    kind: Literal["data"]
+    kind: Literal["data", "key"]
 
 
 class EventStructDict(EventBaseDict):
@@ -65,7 +67,7 @@ class EventStructDict(EventBaseDict):
 
 
 class EventEnumVariantDict(TypedParameterDict):
-    kind: Literal["nested"]
+    kind: Literal["nested", "flat"]
 
 
 class EventEnumDict(EventBaseDict):
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from abc import ABC
 from collections import OrderedDict
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 
 class CairoType(ABC):
@@ -121,3 +121,6 @@ class EventType(CairoType):
 
     name: str
     types: OrderedDict[str, CairoType]
+    #: Kind of every member (``"key"``, ``"data"``) or variant (``"nested"``, ``"flat"``) of the event.
+    #: Empty for events coming from ABIs that don't specify kinds.
+    kinds: Dict[str, str] = field(default_factory=dict)
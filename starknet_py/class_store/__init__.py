@@ -0,0 +1 @@
+from .class_store import ClassStore
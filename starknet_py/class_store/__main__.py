@@ -0,0 +1,91 @@
+"""
+Pre-warms a class store with classes of contracts at given addresses.
+
+Usage: python -m starknet_py.class_store --node-url URL --store PATH [ADDRESS ...] [--addresses-file FILE]
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from starknet_py.class_store.class_store import DEFAULT_MAX_SIZE, ClassStore
+from starknet_py.class_store.prewarm import prewarm_class_store
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.proxy.contract_abi_resolver import ProxyConfig, prepare_proxy_config
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m starknet_py.class_store",
+        description="Fetch classes of contracts and save them in a class store.",
+    )
+    parser.add_argument("addresses", nargs="*", help="Addresses of contracts.")
+    parser.add_argument(
+        "--addresses-file",
+        help="File with addresses of contracts, one per line.",
+    )
+    parser.add_argument("--node-url", required=True, help="URL of a node.")
+    parser.add_argument("--store", required=True, help="Path to the class store.")
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="Maximal size of the store in bytes.",
+    )
+    parser.add_argument(
+        "--store-classes",
+        action="store_true",
+        help="Store whole contract classes, not only abis.",
+    )
+    parser.add_argument(
+        "--resolve-proxies",
+        action="store_true",
+        help="Store classes of proxies' implementations.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=20,
+        help="Maximal number of contracts resolved at the same time.",
+    )
+    return parser.parse_args(argv)
+
+
+def _read_addresses(args: argparse.Namespace) -> List[str]:
+    addresses = list(args.addresses)
+    if args.addresses_file is not None:
+        with open(args.addresses_file, "r", encoding="utf-8") as file:
+            addresses.extend(line.strip() for line in file if line.strip())
+    return addresses
+
+
+async def _prewarm(args: argparse.Namespace) -> int:
+    addresses = _read_addresses(args)
+    proxy_config = prepare_proxy_config(ProxyConfig()) if args.resolve_proxies else None
+
+    with ClassStore(
+        args.store, max_size=args.max_size, store_classes=args.store_classes
+    ) as class_store:
+        errors = await prewarm_class_store(
+            class_store,
+            [int(address, 0) for address in addresses],
+            FullNodeClient(node_url=args.node_url),
+            proxy_config=proxy_config,
+            max_concurrency=args.max_concurrency,
+        )
+
+    for address, error in errors.items():
+        print(f"Failed to resolve {hex(address)}: {error}", file=sys.stderr)
+    print(
+        f"Stored classes of {len(addresses) - len(errors)}/{len(addresses)} contracts."
+    )
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return asyncio.run(_prewarm(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
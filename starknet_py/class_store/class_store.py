@@ -0,0 +1,237 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union, cast
+
+from starknet_py.abi.v0.shape import AbiDictList
+from starknet_py.net.client_models import DeprecatedContractClass, SierraContractClass
+from starknet_py.net.schemas.rpc.contract import (
+    DeprecatedContractClassSchema,
+    SierraContractClassSchema,
+)
+
+ContractClass = Union[SierraContractClass, DeprecatedContractClass]
+
+DEFAULT_MAX_SIZE = 512 * 2**20
+
+
+class ClassStore:
+    """
+    Persistent store of contract classes, kept in a SQLite database.
+
+    Classes are immutable, so they are identified by class hash only and a store can be shared
+    between networks and processes. By default only abis are stored, which is enough
+    for :meth:`starknet_py.contract.Contract.from_address`.
+
+    When the total size of stored entries exceeds ``max_size``, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+        store_classes: bool = False,
+    ):
+        """
+        :param path: Path to the database file. It is created if it doesn't exist.
+            ``":memory:"`` can be used to create a store kept in memory.
+        :param max_size: Maximal total size of stored entries in bytes. If None, entries are never evicted.
+        :param store_classes: If True, whole contract classes are stored along with abis.
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("Argument max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self.store_classes = store_classes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS classes ("
+                "class_hash TEXT PRIMARY KEY, "
+                "cairo_version INTEGER NOT NULL, "
+                "abi TEXT NOT NULL, "
+                "contract_class TEXT, "
+                "size INTEGER NOT NULL, "
+                "last_access INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS classes_last_access ON classes (last_access)"
+            )
+
+    def get_abi(self, class_hash: int) -> Optional[Tuple[AbiDictList, int]]:
+        """
+        :param class_hash: Hash of the class.
+        :return: Abi and cairo version of the class or None if the class is not stored.
+        """
+        row = self._get(class_hash, "abi, cairo_version")
+        if row is None:
+            return None
+
+        abi, cairo_version = row
+        return json.loads(abi), cairo_version
+
+    def get_class(self, class_hash: int) -> Optional[ContractClass]:
+        """
+        :param class_hash: Hash of the class.
+        :return: Contract class or None if the class is not stored or only its abi is stored.
+        """
+        row = self._get(class_hash, "contract_class, cairo_version")
+        if row is None or row[0] is None:
+            return None
+
+        contract_class, cairo_version = row
+        schema = (
+            SierraContractClassSchema()
+            if cairo_version == 1
+            else DeprecatedContractClassSchema()
+        )
+        return cast(ContractClass, schema.load(json.loads(contract_class)))
+
+    def put_class(self, class_hash: int, contract_class: ContractClass):
+        """
+        Stores abi of a contract class and, if ``store_classes`` is set, the class itself.
+
+        :param class_hash: Hash of the class.
+        :param contract_class: Contract class with abi.
+        """
+        if contract_class.abi is None:
+            raise ValueError("Contract class without abi can't be stored.")
+
+        if isinstance(contract_class, SierraContractClass):
+            abi = json.loads(contract_class.abi)
+            cairo_version = 1
+        else:
+            abi = contract_class.abi
+            cairo_version = 0
+
+        serialized_class = (
+            _serialize_contract_class(contract_class) if self.store_classes else None
+        )
+        self._put(class_hash, cairo_version, json.dumps(abi), serialized_class)
+
+    def put_abi(self, class_hash: int, abi: AbiDictList, cairo_version: int):
+        """
+        Stores abi of a class.
+
+        :param class_hash: Hash of the class.
+        :param abi: Abi of the class.
+        :param cairo_version: Cairo version of the class.
+        """
+        self._put(class_hash, cairo_version, json.dumps(abi), None)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of stored entries in bytes.
+        """
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM classes"
+            ).fetchone()
+        return size
+
+    def __contains__(self, class_hash: int) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM classes WHERE class_hash = ?", (hex(class_hash),)
+            ).fetchone()
+        return row is not None
+
+    def evict(self, max_size: Optional[int] = None):
+        """
+        Removes the least recently used entries until their total size doesn't exceed ``max_size``.
+
+        :param max_size: Size in bytes to shrink the store to. Defaults to ``max_size`` of the store.
+        """
+        max_size = max_size if max_size is not None else self.max_size
+        if max_size is None:
+            return
+
+        with self._lock, self._connection:
+            self._evict(max_size)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM classes")
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get(self, class_hash: int, columns: str) -> Optional[Tuple]:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                f"SELECT {columns} FROM classes WHERE class_hash = ?",
+                (hex(class_hash),),
+            ).fetchone()
+            if row is not None:
+                self._connection.execute(
+                    "UPDATE classes SET last_access = "
+                    "(SELECT MAX(last_access) + 1 FROM classes) WHERE class_hash = ?",
+                    (hex(class_hash),),
+                )
+        return row
+
+    def _put(
+        self,
+        class_hash: int,
+        cairo_version: int,
+        abi: str,
+        contract_class: Optional[str],
+    ):
+        size = len(abi) + (len(contract_class) if contract_class is not None else 0)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO classes "
+                "(class_hash, cairo_version, abi, contract_class, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(last_access), 0) + 1 FROM classes))",
+                (hex(class_hash), cairo_version, abi, contract_class, size),
+            )
+            if self.max_size is not None:
+                self._evict(self.max_size)
+
+    def _evict(self, max_size: int):
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM classes"
+        ).fetchone()
+        if total_size <= max_size:
+            return
+
+        evicted = []
+        for class_hash, size in self._connection.execute(
+            "SELECT class_hash, size FROM classes ORDER BY last_access"
+        ):
+            if total_size <= max_size:
+                break
+            evicted.append((class_hash,))
+            total_size -= size
+
+        self._connection.executemany(
+            "DELETE FROM classes WHERE class_hash = ?", evicted
+        )
+
+
+def _serialize_contract_class(contract_class: ContractClass) -> str:
+    if isinstance(contract_class, SierraContractClass):
+        return json.dumps(SierraContractClassSchema().dump(contract_class))
+
+    # Abi is already kept in its serialized form
+    return json.dumps(
+        {
+            **DeprecatedContractClassSchema(exclude=("abi",)).dump(contract_class),
+            "abi": contract_class.abi,
+        }
+    )
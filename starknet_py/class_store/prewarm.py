@@ -0,0 +1,54 @@
+import asyncio
+from typing import Dict, Iterable, Optional
+
+from starknet_py.class_store.class_store import ClassStore
+from starknet_py.net.client import Client
+from starknet_py.net.models import AddressRepresentation, parse_address
+from starknet_py.proxy.contract_abi_resolver import (
+    AbiResolverCache,
+    ContractAbiResolver,
+    ProxyConfig,
+)
+
+
+async def prewarm_class_store(
+    class_store: ClassStore,
+    addresses: Iterable[AddressRepresentation],
+    client: Client,
+    proxy_config: Optional[ProxyConfig] = None,
+    max_concurrency: int = 20,
+) -> Dict[int, Exception]:
+    """
+    Fetches classes of contracts deployed at given addresses and saves them in the store.
+    Classes which are already stored are not fetched again.
+
+    :param class_store: Store to fill.
+    :param addresses: Addresses of contracts.
+    :param client: Client used to fetch classes.
+    :param proxy_config: Proxy config used to resolve implementations of proxies.
+        If not provided, classes of contracts at the addresses are stored.
+    :param max_concurrency: Maximal number of contracts resolved at the same time.
+    :return: Dictionary of addresses which couldn't be resolved and errors raised while resolving them.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("Argument max_concurrency must be greater than 0.")
+
+    cache = AbiResolverCache()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    errors: Dict[int, Exception] = {}
+
+    async def _prewarm(address: int):
+        async with semaphore:
+            try:
+                await ContractAbiResolver(
+                    address=address,
+                    client=client,
+                    proxy_config=proxy_config or ProxyConfig(),
+                    cache=cache,
+                    class_store=class_store,
+                ).resolve()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                errors[address] = err
+
+    await asyncio.gather(*(_prewarm(parse_address(address)) for address in addresses))
+    return errors
@@ -9,20 +9,19 @@ from typing import Dict, List, Optional, Tuple, TypeVar, Union
 from marshmallow import ValidationError
 
 from starknet_py.abi.v0 import Abi as AbiV0
-from starknet_py.abi.v0 import AbiParser as AbiParserV0
 from starknet_py.abi.v1 import Abi as AbiV1
-from starknet_py.abi.v1 import AbiParser as AbiParserV1
 from starknet_py.abi.v2 import Abi as AbiV2
-from starknet_py.abi.v2 import AbiParser as AbiParserV2
 from starknet_py.abi.v2.shape import (
     FUNCTION_ENTRY,
     IMPL_ENTRY,
     INTERFACE_ENTRY,
     L1_HANDLER_ENTRY,
 )
+from starknet_py.class_store import ClassStore
 from starknet_py.common import create_compiled_contract, create_sierra_compiled_contract
 from starknet_py.constants import DEFAULT_DEPLOYER_ADDRESS
 from starknet_py.contract_utils import _extract_compiled_class_hash, _unpack_provider
+from starknet_py.hash.class_hash_cache import ClassHashCache
 from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.net.account.base_account import BaseAccount
 from starknet_py.net.client import Client
@@ -68,6 +67,11 @@ class ContractData:
 
         :return: Abi
         """
+        # pylint: disable=import-outside-toplevel
+        from starknet_py.abi.v0 import AbiParser as AbiParserV0
+        from starknet_py.abi.v1 import AbiParser as AbiParserV1
+        from starknet_py.abi.v2 import AbiParser as AbiParserV2
+
         if self.cairo_version == 1:
             if _is_abi_v2(self.abi):
                 return AbiParserV2(self.abi).parse()
@@ -773,6 +777,7 @@ class Contract:
         address: AddressRepresentation,
         provider: Union[BaseAccount, Client] = None,  # pyright: ignore
         proxy_config: Union[bool, ProxyConfig] = False,
+        class_store: Optional[ClassStore] = None,
     ) -> Contract:
         """
         Fetches ABI for given contract and creates a new Contract instance with it. If you know ABI statically you
@@ -792,6 +797,8 @@ class Contract:
 
             If a valid :class:`starknet_py.contract_abi_resolver.ProxyConfig` is provided, will use its values instead.
 
+        :param class_store: Optional :class:`starknet_py.class_store.ClassStore` consulted before fetching
+            the contract's class. Fetched classes are saved in it.
         :return: an initialized Contract instance.
         """
         client, account = _unpack_provider(provider)
@@ -800,7 +807,10 @@ class Contract:
         proxy_config = Contract._create_proxy_config(proxy_config)
 
         abi, cairo_version = await ContractAbiResolver(
-            address=address, client=client, proxy_config=proxy_config
+            address=address,
+            client=client,
+            proxy_config=proxy_config,
+            class_store=class_store,
         ).resolve()
 
         return Contract(
@@ -857,6 +867,7 @@ class Contract:
         nonce: Optional[int] = None,
         max_fee: Optional[int] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareResult:
         # pylint: disable=too-many-arguments
         """
@@ -869,11 +880,13 @@ class Contract:
         :param nonce: Nonce of the transaction.
         :param max_fee: Max amount of Wei to be paid when executing transaction.
         :param auto_estimate: Use automatic fee estimation (not recommended, as it may lead to high costs).
+        :param class_hash_cache: Optional cache used to compute compiled_class_hash from compiled_contract_casm
+            and the class hash of compiled_contract.
         :return: DeclareResult instance.
         """
 
         compiled_class_hash = _extract_compiled_class_hash(
-            compiled_contract_casm, compiled_class_hash
+            compiled_contract_casm, compiled_class_hash, class_hash_cache
         )
 
         declare_tx = await account.sign_declare_v2(
@@ -882,6 +895,7 @@ class Contract:
             nonce=nonce,
             max_fee=max_fee,
             auto_estimate=auto_estimate,
+            class_hash_cache=class_hash_cache,
         )
 
         return await _declare_contract(
@@ -898,6 +912,7 @@ class Contract:
         nonce: Optional[int] = None,
         l1_resource_bounds: Optional[ResourceBounds] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareResult:
         # pylint: disable=too-many-arguments
 
@@ -912,11 +927,13 @@ class Contract:
         :param l1_resource_bounds: Max amount and max price per unit of L1 gas (in Fri) used when executing
             this transaction.
         :param auto_estimate: Use automatic fee estimation (not recommended, as it may lead to high costs).
+        :param class_hash_cache: Optional cache used to compute compiled_class_hash from compiled_contract_casm
+            and the class hash of compiled_contract.
         :return: DeclareResult instance.
         """
 
         compiled_class_hash = _extract_compiled_class_hash(
-            compiled_contract_casm, compiled_class_hash
+            compiled_contract_casm, compiled_class_hash, class_hash_cache
         )
 
         declare_tx = await account.sign_declare_v3(
@@ -925,6 +942,7 @@ class Contract:
             nonce=nonce,
             l1_resource_bounds=l1_resource_bounds,
             auto_estimate=auto_estimate,
+            class_hash_cache=class_hash_cache,
         )
 
         return await _declare_contract(
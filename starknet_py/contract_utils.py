@@ -2,6 +2,7 @@ from typing import Optional, Tuple, Union
 
 from starknet_py.common import create_casm_class
 from starknet_py.hash.casm_class_hash import compute_casm_class_hash
+from starknet_py.hash.class_hash_cache import ClassHashCache
 from starknet_py.net.account.base_account import BaseAccount
 from starknet_py.net.client import Client
 
@@ -9,6 +10,7 @@ from starknet_py.net.client import Client
 def _extract_compiled_class_hash(
     compiled_contract_casm: Optional[str] = None,
     compiled_class_hash: Optional[int] = None,
+    class_hash_cache: Optional[ClassHashCache] = None,
 ) -> int:
     if compiled_class_hash is None and compiled_contract_casm is None:
         raise ValueError(
@@ -18,8 +20,10 @@ def _extract_compiled_class_hash(
 
     if compiled_class_hash is None:
         assert compiled_contract_casm is not None
-        compiled_class_hash = compute_casm_class_hash(
-            create_casm_class(compiled_contract_casm)
+        compiled_class_hash = (
+            class_hash_cache.compiled_class_hash(compiled_contract_casm)
+            if class_hash_cache is not None
+            else compute_casm_class_hash(create_casm_class(compiled_contract_casm))
         )
 
     return compiled_class_hash
@@ -1,7 +1,5 @@
 import re
-from typing import List, Optional, Union, cast
-
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, List, Optional, Union, cast
 
 from starknet_py.devnet_utils.devnet_client_models import (
     BalanceRecord,
@@ -30,13 +28,16 @@ from starknet_py.net.full_node_client import (
 from starknet_py.net.http_client import RpcHttpClient
 from starknet_py.utils.sync import add_sync_methods
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
 
 @add_sync_methods
 class DevnetClient(FullNodeClient):
     def __init__(
         self,
         node_url: str = "http://127.0.0.1:5050",
-        session: Optional[ClientSession] = None,
+        session: Optional["ClientSession"] = None,
     ):
         """
         Client for interacting with Starknet devnet json-rpc interface.
@@ -1,4 +1,7 @@
-from typing import Sequence
+import itertools
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from starknet_py.constants import CONTRACT_ADDRESS_PREFIX, L2_ADDRESS_UPPER_BOUND
 from starknet_py.hash.utils import (
@@ -7,8 +10,16 @@ from starknet_py.hash.utils import (
     compute_hash_on_elements,
     encode_uint,
     get_bytes_length,
+    pedersen_hash,
 )
 
+# Class hash, constructor calldata and salt of a contract
+AddressParams = Tuple[int, Sequence[int], int]
+
+# Number of elements hashed by compute_address: prefix, deployer, salt, class hash and calldata hash
+_ADDRESS_ELEMENTS_COUNT = 5
+_CALLDATA_HASHES_CACHE_SIZE = 4096
+
 
 def compute_address(
     *,
@@ -41,6 +52,112 @@ def compute_address(
     return raw_address % L2_ADDRESS_UPPER_BOUND
 
 
+def compute_addresses(
+    params: Iterable[AddressParams],
+    *,
+    deployer_address: int = 0,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 1000,
+) -> Iterator[int]:
+    """
+    Computes addresses of many contracts. Gives the same results as calling :func:`compute_address` for each of them,
+    but hashes the common prefix of the computation once and each distinct constructor calldata once.
+
+    :param params: Tuples of class hash, constructor calldata and salt of contracts.
+    :param deployer_address: address of the deployer (if not provided default 0 is used)
+    :param executor: Optional executor (e.g. ProcessPoolExecutor) computing chunks of addresses in parallel.
+    :param chunk_size: Number of addresses computed in a single task of the executor.
+    :return: Iterator of addresses in the same order as params.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Argument chunk_size must be greater than 0.")
+
+    if executor is None:
+        hasher = _AddressHasher(deployer_address)
+        return (hasher.compute(*param) for param in params)
+
+    params_iter = iter(params)
+    chunks = iter(lambda: list(itertools.islice(params_iter, chunk_size)), [])
+    computed_chunks = executor.map(
+        _compute_addresses_chunk, itertools.repeat(deployer_address), chunks
+    )
+    return (address for chunk in computed_chunks for address in chunk)
+
+
+def write_addresses(
+    params: Iterable[AddressParams],
+    path: Union[str, Path],
+    *,
+    deployer_address: int = 0,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 1000,
+) -> int:
+    """
+    Computes addresses of many contracts with :func:`compute_addresses` and writes them to a file as they are
+    computed, one hex address per line, in the same order as params.
+
+    :param params: Tuples of class hash, constructor calldata and salt of contracts.
+    :param path: Path to the output file.
+    :param deployer_address: address of the deployer (if not provided default 0 is used)
+    :param executor: Optional executor computing chunks of addresses in parallel.
+    :param chunk_size: Number of addresses computed in a single task of the executor.
+    :return: Number of written addresses.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for address in compute_addresses(
+            params,
+            deployer_address=deployer_address,
+            executor=executor,
+            chunk_size=chunk_size,
+        ):
+            file.write(f"{hex(address)}\n")
+            count += 1
+    return count
+
+
+class _AddressHasher:
+    """
+    Computes addresses of contracts deployed by a single deployer, reusing the hash of the common prefix
+    and hashes of recently used constructor calldata.
+    """
+
+    def __init__(self, deployer_address: int):
+        self.prefix_hash = pedersen_hash(
+            pedersen_hash(0, CONTRACT_ADDRESS_PREFIX), deployer_address
+        )
+        self.calldata_hashes: Dict[Tuple[int, ...], int] = {}
+
+    def compute(
+        self, class_hash: int, constructor_calldata: Sequence[int], salt: int
+    ) -> int:
+        raw_address = pedersen_hash(
+            pedersen_hash(
+                pedersen_hash(pedersen_hash(self.prefix_hash, salt), class_hash),
+                self._calldata_hash(constructor_calldata),
+            ),
+            _ADDRESS_ELEMENTS_COUNT,
+        )
+        return raw_address % L2_ADDRESS_UPPER_BOUND
+
+    def _calldata_hash(self, constructor_calldata: Sequence[int]) -> int:
+        key = tuple(constructor_calldata)
+        calldata_hash = self.calldata_hashes.get(key)
+        if calldata_hash is None:
+            if len(self.calldata_hashes) >= _CALLDATA_HASHES_CACHE_SIZE:
+                self.calldata_hashes.clear()
+            calldata_hash = compute_hash_on_elements(key)
+            self.calldata_hashes[key] = calldata_hash
+        return calldata_hash
+
+
+def _compute_addresses_chunk(
+    deployer_address: int, params: List[AddressParams]
+) -> List[int]:
+    hasher = _AddressHasher(deployer_address)
+    return [hasher.compute(*param) for param in params]
+
+
 def get_checksum_address(address: str) -> str:
     """
     Outputs formatted checksum address.
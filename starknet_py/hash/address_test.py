@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from starknet_py.hash.address import (
     compute_address,
+    compute_addresses,
     get_checksum_address,
     is_checksum_address,
+    write_addresses,
 )
 
 
@@ -71,3 +75,51 @@ def test_get_checksum_address_raises_on_invalid_address(address):
 )
 def test_is_checksum_address(address, is_checksum):
     assert is_checksum_address(address) == is_checksum
+
+
+ADDRESS_PARAMS = [
+    (
+        951442054899045155353616354734460058868858519055082696003992725251069061570,
+        [21, 37],
+        1111,
+    ),
+    (
+        951442054899045155353616354734460058868858519055082696003992725251069061570,
+        [21, 37],
+        1112,
+    ),
+    (0x1234, [], 0),
+    (0x1234, [21, 37], 0),
+]
+
+
+@pytest.mark.parametrize("deployer_address", [0, 1234])
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_compute_addresses(deployer_address, use_executor):
+    expected_addresses = [
+        compute_address(
+            class_hash=class_hash,
+            constructor_calldata=calldata,
+            salt=salt,
+            deployer_address=deployer_address,
+        )
+        for class_hash, calldata, salt in ADDRESS_PARAMS
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        addresses = compute_addresses(
+            iter(ADDRESS_PARAMS),
+            deployer_address=deployer_address,
+            executor=executor if use_executor else None,
+            chunk_size=3,
+        )
+        assert list(addresses) == expected_addresses
+
+
+def test_write_addresses(tmp_path):
+    path = tmp_path / "addresses.txt"
+
+    assert write_addresses(ADDRESS_PARAMS, path) == len(ADDRESS_PARAMS)
+    assert path.read_text().splitlines() == [
+        hex(address) for address in compute_addresses(ADDRESS_PARAMS)
+    ]
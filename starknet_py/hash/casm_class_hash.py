@@ -1,4 +1,6 @@
-from typing import List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from poseidon_py.poseidon_hash import poseidon_hash_many
 
@@ -10,14 +12,67 @@ from starknet_py.hash.compiled_class_hash_objects import (
     BytecodeSegmentStructure,
     NestedIntList,
 )
+from starknet_py.hash.utils import poseidon_hash_iter
 from starknet_py.net.client_models import CasmClass, CasmClassEntryPoint
 
 CASM_CLASS_VERSION = "COMPILED_CLASS_V1"
 
 
-def compute_casm_class_hash(casm_contract_class: CasmClass) -> int:
+class BytecodeSegmentHashCache:
+    """
+    Cache of hashes of bytecode segments (leaves of the bytecode segment tree), keyed by their content.
+
+    Sharing a cache between calls to :func:`compute_casm_class_hash` makes re-hashing a class after a small change
+    recompute only the segments that changed. When the cache is full, the least recently used hashes are removed.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        :param max_size: Maximal number of stored segment hashes.
+        """
+        if max_size <= 0:
+            raise ValueError("Argument max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self._hashes: "OrderedDict[Tuple[int, ...], int]" = OrderedDict()
+
+    def get(self, segment: Sequence[int]) -> Optional[int]:
+        """
+        :return: Hash of the segment or None if it is not cached.
+        """
+        key = tuple(segment)
+        segment_hash = self._hashes.get(key)
+        if segment_hash is not None:
+            self._hashes.move_to_end(key)
+        return segment_hash
+
+    def set(self, segment: Sequence[int], segment_hash: int):
+        key = tuple(segment)
+        self._hashes[key] = segment_hash
+        self._hashes.move_to_end(key)
+        if len(self._hashes) > self.max_size:
+            self._hashes.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def clear(self):
+        self._hashes.clear()
+
+
+def compute_casm_class_hash(
+    casm_contract_class: CasmClass,
+    executor: Optional[Executor] = None,
+    segment_hash_cache: Optional[BytecodeSegmentHashCache] = None,
+) -> int:
     """
     Calculate class hash of a CasmClass.
+
+    :param casm_contract_class: CasmClass to hash.
+    :param executor: Optional executor (e.g. ProcessPoolExecutor) hashing bytecode segments in parallel.
+        Used only for classes with bytecode segments.
+    :param segment_hash_cache: Optional cache of bytecode segment hashes.
+        Used only for classes with bytecode segments.
     """
     casm_class_version = encode_shortstring(CASM_CLASS_VERSION)
 
@@ -34,13 +89,19 @@ def compute_casm_class_hash(casm_contract_class: CasmClass) -> int:
     )
 
     if casm_contract_class.bytecode_segment_lengths is not None:
-        bytecode_hash = create_bytecode_segment_structure(
+        bytecode_segment_structure = create_bytecode_segment_structure(
             bytecode=casm_contract_class.bytecode,
             bytecode_segment_lengths=casm_contract_class.bytecode_segment_lengths,
             visited_pcs=None,
-        ).hash()
+        )
+        if executor is None and segment_hash_cache is None:
+            bytecode_hash = bytecode_segment_structure.hash()
+        else:
+            bytecode_hash = hash_bytecode_segment_structure(
+                bytecode_segment_structure, executor, segment_hash_cache
+            )
     else:
-        bytecode_hash = poseidon_hash_many(casm_contract_class.bytecode)
+        bytecode_hash = poseidon_hash_iter(casm_contract_class.bytecode)
 
     return poseidon_hash_many(
         [
@@ -67,6 +128,79 @@ def _entry_points_array(entry_points: List[CasmClassEntryPoint]) -> List[int]:
     return entry_points_array
 
 
+def hash_bytecode_segment_structure(
+    structure: BytecodeSegmentStructure,
+    executor: Optional[Executor] = None,
+    segment_hash_cache: Optional[BytecodeSegmentHashCache] = None,
+) -> int:
+    """
+    Computes the same value as ``structure.hash()``.
+    Leaves are independent of each other, so they are hashed first (using the executor, if provided,
+    and skipping the ones found in the cache) and then combined into hashes of nodes.
+
+    :param structure: Bytecode segment tree.
+    :param executor: Optional executor hashing leaves in parallel.
+    :param segment_hash_cache: Optional cache of leaf hashes.
+    """
+    leaves: List[BytecodeLeaf] = []
+    _collect_leaves(structure, leaves)
+
+    leaf_hashes: Dict[int, int] = {}
+    missing_leaves = []
+    for leaf in leaves:
+        cached = (
+            segment_hash_cache.get(leaf.data)
+            if segment_hash_cache is not None
+            else None
+        )
+        if cached is not None:
+            leaf_hashes[id(leaf)] = cached
+        else:
+            missing_leaves.append(leaf)
+
+    leaves_data = [leaf.data for leaf in missing_leaves]
+    computed_hashes = (
+        executor.map(poseidon_hash_iter, leaves_data)
+        if executor is not None
+        else map(poseidon_hash_iter, leaves_data)
+    )
+    for leaf, leaf_hash in zip(missing_leaves, computed_hashes):
+        leaf_hashes[id(leaf)] = leaf_hash
+        if segment_hash_cache is not None:
+            segment_hash_cache.set(leaf.data, leaf_hash)
+
+    return _combine_hashes(structure, leaf_hashes)
+
+
+def _collect_leaves(structure: BytecodeSegmentStructure, leaves: List[BytecodeLeaf]):
+    if isinstance(structure, BytecodeLeaf):
+        leaves.append(structure)
+        return
+
+    assert isinstance(structure, BytecodeSegmentedNode)
+    for segment in structure.segments:
+        _collect_leaves(segment.inner_structure, leaves)
+
+
+def _combine_hashes(
+    structure: BytecodeSegmentStructure, leaf_hashes: Dict[int, int]
+) -> int:
+    # Same as BytecodeSegmentedNode.hash with hashes of leaves computed upfront
+    if isinstance(structure, BytecodeLeaf):
+        return leaf_hashes[id(structure)]
+
+    assert isinstance(structure, BytecodeSegmentedNode)
+    values = []
+    for segment in structure.segments:
+        values.extend(
+            [
+                segment.segment_length,
+                _combine_hashes(segment.inner_structure, leaf_hashes),
+            ]
+        )
+    return poseidon_hash_iter(values) + 1
+
+
 # create_bytecode_segment_structure and _create_bytecode_segment_structure_inner are copied from
 # https://github.com/starkware-libs/cairo-lang/blob/v0.13.1/src/starkware/starknet/core/os/contract_class/compiled_class_hash.py
 
@@ -1,13 +1,20 @@
-import copy
+import functools
 import json
 import re
-from typing import List
+from typing import Any, Iterator, List
 
 from starknet_py.cairo.felt import encode_shortstring
 from starknet_py.constants import API_VERSION
-from starknet_py.hash.utils import _starknet_keccak, compute_hash_on_elements
+from starknet_py.hash.utils import (
+    _starknet_keccak_chunks,
+    compute_hash_on_elements,
+    pedersen_hash,
+)
 from starknet_py.net.client_models import DeprecatedContractClass, EntryPoint
 
+# Number of list elements serialized at once when streaming the program json
+_JSON_LIST_CHUNK_SIZE = 1024
+
 
 def compute_class_hash(contract_class: DeprecatedContractClass) -> int:
     """
@@ -32,10 +39,13 @@ def compute_class_hash(contract_class: DeprecatedContractClass) -> int:
     ]
     builtins_hash = compute_hash_on_elements(_encoded_builtins)
 
-    hinted_class_hash = _compute_hinted_class_hash(copy.deepcopy(contract_class))
+    hinted_class_hash = _compute_hinted_class_hash(contract_class)
 
-    program_data_hash = compute_hash_on_elements(
-        [int(data_, 0) for data_ in contract_class.program["data"]]
+    program_data = contract_class.program["data"]
+    # Same as compute_hash_on_elements, without materializing the converted data
+    program_data_hash = pedersen_hash(
+        functools.reduce(pedersen_hash, (int(data_, 0) for data_ in program_data), 0),
+        len(program_data),
     )
 
     return compute_hash_on_elements(
@@ -60,7 +70,13 @@ def _entry_points_array(entry_points: List[EntryPoint]) -> List[int]:
 
 
 def _compute_hinted_class_hash(contract_class: DeprecatedContractClass) -> int:
-    program = contract_class.program
+    """
+    Computes keccak of the contract class serialized the same way as by ``json.dumps``.
+
+    The json is streamed into keccak in chunks and backward compatibility changes are applied to shallow copies
+    of the affected parts of the program, so the contract class is neither copied nor modified.
+    """
+    program = dict(contract_class.program)
     program["debug_info"] = None
 
     if "attributes" in program:
@@ -72,45 +88,87 @@ def _compute_hinted_class_hash(contract_class: DeprecatedContractClass) -> int:
         program["identifiers"] = _fix_cairo_types(program["identifiers"])
 
     class_ = {"abi": contract_class.abi, "program": program}
-    serialized_contract_class = json.dumps(obj=class_)
-    return _starknet_keccak(data=serialized_contract_class.encode())
+    return _starknet_keccak_chunks(
+        chunk.encode() for chunk in _iter_json(class_, depth=3)
+    )
+
+
+def _iter_json(value: Any, depth: int) -> Iterator[str]:
+    """
+    Yields the same string as ``json.dumps(value)`` in parts.
+    Dictionaries are split into entries up to ``depth`` levels deep and lists are split into chunks of elements.
+    """
+    if isinstance(value, dict) and value and depth > 0:
+        separator = "{"
+        for key, item in value.items():
+            yield f"{separator}{json.dumps(key)}: "
+            yield from _iter_json(item, depth - 1)
+            separator = ", "
+        yield "}"
+    elif isinstance(value, list) and len(value) > _JSON_LIST_CHUNK_SIZE:
+        separator = "["
+        for start in range(0, len(value), _JSON_LIST_CHUNK_SIZE):
+            chunk = value[start : start + _JSON_LIST_CHUNK_SIZE]
+            yield separator + json.dumps(chunk)[1:-1]
+            separator = ", "
+        yield "]"
+    else:
+        yield json.dumps(value)
 
 
 def _fix_cairo_types(identifiers: dict) -> dict:
     """
     Recursively goes through identifiers looking for "cairo_type" fields.
     Pads values with a space before the colon between variable and type.
+    Returns a copy of identifiers, dictionaries which don't change are not copied.
     Example:
         (retdata_size: felt, retdata: felt*) => (retdata_size : felt, retdata : felt*)
     """
+    fixed_identifiers = None
     for name, value in identifiers.items():
         if not isinstance(value, dict):
             continue
 
+        fixed_value = _fix_cairo_types(value)
         if "cairo_type" in value:
-            value["cairo_type"] = _add_backward_compatibility_space(value["cairo_type"])
+            if fixed_value is value:
+                fixed_value = dict(value)
+            fixed_value["cairo_type"] = _add_backward_compatibility_space(
+                value["cairo_type"]
+            )
 
-        identifiers[name] = _fix_cairo_types(value)
+        if fixed_value is not value:
+            if fixed_identifiers is None:
+                fixed_identifiers = dict(identifiers)
+            fixed_identifiers[name] = fixed_value
 
-    return identifiers
+    return fixed_identifiers if fixed_identifiers is not None else identifiers
 
 
 def _add_backward_compatibility_space(cairo_type: str) -> str:
     return re.sub(r"(?<! ):", " :", cairo_type)
 
 
-def _delete_backward_compatibility_fields(program) -> dict:
+def _delete_backward_compatibility_fields(program: dict) -> dict:
+    """
+    Returns a copy of program without fields added to attributes in later versions of the compiler.
+    """
     if len(program["attributes"]) == 0:
         # Remove attributes field from raw dictionary, for hash backward compatibility of
         # contracts deployed prior to adding this feature.
-        del program["attributes"]
-        return program
+        return {key: value for key, value in program.items() if key != "attributes"}
 
     # Remove accessible_scopes and flow_tracking_data fields from raw dictionary, for hash
     # backward compatibility of contracts deployed prior to adding this feature.
-    for attr in program["attributes"]:
-        if "accessible_scopes" in attr and len(attr["accessible_scopes"]) == 0:
-            del attr["accessible_scopes"]
-        if "flow_tracking_data" in attr and attr["flow_tracking_data"] is None:
-            del attr["flow_tracking_data"]
-    return program
+    return {
+        **program,
+        "attributes": [
+            {
+                key: value
+                for key, value in attr.items()
+                if not (key == "accessible_scopes" and len(value) == 0)
+                and not (key == "flow_tracking_data" and value is None)
+            }
+            for attr in program["attributes"]
+        ],
+    }
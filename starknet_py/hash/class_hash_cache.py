@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+from starknet_py.common import (
+    create_casm_class,
+    create_compiled_contract,
+    create_sierra_compiled_contract,
+)
+from starknet_py.hash.casm_class_hash import compute_casm_class_hash
+from starknet_py.hash.class_hash import compute_class_hash
+from starknet_py.hash.sierra_class_hash import compute_sierra_class_hash
+
+Artifact = Union[str, bytes]
+
+_CLASS_HASH = "class_hash"
+_COMPILED_CLASS_HASH = "compiled_class_hash"
+
+
+class ClassHashCache:
+    """
+    Cache of class hashes and compiled class hashes of compiled contracts.
+
+    Hashes are keyed by a BLAKE2b digest of the raw contract artifact, so looking up a hash only requires
+    reading the artifact, without parsing it. The most recently used hashes are kept in memory. If ``path``
+    is provided, all hashes are also saved in a JSON file, so they survive restarts of the process.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_size: int = 1024):
+        """
+        :param path: Optional path to a JSON file storing hashes on disk. It is created if it doesn't exist.
+        :param max_size: Maximal number of hashes kept in memory.
+        """
+        if max_size <= 0:
+            raise ValueError("Argument max_size must be greater than 0.")
+
+        self.path = Path(path) if path is not None else None
+        self.max_size = max_size
+        self._memory: "OrderedDict[str, int]" = OrderedDict()
+        self._disk: Dict[str, str] = self._load()
+
+    def class_hash(self, compiled_contract: Artifact) -> int:
+        """
+        Returns class hash of a compiled contract, either Cairo 0 or Sierra.
+
+        :param compiled_contract: Content of the compiled contract file.
+        :return: Class hash of the contract.
+        """
+        return self._get_or_compute(_CLASS_HASH, compiled_contract, _compute_class_hash)
+
+    def compiled_class_hash(self, compiled_contract_casm: Artifact) -> int:
+        """
+        Returns compiled class hash of a contract compiled to casm.
+
+        :param compiled_contract_casm: Content of the .casm file.
+        :return: Compiled class hash of the contract.
+        """
+        return self._get_or_compute(
+            _COMPILED_CLASS_HASH,
+            compiled_contract_casm,
+            lambda artifact: compute_casm_class_hash(create_casm_class(artifact)),
+        )
+
+    def class_hash_from_file(self, path: Union[str, Path]) -> int:
+        """
+        Returns class hash of a compiled contract stored in a file.
+
+        :param path: Path to the compiled contract, either Cairo 0 or Sierra.
+        :return: Class hash of the contract.
+        """
+        return self.class_hash(Path(path).read_bytes())
+
+    def compiled_class_hash_from_file(self, path: Union[str, Path]) -> int:
+        """
+        Returns compiled class hash of a contract stored in a .casm file.
+
+        :param path: Path to the .casm file.
+        :return: Compiled class hash of the contract.
+        """
+        return self.compiled_class_hash(Path(path).read_bytes())
+
+    def clear(self):
+        """
+        Removes all hashes from memory and from the file.
+        """
+        self._memory.clear()
+        self._disk.clear()
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+    def _get_or_compute(
+        self, kind: str, artifact: Artifact, compute: Callable[[str], int]
+    ) -> int:
+        data = artifact.encode() if isinstance(artifact, str) else artifact
+        key = f"{kind}:{hashlib.blake2b(data, digest_size=32).hexdigest()}"
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if key in self._disk:
+            value = int(self._disk[key], 16)
+        else:
+            value = compute(data.decode())
+            if self.path is not None:
+                self._disk[key] = hex(value)
+                self._save()
+
+        self._memory[key] = value
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+        return value
+
+    def _load(self) -> Dict[str, str]:
+        if self.path is None or not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            # A damaged file only means that hashes have to be computed again
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self):
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Replace the file atomically, so that concurrent readers never see a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(self._disk, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _compute_class_hash(compiled_contract: str) -> int:
+    if "sierra_program" in json.loads(compiled_contract):
+        return compute_sierra_class_hash(
+            create_sierra_compiled_contract(compiled_contract)
+        )
+    return compute_class_hash(
+        create_compiled_contract(
+            compiled_contract
+        ).convert_to_deprecated_contract_class()
+    )
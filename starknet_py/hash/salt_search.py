@@ -0,0 +1,309 @@
+import multiprocessing
+import os
+import pickle
+import queue
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from starknet_py.hash.address import _AddressHasher
+from starknet_py.hash.utils import pedersen_hash
+
+AddressPredicate = Callable[[int], bool]
+
+# Seconds between checks of results and progress reports in the main process
+_POLL_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class AddressPattern:
+    """
+    Predicate matching addresses whose hex representation, padded with zeros to 64 characters,
+    starts and ends with given strings. Can be passed to worker processes of :func:`search_salts`.
+    """
+
+    prefix: str = ""  #: Required beginning of the address, without the 0x prefix.
+    suffix: str = ""  #: Required ending of the address.
+
+    def __post_init__(self):
+        for part in (self.prefix, self.suffix):
+            if len(part) > 64 or any(
+                char not in "0123456789abcdef" for char in part.lower()
+            ):
+                raise ValueError(f"Invalid address pattern: {part}.")
+
+    def __call__(self, address: int) -> bool:
+        hex_address = f"{address:064x}"
+        return hex_address.startswith(self.prefix.lower()) and hex_address.endswith(
+            self.suffix.lower()
+        )
+
+
+@dataclass
+class SaltSearchResult:
+    """
+    Result of :func:`search_salts`.
+    """
+
+    matches: List[Tuple[int, int]] = field(default_factory=list)
+    """Found salts and addresses of the contract deployed with them, in the order they were found."""
+
+    checked_salts: int = 0  #: Number of checked salts.
+    elapsed: float = 0.0  #: Duration of the search in seconds.
+
+    @property
+    def salts_per_second(self) -> float:
+        """
+        Number of addresses computed per second.
+        """
+        return self.checked_salts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class _SearchParams:
+    # pylint: disable=too-many-instance-attributes
+    class_hash: int
+    constructor_calldata: Tuple[int, ...]
+    deployer_address: int
+    account_address: Optional[int]
+    predicate: AddressPredicate
+    start_salt: int
+    max_salts: Optional[int]
+    batch_size: int
+    workers: int
+
+
+def search_salts(
+    predicate: AddressPredicate,
+    *,
+    class_hash: int,
+    constructor_calldata: Sequence[int] = (),
+    deployer_address: int = 0,
+    account_address: Optional[int] = None,
+    matches_count: int = 1,
+    start_salt: int = 0,
+    max_salts: Optional[int] = None,
+    processes: Optional[int] = None,
+    batch_size: int = 256,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> SaltSearchResult:
+    """
+    Searches salts with which a contract is deployed at an address matching the predicate.
+
+    Salts are checked starting from ``start_salt`` by all processes at the same time. The search stops once
+    ``matches_count`` matches are found or ``max_salts`` salts are checked. Addresses are computed the same
+    way as by :func:`starknet_py.hash.address.compute_address`.
+
+    :param predicate: Function returning True for matching addresses. Must be picklable if processes are used,
+        e.g. :class:`AddressPattern` or a module level function.
+    :param class_hash: Class hash of the contract.
+    :param constructor_calldata: Constructor calldata of the contract.
+    :param deployer_address: Address of the deployer (0 if not deployed from a contract).
+    :param account_address: If provided, salts are hashed with this address before computing the address,
+        as done by the UDC for unique deployments.
+    :param matches_count: Number of matches to find.
+    :param start_salt: First checked salt.
+    :param max_salts: Maximal number of checked salts. If None, the search continues until enough matches are found.
+    :param processes: Number of processes. Defaults to the number of CPUs. With 1, the search runs in
+        the current process.
+    :param batch_size: Number of salts checked by a process before it checks the stop signal.
+    :param progress: Optional function periodically called with the number of checked salts and salts per second.
+    :return: SaltSearchResult with matches in the order they were found. Fewer than matches_count matches are
+        returned if max_salts was reached.
+    """
+    # pylint: disable=too-many-arguments, too-many-locals
+    if matches_count <= 0:
+        raise ValueError("Argument matches_count must be greater than 0.")
+    if batch_size <= 0:
+        raise ValueError("Argument batch_size must be greater than 0.")
+    if max_salts is not None and max_salts < 0:
+        raise ValueError("Argument max_salts must be non-negative.")
+
+    processes = processes if processes is not None else os.cpu_count() or 1
+    if processes <= 0:
+        raise ValueError("Argument processes must be greater than 0.")
+
+    params = _SearchParams(
+        class_hash=class_hash,
+        constructor_calldata=tuple(constructor_calldata),
+        deployer_address=deployer_address,
+        account_address=account_address,
+        predicate=predicate,
+        start_salt=start_salt,
+        max_salts=max_salts,
+        batch_size=batch_size,
+        workers=processes,
+    )
+    if processes == 1:
+        return _search_in_process(params, matches_count, progress)
+    return _search_in_processes(params, matches_count, progress)
+
+
+def _worker_batches(params: _SearchParams, worker: int):
+    """
+    Yields ranges of salts checked by a worker. Batches are interleaved between workers,
+    so that all workers check salts close to start_salt first.
+    """
+    end = params.start_salt + params.max_salts if params.max_salts is not None else None
+    batch_start = params.start_salt + worker * params.batch_size
+    while end is None or batch_start < end:
+        batch_end = batch_start + params.batch_size
+        yield range(batch_start, batch_end if end is None else min(batch_end, end))
+        batch_start += params.workers * params.batch_size
+
+
+def _check_batch(
+    params: _SearchParams, hasher: _AddressHasher, salts: range
+) -> List[Tuple[int, int]]:
+    matches = []
+    for salt in salts:
+        deployment_salt = (
+            pedersen_hash(params.account_address, salt)
+            if params.account_address is not None
+            else salt
+        )
+        address = hasher.compute(
+            params.class_hash, params.constructor_calldata, deployment_salt
+        )
+        if params.predicate(address):
+            matches.append((salt, address))
+    return matches
+
+
+def _search_in_process(
+    params: _SearchParams,
+    matches_count: int,
+    progress: Optional[Callable[[int, float], None]],
+) -> SaltSearchResult:
+    hasher = _AddressHasher(params.deployer_address)
+    result = SaltSearchResult()
+    started_at = last_report = time.monotonic()
+
+    for salts in _worker_batches(params, worker=0):
+        result.matches.extend(_check_batch(params, hasher, salts))
+        result.checked_salts += len(salts)
+        if len(result.matches) >= matches_count:
+            break
+
+        now = time.monotonic()
+        if progress is not None and now - last_report >= _POLL_INTERVAL:
+            progress(result.checked_salts, result.checked_salts / (now - started_at))
+            last_report = now
+
+    result.matches = result.matches[:matches_count]
+    result.elapsed = time.monotonic() - started_at
+    return result
+
+
+@dataclass(frozen=True)
+class _WorkerError:
+    # Exception raised in a worker, re-raised in the main process
+    error: BaseException
+
+
+def _search_worker(
+    params: _SearchParams,
+    worker: int,
+    stop,
+    checked_salts,
+    matches_queue: "multiprocessing.Queue",
+):
+    # pylint: disable=broad-exception-caught
+    try:
+        hasher = _AddressHasher(params.deployer_address)
+        for salts in _worker_batches(params, worker):
+            if stop.is_set():
+                break
+
+            for match in _check_batch(params, hasher, salts):
+                matches_queue.put(match)
+            with checked_salts.get_lock():
+                checked_salts.value += len(salts)
+    except Exception as exception:
+        matches_queue.put(_WorkerError(_picklable_error(exception)))
+    finally:
+        # Marks the end of work of this worker
+        matches_queue.put(None)
+
+
+def _picklable_error(exception: Exception) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:  # pylint: disable=broad-exception-caught
+        return RuntimeError(
+            "Salt search worker failed:\n"
+            + "".join(
+                traceback.format_exception(
+                    type(exception), exception, exception.__traceback__
+                )
+            )
+        )
+
+
+def _search_in_processes(
+    params: _SearchParams,
+    matches_count: int,
+    progress: Optional[Callable[[int, float], None]],
+) -> SaltSearchResult:
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    checked_salts = context.Value("Q", 0)
+    matches_queue = context.Queue()
+    workers = [
+        context.Process(
+            target=_search_worker,
+            args=(params, worker, stop, checked_salts, matches_queue),
+            daemon=True,
+        )
+        for worker in range(params.workers)
+    ]
+
+    result = SaltSearchResult()
+    started_at = time.monotonic()
+    for process in workers:
+        process.start()
+
+    try:
+        running_workers = len(workers)
+        while running_workers > 0 and len(result.matches) < matches_count:
+            try:
+                match = matches_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                _check_workers(workers)
+                if progress is not None:
+                    checked = checked_salts.value
+                    progress(checked, checked / (time.monotonic() - started_at))
+                continue
+
+            if match is None:
+                running_workers -= 1
+            elif isinstance(match, _WorkerError):
+                raise match.error
+            else:
+                result.matches.append(match)
+    finally:
+        stop.set()
+        # Workers block on a full queue until it is read, so it is drained while they finish
+        while any(process.is_alive() for process in workers):
+            try:
+                matches_queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        for process in workers:
+            process.join()
+
+    result.matches = result.matches[:matches_count]
+    result.checked_salts = checked_salts.value
+    result.elapsed = time.monotonic() - started_at
+    return result
+
+
+def _check_workers(workers: List[multiprocessing.process.BaseProcess]):
+    # Workers killed without reaching their end marker, e.g. by a signal, would stop the search forever
+    for process in workers:
+        if process.exitcode is not None and process.exitcode != 0:
+            raise RuntimeError(
+                f"Salt search worker exited unexpectedly with code {process.exitcode}."
+            )
@@ -0,0 +1,89 @@
+import pytest
+
+from starknet_py.hash.address import compute_address
+from starknet_py.hash.salt_search import AddressPattern, search_salts
+
+CLASS_HASH = 0x1234
+CALLDATA = [21, 37]
+
+
+class _UnpicklableError(Exception):
+    def __init__(self, address: int, reason: str):
+        super().__init__(f"{reason}: {address}")
+
+
+def _unpicklable_failing_predicate(address: int) -> bool:
+    raise _UnpicklableError(address, "Cannot check address")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_search_salts(processes):
+    pattern = AddressPattern(prefix="0", suffix="a")
+
+    result = search_salts(
+        pattern,
+        class_hash=CLASS_HASH,
+        constructor_calldata=CALLDATA,
+        deployer_address=1234,
+        matches_count=2,
+        processes=processes,
+        batch_size=16,
+    )
+
+    assert len(result.matches) == 2
+    assert result.checked_salts >= max(salt for salt, _ in result.matches)
+    for salt, address in result.matches:
+        assert pattern(address)
+        assert address == compute_address(
+            class_hash=CLASS_HASH,
+            constructor_calldata=CALLDATA,
+            salt=salt,
+            deployer_address=1234,
+        )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_search_salts_stops_after_max_salts(processes):
+    result = search_salts(
+        # Addresses are lower than 2**251, so they never start with "f"
+        AddressPattern(prefix="f"),
+        class_hash=CLASS_HASH,
+        start_salt=10,
+        max_salts=50,
+        processes=processes,
+        batch_size=8,
+    )
+
+    assert result.matches == []
+    assert result.checked_salts == 50
+
+
+def test_search_salts_with_account_address():
+    result = search_salts(
+        AddressPattern(suffix="0"),
+        class_hash=CLASS_HASH,
+        account_address=0x789,
+        processes=1,
+    )
+
+    [(salt, address)] = result.matches
+    assert address % 16 == 0
+    assert salt <= result.checked_salts
+
+
+def test_search_salts_reraises_unpicklable_worker_error():
+    with pytest.raises(RuntimeError, match="Salt search worker failed") as exc_info:
+        search_salts(
+            _unpicklable_failing_predicate,
+            class_hash=CLASS_HASH,
+            max_salts=1000,
+            processes=2,
+        )
+
+    assert "_UnpicklableError: Cannot check address" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("prefix", ["0x12", "g", "1" * 65])
+def test_invalid_address_pattern(prefix):
+    with pytest.raises(ValueError, match="Invalid address pattern"):
+        AddressPattern(prefix=prefix)
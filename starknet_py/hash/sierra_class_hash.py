@@ -3,7 +3,7 @@ from typing import List, Union
 from poseidon_py.poseidon_hash import poseidon_hash_many
 
 from starknet_py.cairo.felt import encode_shortstring
-from starknet_py.hash.utils import _starknet_keccak
+from starknet_py.hash.utils import _starknet_keccak, poseidon_hash_iter
 from starknet_py.net.client_models import (
     SierraCompiledContract,
     SierraContractClass,
@@ -37,7 +37,7 @@ def compute_sierra_class_hash(
     assert sierra_contract_class.abi is not None
     abi_hash = _starknet_keccak(bytes(sierra_contract_class.abi, "utf-8"))
 
-    sierra_program_hash = poseidon_hash_many(sierra_contract_class.sierra_program)
+    sierra_program_hash = poseidon_hash_iter(sierra_contract_class.sierra_program)
 
     return poseidon_hash_many(
         [
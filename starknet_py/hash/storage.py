@@ -1,4 +1,4 @@
-from functools import reduce
+from functools import lru_cache, reduce
 
 from starknet_py.constants import ADDR_BOUND
 from starknet_py.hash.utils import _starknet_keccak, pedersen_hash
@@ -8,5 +8,11 @@ def get_storage_var_address(var_name: str, *args: int) -> int:
     """
     Returns the storage address of a Starknet storage variable given its name and arguments.
     """
-    res = _starknet_keccak(var_name.encode("ascii"))
+    res = _get_storage_var_name_hash(var_name)
     return reduce(pedersen_hash, args, res) % ADDR_BOUND
+
+
+@lru_cache(maxsize=1024)
+def _get_storage_var_name_hash(var_name: str) -> int:
+    # Addresses of a mapping share the hash of its name, so it is computed once per name
+    return _starknet_keccak(var_name.encode("ascii"))
@@ -1,33 +1,51 @@
 import functools
-from typing import List, Optional, Sequence
+import itertools
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from Crypto.Hash import keccak
-from crypto_cpp_py.cpp_bindings import (
-    ECSignature,
-    cpp_get_public_key,
-    cpp_hash,
-    cpp_sign,
-    cpp_verify,
-)
+from poseidon_py.c_bindings import hades_permutation
 
 from starknet_py.common import int_from_bytes
 from starknet_py.constants import EC_ORDER
 
+# crypto_cpp_py (importing sympy) and pycryptodome take most of the import time of the library,
+# so they are imported on first use. Later imports only look the modules up in sys.modules.
+# pylint: disable=import-outside-toplevel
+
 MASK_250 = 2**250 - 1
 HEX_PREFIX = "0x"
 
+# A type for the digital signature.
+ECSignature = Tuple[int, int]
+
+
+def _keccak():
+    from Crypto.Hash import keccak
+
+    return keccak.new(digest_bits=256)
+
 
 def _starknet_keccak(data: bytes) -> int:
     """
     A variant of eth-keccak that computes a value that fits in a Starknet field element.
     """
-    k = keccak.new(digest_bits=256)
+    k = _keccak()
     k.update(data)
     return int_from_bytes(k.digest()) & MASK_250
 
 
+def _starknet_keccak_chunks(chunks: Iterable[bytes]) -> int:
+    """
+    Same as _starknet_keccak, but consumes data in chunks, so that it doesn't have to be kept in memory at once.
+    """
+    k = _keccak()
+    for chunk in chunks:
+        k.update(chunk)
+    return int_from_bytes(k.digest()) & MASK_250
+
+
 def keccak256(data: bytes) -> int:
-    k = keccak.new(digest_bits=256)
+    k = _keccak()
     k.update(data)
     return int_from_bytes(k.digest())
 
@@ -36,6 +54,8 @@ def pedersen_hash(left: int, right: int) -> int:
     """
     One of two hash functions (along with _starknet_keccak) used throughout Starknet.
     """
+    from crypto_cpp_py.cpp_bindings import cpp_hash
+
     return cpp_hash(left, right)
 
 
@@ -48,7 +68,25 @@ def compute_hash_on_elements(data: Sequence) -> int:
     The length is appended in order to avoid collisions of the following kind:
     H([x,y,z]) = h(h(x,y),z) = H([w, z]) where w = h(x,y).
     """
-    return functools.reduce(pedersen_hash, [*data, len(data)], 0)
+    return pedersen_hash(functools.reduce(pedersen_hash, data, 0), len(data))
+
+
+def poseidon_hash_iter(data: Iterable[int]) -> int:
+    """
+    Computes the same value as poseidon_hash_many, but consumes elements one by one,
+    without copying and padding the whole input.
+    """
+    state = [0, 0, 0]
+    elements = iter(data)
+    for first in elements:
+        second = next(elements, None)
+        if second is None:
+            # Odd number of elements, pad the last block with 1
+            return hades_permutation([state[0] + first, state[1] + 1, state[2]])[0]
+        state = hades_permutation([state[0] + first, state[1] + second, state[2]])
+
+    # Even number of elements, pad with a block of 1 and 0
+    return hades_permutation([state[0] + 1, state[1], state[2]])[0]
 
 
 def message_signature(
@@ -57,6 +95,8 @@ def message_signature(
     """
     Signs the message with private key.
     """
+    from crypto_cpp_py.cpp_bindings import cpp_sign
+
     return cpp_sign(msg_hash, priv_key, seed)
 
 
@@ -67,15 +107,103 @@ def verify_message_signature(
     Verifies ECDSA signature of a given message hash with a given public key.
     Returns true if public_key signs the message.
     """
+    from crypto_cpp_py.cpp_bindings import cpp_verify
+
     sig_r, sig_s = signature
     sig_w = pow(sig_s, -1, EC_ORDER)
     return cpp_verify(msg_hash=msg_hash, r=sig_r, w=sig_w, stark_key=public_key)
 
 
+# Message hash, signature and public key
+SignedMessage = Tuple[int, Sequence[int], int]
+
+
+def verify_many(
+    messages: Iterable[SignedMessage],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+) -> List[bool]:
+    """
+    Verifies ECDSA signatures of many message hashes. Gives the same results as calling
+    verify_message_signature for each message, but inverts all ``s`` values of a chunk at once
+    and verifies each distinct (message hash, signature, public key) only once.
+
+    :param messages: Tuples of message hash, signature and public key.
+    :param executor: Optional executor (e.g. ProcessPoolExecutor) verifying chunks of messages in parallel.
+    :param chunk_size: Number of messages verified in a single task of the executor.
+    :return: List of verification results in the same order as messages. Malformed signatures
+        (not consisting of two values or with ``s`` not invertible) are reported as invalid.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Argument chunk_size must be greater than 0.")
+
+    unique_messages: Dict[Tuple[int, Tuple[int, ...], int], int] = {}
+    indices = [
+        unique_messages.setdefault(
+            (msg_hash, tuple(signature), public_key), len(unique_messages)
+        )
+        for msg_hash, signature, public_key in messages
+    ]
+
+    unique_list = list(unique_messages)
+    chunks = [
+        unique_list[start : start + chunk_size]
+        for start in range(0, len(unique_list), chunk_size)
+    ]
+    chunk_results = (
+        executor.map(_verify_chunk, chunks)
+        if executor is not None
+        else map(_verify_chunk, chunks)
+    )
+    results = list(itertools.chain.from_iterable(chunk_results))
+    return [results[index] for index in indices]
+
+
+def _verify_chunk(messages: List[Tuple[int, Tuple[int, ...], int]]) -> List[bool]:
+    from crypto_cpp_py.cpp_bindings import cpp_verify
+
+    results = [False] * len(messages)
+    valid = [
+        index
+        for index, (_, signature, _) in enumerate(messages)
+        if len(signature) == 2 and signature[1] % EC_ORDER != 0
+    ]
+    inverses = _batch_inverse([messages[index][1][1] for index in valid], EC_ORDER)
+
+    for index, sig_w in zip(valid, inverses):
+        msg_hash, (sig_r, _), public_key = messages[index]
+        results[index] = cpp_verify(
+            msg_hash=msg_hash, r=sig_r, w=sig_w, stark_key=public_key
+        )
+    return results
+
+
+def _batch_inverse(values: List[int], modulus: int) -> List[int]:
+    """
+    Inverts all values modulo a prime with a single modular inversion (Montgomery's trick).
+    All values must be non-zero modulo ``modulus``.
+    """
+    if not values:
+        return []
+
+    # prefix_products[i] is the product of values[:i + 1]
+    prefix_products = list(itertools.accumulate(values, lambda a, b: a * b % modulus))
+    inverse = pow(prefix_products[-1], -1, modulus)
+
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = inverse * prefix_products[i - 1] % modulus
+        inverse = inverse * values[i] % modulus
+    inverses[0] = inverse
+    return inverses
+
+
 def private_to_stark_key(priv_key: int) -> int:
     """
     Deduces the public key given a private key.
     """
+    from crypto_cpp_py.cpp_bindings import cpp_get_public_key
+
     return cpp_get_public_key(priv_key)
 
 
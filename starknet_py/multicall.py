@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from starknet_py.contract import PreparedFunctionCall
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client import Client
+from starknet_py.net.client_models import Call, Hash, Tag
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import AddressRepresentation, parse_address
+from starknet_py.serialization import TupleDataclass
+from starknet_py.utils.sync import add_sync_methods
+
+
+@add_sync_methods
+class MulticallClient:
+    """
+    Client performing many read-only contract calls with as few requests as possible.
+
+    If ``aggregator_address`` is provided, calls are packed into ``aggregate`` calls of a multicall
+    contract deployed on the network. Such a contract takes a list of calls, each encoded as
+    ``[to, selector, calldata_len, *calldata]``, and returns ``[block_number, header, *results]``,
+    where every result is prefixed with its length. The ``header`` is the number of results for Cairo 1
+    aggregators and the total length of results for Cairo 0 aggregators.
+
+    Otherwise, calls are sent as JSON-RPC batch requests (when used with :class:`FullNodeClient`)
+    or concurrently one by one.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        aggregator_address: Optional[AddressRepresentation] = None,
+        *,
+        aggregator_cairo_version: int = 1,
+        aggregate_function_name: str = "aggregate",
+        batch_size: int = 100,
+        max_concurrent_requests: int = 10,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param client: Client used to perform calls.
+        :param aggregator_address: Address of the multicall contract. If not provided, JSON-RPC batching is used.
+        :param aggregator_cairo_version: Cairo version of the multicall contract.
+        :param aggregate_function_name: Name of the multicall contract's function aggregating calls.
+        :param batch_size: Maximal number of calls packed into a single request.
+        :param max_concurrent_requests: Maximal number of requests sent at the same time.
+        """
+        if batch_size <= 0:
+            raise ValueError("Argument batch_size must be greater than 0.")
+        if max_concurrent_requests <= 0:
+            raise ValueError("Argument max_concurrent_requests must be greater than 0.")
+        if aggregator_cairo_version not in (0, 1):
+            raise ValueError("Argument aggregator_cairo_version must be 0 or 1.")
+
+        self.client = client
+        self.aggregator_address = (
+            parse_address(aggregator_address)
+            if aggregator_address is not None
+            else None
+        )
+        self.aggregator_cairo_version = aggregator_cairo_version
+        self.aggregate_selector = get_selector_from_name(aggregate_function_name)
+        self.batch_size = batch_size
+        self.max_concurrent_requests = max_concurrent_requests
+
+    async def call_raw(
+        self,
+        calls: Iterable[Call],
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[List[int]]:
+        """
+        Performs calls without translating the results into python values.
+
+        :param calls: Calls to perform.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+            It is advised to provide a block, so that all batches read the same state.
+        :return: List of call results, in the same order as calls.
+        """
+        calls = list(calls)
+        batches = [
+            calls[start : start + self.batch_size]
+            for start in range(0, len(calls), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def _call_batch(batch: List[Call]) -> List[List[int]]:
+            async with semaphore:
+                return await self._call_batch(batch, block_hash, block_number)
+
+        results = await asyncio.gather(*(_call_batch(batch) for batch in batches))
+        return [result for batch_results in results for result in batch_results]
+
+    async def call(
+        self,
+        calls: Iterable[Call],
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[Union[TupleDataclass, List[int]]]:
+        """
+        Performs calls. Results of :class:`~starknet_py.contract.PreparedFunctionCall` are translated
+        into python values, results of other calls are returned as lists of ints.
+
+        :param calls: Calls to perform.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+            It is advised to provide a block, so that all batches read the same state.
+        :return: List of call results, in the same order as calls.
+        """
+        calls = list(calls)
+        raw_results = await self.call_raw(
+            calls, block_hash=block_hash, block_number=block_number
+        )
+        # pylint: disable=protected-access
+        return [
+            (
+                call._payload_transformer.deserialize(result)
+                if isinstance(call, PreparedFunctionCall)
+                else result
+            )
+            for call, result in zip(calls, raw_results)
+        ]
+
+    async def _call_batch(
+        self,
+        calls: List[Call],
+        block_hash: Optional[Union[Hash, Tag]],
+        block_number: Optional[Union[int, Tag]],
+    ) -> List[List[int]]:
+        if self.aggregator_address is not None:
+            result = await self.client.call_contract(
+                Call(
+                    to_addr=self.aggregator_address,
+                    selector=self.aggregate_selector,
+                    calldata=self._encode_aggregate_calldata(calls),
+                ),
+                block_hash=block_hash,
+                block_number=block_number,
+            )
+            return _split_aggregate_result(result, len(calls))
+
+        if isinstance(self.client, FullNodeClient):
+            return await self.client.call_contract_batch(
+                calls, block_hash=block_hash, block_number=block_number
+            )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.client.call_contract(
+                        call, block_hash=block_hash, block_number=block_number
+                    )
+                    for call in calls
+                )
+            )
+        )
+
+    def _encode_aggregate_calldata(self, calls: Sequence[Call]) -> List[int]:
+        encoded_calls = []
+        for call in calls:
+            encoded_calls.extend(
+                [call.to_addr, call.selector, len(call.calldata), *call.calldata]
+            )
+
+        # Cairo 1 arrays are prefixed with the number of elements,
+        # Cairo 0 aggregator takes calls flattened to a felt array
+        size = len(calls) if self.aggregator_cairo_version == 1 else len(encoded_calls)
+        return [size, *encoded_calls]
+
+
+def _split_aggregate_result(result: List[int], calls_count: int) -> List[List[int]]:
+    # Skip block number and header
+    position = 2
+    results = []
+    for _ in range(calls_count):
+        start, end = _result_bounds(result, position)
+        results.append(result[start:end])
+        position = end
+
+    if position != len(result):
+        raise ValueError(
+            f"Unexpected aggregator response: {len(result) - position} values were not used."
+        )
+    return results
+
+
+def _result_bounds(result: List[int], position: int) -> Tuple[int, int]:
+    if position >= len(result) or position + 1 + result[position] > len(result):
+        raise ValueError(
+            "Unexpected aggregator response: not enough values for all calls."
+        )
+    return position + 1, position + 1 + result[position]
@@ -6,6 +6,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from starknet_py.common import create_compiled_contract, create_sierra_compiled_contract
 from starknet_py.constants import FEE_CONTRACT_ADDRESS, QUERY_VERSION_BASE
 from starknet_py.hash.address import compute_address
+from starknet_py.hash.class_hash_cache import ClassHashCache
 from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.hash.utils import verify_message_signature
 from starknet_py.net.account.account_deployment_result import AccountDeploymentResult
@@ -22,6 +23,7 @@ from starknet_py.net.client_models import (
     SierraContractClass,
     Tag,
 )
+from starknet_py.net.fee_estimator import FeeEstimator
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.models import AddressRepresentation, parse_address
 from starknet_py.net.models.chains import RECOGNIZED_CHAIN_IDS, Chain, parse_chain
@@ -74,7 +76,9 @@ class Account(BaseAccount):
         signer: Optional[BaseSigner] = None,
         key_pair: Optional[KeyPair] = None,
         chain: Optional[Chain] = None,
+        fee_estimator: Optional[FeeEstimator] = None,
     ):
+        # pylint: disable=too-many-arguments
         """
         :param address: Address of the account contract.
         :param client: Instance of Client which will be used to add transactions.
@@ -89,6 +93,8 @@ class Account(BaseAccount):
             - a string name (e.g. 'SN_SEPOLIA')
             - a hexadecimal value (e.g. '0x1')
             - an integer (e.g. 1)
+        :param fee_estimator: Optional FeeEstimator used when ``auto_estimate`` is requested,
+            so that a recent estimate of a transaction of the same shape can be reused.
         """
         self._address = parse_address(address)
         self._client = client
@@ -110,6 +116,7 @@ class Account(BaseAccount):
                 account_address=self.address, key_pair=key_pair, chain_id=self._chain_id
             )
         self.signer: BaseSigner = signer
+        self.fee_estimator = fee_estimator
 
     @property
     def address(self) -> int:
@@ -143,8 +150,7 @@ class Account(BaseAccount):
             )
 
         if auto_estimate:
-            estimated_fee = await self.estimate_fee(transaction)
-            assert isinstance(estimated_fee, EstimatedFee)
+            estimated_fee = await self._auto_estimate_fee(transaction)
 
             max_fee = int(estimated_fee.overall_fee * Account.ESTIMATED_FEE_MULTIPLIER)
 
@@ -167,8 +173,7 @@ class Account(BaseAccount):
             )
 
         if auto_estimate:
-            estimated_fee = await self.estimate_fee(transaction)
-            assert isinstance(estimated_fee, EstimatedFee)
+            estimated_fee = await self._auto_estimate_fee(transaction)
 
             return estimated_fee.to_resource_bounds(
                 Account.ESTIMATED_AMOUNT_MULTIPLIER,
@@ -253,6 +258,16 @@ class Account(BaseAccount):
         )
         return _add_resource_bounds_to_transaction(transaction, resource_bounds)
 
+    async def _auto_estimate_fee(self, transaction: AccountTransaction) -> EstimatedFee:
+        if self.fee_estimator is not None:
+            return await self.fee_estimator.estimate_fee(
+                transaction, sign=self.sign_for_fee_estimate
+            )
+
+        estimated_fee = await self.estimate_fee(transaction)
+        assert isinstance(estimated_fee, EstimatedFee)
+        return estimated_fee
+
     async def estimate_fee(
         self,
         tx: Union[AccountTransaction, List[AccountTransaction]],
@@ -403,9 +418,14 @@ class Account(BaseAccount):
         nonce: Optional[int] = None,
         max_fee: Optional[int] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV2:
+        # pylint: disable=too-many-arguments
         declare_tx = await self._make_declare_v2_transaction(
-            compiled_contract, compiled_class_hash, nonce=nonce
+            compiled_contract,
+            compiled_class_hash,
+            nonce=nonce,
+            class_hash_cache=class_hash_cache,
         )
         max_fee = await self._get_max_fee(
             transaction=declare_tx, max_fee=max_fee, auto_estimate=auto_estimate
@@ -422,11 +442,14 @@ class Account(BaseAccount):
         nonce: Optional[int] = None,
         l1_resource_bounds: Optional[ResourceBounds] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV3:
+        # pylint: disable=too-many-arguments
         declare_tx = await self._make_declare_v3_transaction(
             compiled_contract,
             compiled_class_hash,
             nonce=nonce,
+            class_hash_cache=class_hash_cache,
         )
         resource_bounds = await self._get_resource_bounds(
             declare_tx, l1_resource_bounds, auto_estimate
@@ -460,10 +483,16 @@ class Account(BaseAccount):
         compiled_class_hash: int,
         *,
         nonce: Optional[int] = None,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV2:
         contract_class = create_sierra_compiled_contract(
             compiled_contract=compiled_contract
         )
+        class_hash = (
+            class_hash_cache.class_hash(compiled_contract)
+            if class_hash_cache is not None
+            else None
+        )
 
         if nonce is None:
             nonce = await self.get_nonce()
@@ -471,6 +500,7 @@ class Account(BaseAccount):
         declare_tx = DeclareV2(
             contract_class=contract_class.convert_to_sierra_contract_class(),
             compiled_class_hash=compiled_class_hash,
+            class_hash=class_hash,
             sender_address=self.address,
             max_fee=0,
             signature=[],
@@ -485,10 +515,16 @@ class Account(BaseAccount):
         compiled_class_hash: int,
         *,
         nonce: Optional[int] = None,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV3:
         contract_class = create_sierra_compiled_contract(
             compiled_contract=compiled_contract
         )
+        class_hash = (
+            class_hash_cache.class_hash(compiled_contract)
+            if class_hash_cache is not None
+            else None
+        )
 
         if nonce is None:
             nonce = await self.get_nonce()
@@ -496,6 +532,7 @@ class Account(BaseAccount):
         declare_tx = DeclareV3(
             contract_class=contract_class.convert_to_sierra_contract_class(),
             compiled_class_hash=compiled_class_hash,
+            class_hash=class_hash,
             sender_address=self.address,
             signature=[],
             nonce=nonce,
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Union
 
+from starknet_py.hash.class_hash_cache import ClassHashCache
 from starknet_py.net.client import Client
 from starknet_py.net.client_models import (
     Calls,
@@ -192,7 +193,9 @@ class BaseAccount(ABC):
         nonce: Optional[int] = None,
         max_fee: Optional[int] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV2:
+        # pylint: disable=too-many-arguments
         """
         Create and sign declare transaction version 2 using sierra contract.
 
@@ -203,6 +206,7 @@ class BaseAccount(ABC):
         :param nonce: Nonce of the transaction.
         :param max_fee: Max amount of Wei to be paid when executing transaction.
         :param auto_estimate: Use automatic fee estimation, not recommend as it may lead to high costs.
+        :param class_hash_cache: Optional cache used to compute the class hash of compiled_contract.
         :return: Signed DeclareV2 transaction.
         """
 
@@ -215,7 +219,9 @@ class BaseAccount(ABC):
         nonce: Optional[int] = None,
         l1_resource_bounds: Optional[ResourceBounds] = None,
         auto_estimate: bool = False,
+        class_hash_cache: Optional[ClassHashCache] = None,
     ) -> DeclareV3:
+        # pylint: disable=too-many-arguments
         """
         Create and sign declare transaction version 3 using sierra contract.
 
@@ -226,6 +232,7 @@ class BaseAccount(ABC):
         :param nonce: Nonce of the transaction.
         :param l1_resource_bounds: Max amount and max price per unit of L1 gas used in this transaction.
         :param auto_estimate: Use automatic fee estimation, not recommend as it may lead to high costs.
+        :param class_hash_cache: Optional cache used to compute the class hash of compiled_contract.
         :return: Signed DeclareV3 transaction.
         """
 
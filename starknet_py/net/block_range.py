@@ -0,0 +1,67 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Literal, Tuple
+
+from marshmallow import Schema
+
+from starknet_py.net.schemas.rpc.block import (
+    BlockStateUpdateSchema,
+    StarknetBlockSchema,
+    StarknetBlockWithReceiptsSchema,
+    StarknetBlockWithTxHashesSchema,
+)
+from starknet_py.net.schemas.rpc.trace_api import BlockTransactionTraceSchema
+
+BlockKind = Literal["receipts", "tx_hashes", "txs", "state_update", "traces"]
+
+# JSON-RPC method and schema of the result for every kind of fetched blocks
+_BLOCK_KINDS: Dict[str, Tuple[str, Schema]] = {
+    "receipts": ("getBlockWithReceipts", StarknetBlockWithReceiptsSchema()),
+    "tx_hashes": ("getBlockWithTxHashes", StarknetBlockWithTxHashesSchema()),
+    "txs": ("getBlockWithTxs", StarknetBlockSchema()),
+    "state_update": ("getStateUpdate", BlockStateUpdateSchema()),
+    "traces": ("traceBlockTransactions", BlockTransactionTraceSchema(many=True)),
+}
+
+
+@dataclass
+class BlockRangeStats:
+    """
+    Throughput counters of :meth:`~starknet_py.net.full_node_client.FullNodeClient.iter_blocks`,
+    updated while blocks are fetched.
+    """
+
+    requests: int = 0  #: Number of sent requests.
+    blocks_fetched: int = 0  #: Number of received blocks.
+    blocks_yielded: int = 0  #: Number of blocks passed to the consumer.
+    started_at: float = field(default_factory=time.monotonic)
+    """Value of ``time.monotonic()`` when fetching started."""
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds since fetching started.
+        """
+        return time.monotonic() - self.started_at
+
+    @property
+    def blocks_per_second(self) -> float:
+        """
+        Number of blocks passed to the consumer per second.
+        """
+        elapsed = self.elapsed
+        return self.blocks_yielded / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def buffered_blocks(self) -> int:
+        """
+        Number of received blocks waiting for the consumer.
+        """
+        return self.blocks_fetched - self.blocks_yielded
+
+
+def _load_block(kind: str, data: Any) -> Any:
+    """
+    Deserializes a block of the given kind received from the node.
+    """
+    return _BLOCK_KINDS[kind][1].load(data)
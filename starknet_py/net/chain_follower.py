@@ -0,0 +1,262 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, List, Optional, Union, cast
+
+from starknet_py.net.client_models import (
+    PendingStarknetBlockWithTxHashes,
+    StarknetBlockWithTxHashes,
+)
+from starknet_py.net.full_node_client import FullNodeClient
+
+
+@dataclass(frozen=True)
+class TrackedBlock:
+    """
+    Block tracked by :class:`ChainFollower`.
+    """
+
+    block_number: int
+    block_hash: int
+    parent_hash: int
+    timestamp: int
+
+
+@dataclass
+class BlockApplied:
+    """
+    Event emitted when a block is added to the followed chain.
+    """
+
+    block: StarknetBlockWithTxHashes  #: Added block with transaction hashes.
+
+
+@dataclass
+class BlockRolledBack:
+    """
+    Event emitted when a previously applied block is removed from the chain by a reorg.
+    Blocks are rolled back from the newest one.
+    """
+
+    block: TrackedBlock  #: Removed block.
+
+
+@dataclass
+class PendingTransactions:
+    """
+    Event emitted when transactions are added to the pending block.
+    """
+
+    parent_hash: int  #: Hash of the parent of the pending block.
+    transaction_hashes: List[int] = field(default_factory=list)
+    """Hashes of transactions added since the previous poll, in the order of the pending block."""
+
+
+ChainEvent = Union[BlockApplied, BlockRolledBack, PendingTransactions]
+
+
+class ReorgTooDeepError(Exception):
+    """
+    Raised when a reorg removes all blocks tracked by :class:`ChainFollower`,
+    after older blocks were already dropped from its window.
+    """
+
+
+class ChainFollower:
+    """
+    Follows the head of the chain, detecting reorgs.
+
+    The follower keeps a window of recently applied blocks. Every new block is checked against the
+    previous one by its parent hash. On mismatch, tracked blocks are rolled back until the chain
+    links up again, and blocks of the new branch are applied.
+
+    The polling interval adapts to the block time observed from block timestamps.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        client: FullNodeClient,
+        start_block_number: Optional[int] = None,
+        *,
+        window_size: int = 64,
+        follow_pending: bool = False,
+        polls_per_block: int = 4,
+        min_poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        max_blocks_per_poll: int = 100,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param client: Client used to poll the node.
+        :param start_block_number: Number of the first applied block. Defaults to the current head.
+        :param window_size: Number of tracked blocks, i.e. the deepest reorg that can be followed.
+        :param follow_pending: If True, emits transactions added to the pending block.
+        :param polls_per_block: Number of polls per observed block time.
+        :param min_poll_interval: Minimal number of seconds between polls.
+        :param max_poll_interval: Maximal number of seconds between polls.
+        :param max_blocks_per_poll: Maximal number of blocks applied in a single poll, when catching up.
+        """
+        if window_size <= 0:
+            raise ValueError("Argument window_size must be greater than 0.")
+        if polls_per_block <= 0:
+            raise ValueError("Argument polls_per_block must be greater than 0.")
+        if not 0 < min_poll_interval <= max_poll_interval:
+            raise ValueError(
+                "Arguments min_poll_interval and max_poll_interval must satisfy "
+                "0 < min_poll_interval <= max_poll_interval."
+            )
+        if max_blocks_per_poll <= 0:
+            raise ValueError("Argument max_blocks_per_poll must be greater than 0.")
+
+        self.client = client
+        self.start_block_number = start_block_number
+        self.follow_pending = follow_pending
+        self.polls_per_block = polls_per_block
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_blocks_per_poll = max_blocks_per_poll
+
+        self._window: Deque[TrackedBlock] = deque(maxlen=window_size)
+        self._dropped_blocks = False
+        self._block_time: Optional[float] = None
+        self._is_behind = False
+        self._pending_parent_hash: Optional[int] = None
+        self._pending_transactions_count = 0
+
+    @property
+    def head(self) -> Optional[TrackedBlock]:
+        """
+        The newest applied block, None before the first poll.
+        """
+        return self._window[-1] if self._window else None
+
+    @property
+    def block_time(self) -> Optional[float]:
+        """
+        Moving average of seconds between blocks, None before two consecutive blocks are applied.
+        """
+        return self._block_time
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        Seconds to wait before the next poll.
+        """
+        if self._is_behind:
+            return 0.0
+        if self._block_time is None:
+            return self.min_poll_interval
+        return min(
+            max(self._block_time / self.polls_per_block, self.min_poll_interval),
+            self.max_poll_interval,
+        )
+
+    async def poll(self) -> List[ChainEvent]:
+        """
+        Check the node once for new blocks and, if enabled, new pending transactions.
+
+        :return: List of events in the order they happened.
+        :raises ReorgTooDeepError: when a reorg is deeper than the window of tracked blocks.
+        """
+        events: List[ChainEvent] = []
+        head = await self.client.get_block_hash_and_number()
+        tip = self.head
+
+        if tip is None:
+            number = (
+                self.start_block_number
+                if self.start_block_number is not None
+                else head.block_number
+            )
+        elif head.block_hash == tip.block_hash or head.block_number < tip.block_number:
+            # A head behind the tip comes from a node lagging behind the others, it is ignored
+            number = head.block_number + 1
+        elif head.block_number == tip.block_number:
+            # Same height with a different hash, the tip was replaced
+            events.append(self._roll_back())
+            number = tip.block_number
+        else:
+            number = tip.block_number + 1
+
+        last_number = min(head.block_number, number + self.max_blocks_per_poll - 1)
+        while number <= last_number:
+            block = cast(
+                StarknetBlockWithTxHashes,
+                await self.client.get_block_with_tx_hashes(block_number=number),
+            )
+            tip = self.head
+            if tip is not None and block.parent_hash != tip.block_hash:
+                events.append(self._roll_back())
+                number = tip.block_number
+                continue
+
+            self._apply(block)
+            events.append(BlockApplied(block=block))
+            number += 1
+
+        self._is_behind = head.block_number >= number
+        if self.follow_pending and not self._is_behind:
+            pending_event = await self._poll_pending()
+            if pending_event is not None:
+                events.append(pending_event)
+        return events
+
+    async def events(self) -> AsyncIterator[ChainEvent]:
+        """
+        Follow the chain indefinitely, polling with the adaptive interval.
+
+        :return: Asynchronous iterator of events.
+        :raises ReorgTooDeepError: when a reorg is deeper than the window of tracked blocks.
+        """
+        while True:
+            for event in await self.poll():
+                yield event
+            await asyncio.sleep(self.poll_interval)
+
+    def _apply(self, block: StarknetBlockWithTxHashes):
+        tip = self.head
+        if tip is not None and block.timestamp > tip.timestamp:
+            block_time = block.timestamp - tip.timestamp
+            self._block_time = (
+                block_time
+                if self._block_time is None
+                else 0.8 * self._block_time + 0.2 * block_time
+            )
+
+        self._dropped_blocks |= len(self._window) == self._window.maxlen
+        self._window.append(
+            TrackedBlock(
+                block_number=block.block_number,
+                block_hash=block.block_hash,
+                parent_hash=block.parent_hash,
+                timestamp=block.timestamp,
+            )
+        )
+
+    def _roll_back(self) -> BlockRolledBack:
+        block = self._window.pop()
+        if not self._window and self._dropped_blocks:
+            raise ReorgTooDeepError(
+                f"Reorg removed all {self._window.maxlen} tracked blocks, "
+                f"down to block {block.block_number}."
+            )
+        return BlockRolledBack(block=block)
+
+    async def _poll_pending(self) -> Optional[PendingTransactions]:
+        pending = await self.client.get_block_with_tx_hashes(block_number="pending")
+        if not isinstance(pending, PendingStarknetBlockWithTxHashes):
+            return None
+
+        if pending.parent_hash != self._pending_parent_hash:
+            self._pending_parent_hash = pending.parent_hash
+            self._pending_transactions_count = 0
+
+        new_hashes = pending.transactions[self._pending_transactions_count :]
+        self._pending_transactions_count = len(pending.transactions)
+        if not new_hashes:
+            return None
+        return PendingTransactions(
+            parent_hash=pending.parent_hash, transaction_hashes=new_hashes
+        )
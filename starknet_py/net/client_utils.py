@@ -1,10 +1,16 @@
 import re
-from typing import Dict, Union, cast
+from typing import Dict, List, Optional, Union, cast
 
 from typing_extensions import get_args
 
 from starknet_py.hash.utils import encode_uint, encode_uint_list
-from starknet_py.net.client_models import Hash, L1HandlerTransaction, Tag
+from starknet_py.net.client_models import (
+    Call,
+    Hash,
+    L1HandlerTransaction,
+    SimulationFlag,
+    Tag,
+)
 from starknet_py.net.models.transaction import AccountTransaction
 from starknet_py.net.schemas.broadcasted_txn import BroadcastedTransactionSchema
 
@@ -86,3 +92,89 @@ def _create_broadcasted_txn(transaction: AccountTransaction) -> dict:
         Dict,
         BroadcastedTransactionSchema().dump(obj=transaction),
     )
+
+
+def get_block_identifier(
+    block_hash: Optional[Union[Hash, Tag]] = None,
+    block_number: Optional[Union[int, Tag]] = None,
+) -> dict:
+    return {"block_id": _get_raw_block_identifier(block_hash, block_number)}
+
+
+def _get_raw_block_identifier(
+    block_hash: Optional[Union[Hash, Tag]] = None,
+    block_number: Optional[Union[int, Tag]] = None,
+) -> Union[dict, Hash, Tag, None]:
+    if block_hash is not None and block_number is not None:
+        raise ValueError(
+            "Arguments block_hash and block_number are mutually exclusive."
+        )
+
+    if block_hash in ("latest", "pending") or block_number in ("latest", "pending"):
+        return block_hash or block_number
+
+    if block_hash is not None:
+        return {"block_hash": _to_rpc_felt(block_hash)}
+
+    if block_number is not None:
+        return {"block_number": block_number}
+
+    return "pending"
+
+
+def _get_call_params(call: Call, block_identifier: dict) -> dict:
+    return {
+        "request": {
+            "contract_address": _to_rpc_felt(call.to_addr),
+            "entry_point_selector": _to_rpc_felt(call.selector),
+            "calldata": [_to_rpc_felt(i1) for i1 in call.calldata],
+        },
+        **block_identifier,
+    }
+
+
+def _get_storage_params(
+    contract_address: Hash, key: int, block_identifier: dict
+) -> dict:
+    return {
+        "contract_address": _to_rpc_felt(contract_address),
+        "key": _to_storage_key(key),
+        **block_identifier,
+    }
+
+
+def _get_estimate_fee_params(
+    transactions: List[AccountTransaction],
+    simulation_flags: List[SimulationFlag],
+    block_identifier: dict,
+) -> dict:
+    return {
+        "request": [_create_broadcasted_txn(transaction=tx) for tx in transactions],
+        "simulation_flags": simulation_flags,
+        **block_identifier,
+    }
+
+
+def _get_simulation_flags(
+    skip_validate: bool, skip_fee_charge: bool = False
+) -> List[SimulationFlag]:
+    simulation_flags = []
+    if skip_validate:
+        simulation_flags.append(SimulationFlag.SKIP_VALIDATE)
+    if skip_fee_charge:
+        simulation_flags.append(SimulationFlag.SKIP_FEE_CHARGE)
+    return simulation_flags
+
+
+def _get_simulate_transactions_params(
+    transactions: List[AccountTransaction],
+    simulation_flags: List[SimulationFlag],
+    block_identifier: dict,
+) -> dict:
+    return {
+        **block_identifier,
+        "simulation_flags": simulation_flags,
+        "transactions": [
+            _create_broadcasted_txn(transaction=tx) for tx in transactions
+        ],
+    }
@@ -0,0 +1,378 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from starknet_py.constants import QUERY_VERSION_BASE
+from starknet_py.net.client_models import EstimatedFee, SimulatedTransaction
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models.transaction import AccountTransaction
+
+TransactionShape = Tuple[Any, ...]
+
+
+def transaction_shape(transaction: AccountTransaction) -> TransactionShape:
+    """
+    Default shape of transactions assumed to have the same fee.
+
+    The shape consists of the transaction type and version, the sender (or the class of a deployed account),
+    the length of the calldata and its first 3 values. For invoke transactions, these are the number of calls
+    and the address and the selector of the first call.
+
+    :param transaction: Transaction, possibly signed for fee estimate.
+    :return: Shape of the transaction, a tuple of hashable values.
+    """
+    calldata = getattr(transaction, "calldata", None)
+    if calldata is None:
+        calldata = getattr(transaction, "constructor_calldata", [])
+    return (
+        type(transaction).__name__,
+        transaction.version % QUERY_VERSION_BASE,
+        getattr(transaction, "sender_address", None),
+        getattr(transaction, "class_hash", None),
+        getattr(transaction, "compiled_class_hash", None),
+        len(calldata),
+        tuple(calldata[:3]),
+    )
+
+
+@dataclass
+class FeeEstimatorStats:
+    """
+    Counters of :class:`FeeEstimator`.
+    """
+
+    hits: int = 0  #: Number of estimates served from the cache.
+    misses: int = 0  #: Number of estimates not found in the cache.
+    requests: int = 0  #: Number of sent batch requests.
+    estimated_transactions: int = 0  #: Number of transactions estimated by the node.
+    failed_estimates: int = 0  #: Number of transactions the node failed to estimate.
+    simulated_transactions: int = 0  #: Number of transactions simulated by the node.
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of estimates served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class _CachedEstimate:
+    estimated_fee: EstimatedFee
+    block_number: int
+    created_at: float
+
+
+class FeeEstimator:
+    """
+    Estimates fees of many independent transactions with batch requests and caches the estimates.
+
+    Estimates requested at about the same time are sent in a single JSON-RPC batch request,
+    each transaction estimated separately on the pending state. Estimates are cached by the shape
+    of the transaction (see :func:`transaction_shape`) and reused for ``max_age_blocks`` blocks.
+    If the node fails to estimate a transaction, e.g. because it reverts, only the estimates
+    of that transaction fail, the other transactions in the batch are not affected.
+
+    The current block number is updated with every batch request and fetched again before serving
+    a cached estimate if it is older than ``block_refresh_interval`` seconds. It can also be set with
+    :meth:`update_block_number`, e.g. on every block applied by a
+    :class:`~starknet_py.net.chain_follower.ChainFollower`.
+
+    An :class:`~starknet_py.net.account.account.Account` created with a FeeEstimator uses it
+    to estimate fees when ``auto_estimate`` is requested.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        client: FullNodeClient,
+        *,
+        max_age_blocks: int = 1,
+        max_age: Optional[float] = 60.0,
+        max_batch_size: int = 50,
+        batch_window: float = 0.0,
+        max_cache_size: int = 1024,
+        skip_validate: bool = False,
+        shape: Callable[[AccountTransaction], TransactionShape] = transaction_shape,
+        block_refresh_interval: Optional[float] = 1.0,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param client: Client used to estimate fees.
+        :param max_age_blocks: Number of blocks an estimate is reused for, 0 disables caching.
+            With the default of 1, estimates are reused only until the next block is noticed,
+            i.e. at most ``block_refresh_interval`` seconds after it is created.
+        :param max_age: Maximal age of reused estimates in seconds, regardless of the block number.
+            None to rely on the block number only.
+        :param max_batch_size: Maximal number of transactions estimated in a single request.
+        :param batch_window: Seconds to wait for more transactions before sending a request.
+        :param max_cache_size: Maximal number of cached estimates, the least recently used are removed.
+        :param skip_validate: Flag checking whether the validation part of transactions should be executed.
+        :param shape: Function returning the shape of a transaction, a tuple of hashable values.
+            Transactions of the same shape share cached estimates.
+        :param block_refresh_interval: Seconds after which the block number is fetched again before
+            serving a cached estimate. None to update it only with batch requests and
+            :meth:`update_block_number`, e.g. when it is called by a ChainFollower.
+        """
+        if max_age_blocks < 0:
+            raise ValueError(
+                "Argument max_age_blocks must be greater than or equal to 0."
+            )
+        if max_batch_size <= 0:
+            raise ValueError("Argument max_batch_size must be greater than 0.")
+
+        self.client = client
+        self.max_age_blocks = max_age_blocks
+        self.max_age = max_age
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.max_cache_size = max_cache_size
+        self.skip_validate = skip_validate
+        self.shape = shape
+        self.block_refresh_interval = block_refresh_interval
+        self.stats = FeeEstimatorStats()
+
+        self._block_number: Optional[int] = None
+        self._block_number_updated_at: Optional[float] = None
+        self._block_number_request: Optional["asyncio.Future[None]"] = None
+        self._cache: "OrderedDict[TransactionShape, _CachedEstimate]" = OrderedDict()
+        self._pending: Dict[
+            TransactionShape, Tuple[AccountTransaction, "asyncio.Future[EstimatedFee]"]
+        ] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def block_number(self) -> Optional[int]:
+        """
+        The latest known block number, None before the first request.
+        """
+        return self._block_number
+
+    def update_block_number(self, block_number: int):
+        """
+        Sets the current block number, making older estimates stale.
+
+        :param block_number: Number of the latest block.
+        """
+        self._block_number_updated_at = time.monotonic()
+        if self._block_number is None or block_number > self._block_number:
+            self._block_number = block_number
+
+    def get_cached(self, transaction: AccountTransaction) -> Optional[EstimatedFee]:
+        """
+        :param transaction: Transaction, possibly not signed.
+        :return: Cached estimate of a transaction of the same shape, fresh at the last known block number,
+            or None.
+        """
+        return self._get_cached(self.shape(transaction))
+
+    async def estimate_fee(
+        self,
+        transaction: AccountTransaction,
+        sign: Optional[
+            Callable[[AccountTransaction], Awaitable[AccountTransaction]]
+        ] = None,
+    ) -> EstimatedFee:
+        """
+        Estimate the fee of a transaction, reusing a cached estimate if there is a fresh one.
+
+        :param transaction: Transaction to estimate.
+        :param sign: Optional function signing the transaction for fee estimate,
+            called only if the transaction is sent to the node.
+        :return: Estimated fee.
+        """
+        await self._refresh_block_number()
+        shape = self.shape(transaction)
+        cached = self._get_cached(shape)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+        self.stats.misses += 1
+
+        pending = self._pending.get(shape)
+        if pending is None and sign is not None:
+            transaction = await sign(transaction)
+            pending = self._pending.get(shape)
+
+        if pending is not None:
+            # A transaction of the same shape is already waiting for its estimate
+            future = pending[1]
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[shape] = (transaction, future)
+            self._schedule_flush()
+        return await asyncio.shield(future)
+
+    async def estimate_fees(
+        self, transactions: List[AccountTransaction]
+    ) -> List[EstimatedFee]:
+        """
+        Estimate fees of independent transactions, reusing fresh cached estimates.
+
+        :param transactions: Transactions signed for fee estimate.
+        :return: List of estimated fees, in the same order as transactions.
+        """
+        return list(await asyncio.gather(*map(self.estimate_fee, transactions)))
+
+    async def simulate_transactions(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        skip_fee_charge: bool = False,
+    ) -> List[SimulatedTransaction]:
+        """
+        Simulate independent transactions on the pending state, with concurrent batch requests
+        of at most ``max_batch_size`` transactions. Simulations are not cached.
+
+        :param transactions: Transactions to simulate.
+        :param skip_validate: Flag checking whether the validation part of transactions should be executed.
+        :param skip_fee_charge: Flag deciding whether fee should be deducted from the balance.
+        :return: List of simulated transactions, in the same order as transactions.
+        """
+        batches = [
+            transactions[start : start + self.max_batch_size]
+            for start in range(0, len(transactions), self.max_batch_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                self.client.simulate_transactions_batch(
+                    batch, skip_validate=skip_validate, skip_fee_charge=skip_fee_charge
+                )
+                for batch in batches
+            )
+        )
+        self.stats.requests += len(batches)
+        self.stats.simulated_transactions += len(transactions)
+        return [simulated for result in results for simulated in result]
+
+    def clear(self):
+        """
+        Removes all cached estimates.
+        """
+        self._cache.clear()
+
+    async def _refresh_block_number(self):
+        # Cached estimates can become stale only with a known block number
+        if (
+            self.block_refresh_interval is None
+            or not self._cache
+            or (
+                self._block_number_updated_at is not None
+                and time.monotonic() - self._block_number_updated_at
+                < self.block_refresh_interval
+            )
+        ):
+            return
+
+        # Concurrent estimates wait for the same request
+        if self._block_number_request is None:
+            self._block_number_request = asyncio.ensure_future(
+                self._fetch_block_number()
+            )
+        await asyncio.shield(self._block_number_request)
+
+    async def _fetch_block_number(self):
+        try:
+            self.update_block_number(await self.client.get_block_number())
+        finally:
+            self._block_number_request = None
+
+    def _get_cached(self, shape: TransactionShape) -> Optional[EstimatedFee]:
+        entry = self._cache.get(shape)
+        if entry is None:
+            return None
+        if not self._is_fresh(entry):
+            del self._cache[shape]
+            return None
+
+        self._cache.move_to_end(shape)
+        return entry.estimated_fee
+
+    def _is_fresh(self, entry: _CachedEstimate) -> bool:
+        if (
+            self.max_age is not None
+            and time.monotonic() - entry.created_at > self.max_age
+        ):
+            return False
+        block_number = (
+            self._block_number if self._block_number is not None else entry.block_number
+        )
+        return block_number - entry.block_number < self.max_age_blocks
+
+    def _store(
+        self, shape: TransactionShape, estimated_fee: EstimatedFee, block_number: int
+    ):
+        if self.max_age_blocks == 0:
+            return
+
+        self._cache[shape] = _CachedEstimate(
+            estimated_fee=estimated_fee,
+            block_number=block_number,
+            created_at=time.monotonic(),
+        )
+        self._cache.move_to_end(shape)
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+    def _schedule_flush(self):
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush
+            )
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        batch: Dict[
+            TransactionShape, Tuple[AccountTransaction, "asyncio.Future[EstimatedFee]"]
+        ],
+    ):
+        shapes = list(batch)
+        transactions = [batch[shape][0] for shape in shapes]
+        try:
+            block_number, estimated_fees = await asyncio.gather(
+                self.client.get_block_number(),
+                self.client.estimate_fee_batch(
+                    transactions,
+                    skip_validate=self.skip_validate,
+                    return_exceptions=True,
+                ),
+            )
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            # The whole request failed
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        self.stats.requests += 1
+        self.stats.estimated_transactions += len(transactions)
+        self.update_block_number(block_number)
+        for shape, estimated_fee in zip(shapes, estimated_fees):
+            future = batch[shape][1]
+            # A failed estimate fails only the callers of its own transaction and isn't cached
+            if isinstance(estimated_fee, Exception):
+                self.stats.failed_estimates += 1
+                if not future.done():
+                    future.set_exception(estimated_fee)
+                continue
+
+            self._store(shape, estimated_fee, block_number)
+            if not future.done():
+                future.set_result(estimated_fee)
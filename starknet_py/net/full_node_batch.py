@@ -0,0 +1,350 @@
+import asyncio
+import itertools
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+from marshmallow import Schema
+
+from starknet_py.net.block_range import (
+    _BLOCK_KINDS,
+    BlockKind,
+    BlockRangeStats,
+    _load_block,
+)
+from starknet_py.net.client_models import (
+    Call,
+    EstimatedFee,
+    Hash,
+    SimulatedTransaction,
+    Tag,
+)
+from starknet_py.net.client_utils import (
+    _get_call_params,
+    _get_estimate_fee_params,
+    _get_simulate_transactions_params,
+    _get_simulation_flags,
+    _get_storage_params,
+    get_block_identifier,
+)
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.instrumentation import Instrumentation, _load_measured
+from starknet_py.net.models.transaction import AccountTransaction
+from starknet_py.net.schemas.rpc.general import EstimatedFeeSchema
+from starknet_py.net.schemas.rpc.trace_api import SimulatedTransactionSchema
+from starknet_py.utils.sync import add_sync_methods
+
+
+@add_sync_methods
+class FullNodeBatchMethods:
+    """
+    Methods of :class:`~starknet_py.net.full_node_client.FullNodeClient` sending many calls
+    in JSON-RPC batch requests.
+    """
+
+    _client: RpcHttpClient
+
+    async def call_contract_batch(
+        self,
+        calls: List[Call],
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[List[int]]:
+        """
+        Call multiple contract functions in a single JSON-RPC batch request.
+
+        :param calls: Calls to perform.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+        :return: List of call results, in the same order as calls.
+        """
+        block_identifier = get_block_identifier(
+            block_hash=block_hash, block_number=block_number
+        )
+        res = await self._client.batch_call(
+            [("call", _get_call_params(call, block_identifier)) for call in calls]
+        )
+        return [[int(i, 16) for i in result] for result in res]
+
+    async def get_storage_at_batch(
+        self,
+        slots: List[Tuple[Hash, int]],
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[int]:
+        """
+        Get values of multiple storage slots in a single JSON-RPC batch request.
+
+        :param slots: List of (contract_address, key) pairs.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+        :return: List of storage values, in the same order as slots.
+        """
+        block_identifier = get_block_identifier(
+            block_hash=block_hash, block_number=block_number
+        )
+        res = await self._client.batch_call(
+            [
+                (
+                    "getStorageAt",
+                    _get_storage_params(contract_address, key, block_identifier),
+                )
+                for contract_address, key in slots
+            ]
+        )
+        return [int(value, 16) for value in res]
+
+    async def get_blocks_batch(
+        self, block_numbers: List[int], kind: BlockKind = "receipts"
+    ) -> List[Any]:
+        """
+        Fetch multiple blocks in a single JSON-RPC batch request.
+
+        :param block_numbers: Numbers of the blocks.
+        :param kind: What to fetch for every block: ``"receipts"`` (block with receipts),
+            ``"tx_hashes"`` (block with transaction hashes), ``"txs"`` (block with transactions),
+            ``"state_update"`` (state update of the block) or ``"traces"`` (traces of all transactions).
+        :return: List of fetched blocks, in the same order as block numbers.
+        """
+        if kind not in _BLOCK_KINDS:
+            raise ValueError(f"Unknown block kind: {kind}.")
+
+        method_name, _ = _BLOCK_KINDS[kind]
+        res = await self._client.batch_call(
+            [
+                (method_name, get_block_identifier(block_number=block_number))
+                for block_number in block_numbers
+            ]
+        )
+        return [_load_block(kind, block) for block in res]
+
+    async def iter_blocks(
+        self,
+        from_block_number: int,
+        to_block_number: int,
+        kind: BlockKind = "receipts",
+        *,
+        batch_size: int = 10,
+        max_concurrent_requests: int = 5,
+        stats: Optional[BlockRangeStats] = None,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        # pylint: disable=too-many-arguments
+        """
+        Iterate over a range of blocks, fetching the following blocks while the current ones are processed.
+
+        Blocks are fetched with batch requests of ``batch_size`` blocks, at most ``max_concurrent_requests``
+        at the same time, and yielded strictly in order. New requests are sent only when the consumer takes
+        blocks, so at most ``batch_size * max_concurrent_requests`` blocks are held in memory.
+
+        :param from_block_number: Number of the first block.
+        :param to_block_number: Number of the last block (inclusive).
+        :param kind: What to fetch for every block, see :meth:`get_blocks_batch`.
+        :param batch_size: Number of blocks fetched in a single request.
+        :param max_concurrent_requests: Maximal number of requests sent at the same time.
+        :param stats: Optional BlockRangeStats updated while blocks are fetched.
+        :return: Asynchronous iterator of tuples of block number and fetched block.
+        """
+        if kind not in _BLOCK_KINDS:
+            raise ValueError(f"Unknown block kind: {kind}.")
+        if batch_size <= 0:
+            raise ValueError("Argument batch_size must be greater than 0.")
+        if max_concurrent_requests <= 0:
+            raise ValueError("Argument max_concurrent_requests must be greater than 0.")
+
+        stats = stats if stats is not None else BlockRangeStats()
+
+        async def _fetch(block_numbers: range) -> List[Any]:
+            stats.requests += 1
+            blocks = await self.get_blocks_batch(list(block_numbers), kind)
+            stats.blocks_fetched += len(blocks)
+            return blocks
+
+        batches = (
+            range(start, min(start + batch_size, to_block_number + 1))
+            for start in range(from_block_number, to_block_number + 1, batch_size)
+        )
+        pending: Deque[Tuple[range, asyncio.Task]] = deque()
+        try:
+            while True:
+                for block_numbers in itertools.islice(
+                    batches, max_concurrent_requests - len(pending)
+                ):
+                    pending.append(
+                        (block_numbers, asyncio.create_task(_fetch(block_numbers)))
+                    )
+                if not pending:
+                    return
+
+                block_numbers, task = pending.popleft()
+                for block_number, block in zip(block_numbers, await task):
+                    stats.blocks_yielded += 1
+                    yield block_number, block
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    @overload
+    async def estimate_fee_batch(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: Literal[False] = False,
+    ) -> List[EstimatedFee]: ...
+
+    @overload
+    async def estimate_fee_batch(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[EstimatedFee, Exception]]: ...
+
+    async def estimate_fee_batch(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> Union[List[EstimatedFee], List[Union[EstimatedFee, Exception]]]:
+        # pylint: disable=too-many-arguments
+        """
+        Estimate fees of independent transactions in a single JSON-RPC batch request.
+
+        Unlike :meth:`estimate_fee` with a list of transactions, every transaction is estimated
+        on the state of the requested block, not on top of the previous transactions.
+
+        :param transactions: Transactions to estimate.
+        :param skip_validate: Flag checking whether the validation part of the transactions should be executed.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+        :param return_exceptions: If True, errors of single transactions (e.g. ClientError of a failed
+            validation) are returned in place of their estimates instead of being raised.
+        :return: List of estimated fees, in the same order as transactions.
+        """
+        block_identifier = get_block_identifier(
+            block_hash=block_hash, block_number=block_number
+        )
+        simulation_flags = _get_simulation_flags(skip_validate)
+
+        res = await self._client.batch_call(
+            [
+                (
+                    "estimateFee",
+                    _get_estimate_fee_params([tx], simulation_flags, block_identifier),
+                )
+                for tx in transactions
+            ],
+            return_exceptions=return_exceptions,
+        )
+        return _load_batch_results(
+            self._client.instrumentation, EstimatedFeeSchema(), res
+        )
+
+    @overload
+    async def simulate_transactions_batch(  # pylint: disable=too-many-arguments
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        skip_fee_charge: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: Literal[False] = False,
+    ) -> List[SimulatedTransaction]: ...
+
+    @overload
+    async def simulate_transactions_batch(  # pylint: disable=too-many-arguments
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        skip_fee_charge: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[SimulatedTransaction, Exception]]: ...
+
+    async def simulate_transactions_batch(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        skip_fee_charge: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> Union[
+        List[SimulatedTransaction], List[Union[SimulatedTransaction, Exception]]
+    ]:
+        # pylint: disable=too-many-arguments
+        """
+        Simulate independent transactions in a single JSON-RPC batch request.
+
+        Unlike :meth:`simulate_transactions`, every transaction is simulated on the state
+        of the requested block, not on top of the previous transactions.
+
+        :param transactions: Transactions to simulate.
+        :param skip_validate: Flag checking whether the validation part of the transactions should be executed.
+        :param skip_fee_charge: Flag deciding whether fee should be deducted from the balance.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+        :param return_exceptions: If True, errors of single transactions are returned in place of
+            their simulations instead of being raised.
+        :return: List of simulated transactions, in the same order as transactions.
+        """
+        block_identifier = get_block_identifier(
+            block_hash=block_hash, block_number=block_number
+        )
+        simulation_flags = _get_simulation_flags(skip_validate, skip_fee_charge)
+
+        res = await self._client.batch_call(
+            [
+                (
+                    "simulateTransactions",
+                    _get_simulate_transactions_params(
+                        [tx], simulation_flags, block_identifier
+                    ),
+                )
+                for tx in transactions
+            ],
+            return_exceptions=return_exceptions,
+        )
+        return _load_batch_results(
+            self._client.instrumentation, SimulatedTransactionSchema(), res
+        )
+
+
+def _load_batch_results(
+    instrumentation: Optional[Instrumentation], schema: Schema, results: List[Any]
+) -> List[Any]:
+    """
+    Loads results of batched calls of single transactions, keeping errors returned in place of results.
+    """
+    loaded = iter(
+        _load_measured(
+            instrumentation,
+            schema,
+            [result[0] for result in results if not isinstance(result, Exception)],
+            many=True,
+        )
+    )
+    return [
+        result if isinstance(result, Exception) else next(loaded) for result in results
+    ]
@@ -1,6 +1,6 @@
-from typing import List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
 
-import aiohttp
+from marshmallow import Schema
 
 from starknet_py.constants import RPC_CONTRACT_ERROR
 from starknet_py.hash.utils import keccak256
@@ -25,7 +25,6 @@ from starknet_py.net.client_models import (
     SentTransactionResponse,
     SierraContractClass,
     SimulatedTransaction,
-    SimulationFlag,
     StarknetBlock,
     StarknetBlockWithReceipts,
     StarknetBlockWithTxHashes,
@@ -38,12 +37,20 @@ from starknet_py.net.client_models import (
 )
 from starknet_py.net.client_utils import (
     _create_broadcasted_txn,
+    _get_call_params,
+    _get_estimate_fee_params,
+    _get_raw_block_identifier,
+    _get_simulate_transactions_params,
+    _get_simulation_flags,
+    _get_storage_params,
     _is_valid_eth_address,
     _to_rpc_felt,
-    _to_storage_key,
     encode_l1_message,
+    get_block_identifier,
 )
+from starknet_py.net.full_node_batch import FullNodeBatchMethods
 from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.instrumentation import Instrumentation, _load_measured
 from starknet_py.net.models.transaction import (
     AccountTransaction,
     Declare,
@@ -84,14 +91,19 @@ from starknet_py.net.schemas.rpc.transactions import (
 from starknet_py.transaction_errors import TransactionNotReceivedError
 from starknet_py.utils.sync import add_sync_methods
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 @add_sync_methods
-class FullNodeClient(Client):
+class FullNodeClient(FullNodeBatchMethods, Client):
     # pylint: disable=too-many-public-methods
     def __init__(
         self,
         node_url: str,
-        session: Optional[aiohttp.ClientSession] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+        *,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         """
         Client for interacting with Starknet json-rpc interface.
@@ -99,9 +111,20 @@ class FullNodeClient(Client):
         :param node_url: Url of the node providing rpc interface
         :param session: Aiohttp session to be used for request. If not provided, client will create a session for
                         every request. When using a custom session, user is responsible for closing it manually.
+        :param instrumentation: Optional hooks measuring requests and schema loads,
+                        e.g. :class:`~starknet_py.net.instrumentation.MetricsCollector`.
         """
         self.url = node_url
-        self._client = RpcHttpClient(url=node_url, session=session)
+        self._client = RpcHttpClient(
+            url=node_url, session=session, instrumentation=instrumentation
+        )
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """
+        Hooks measuring requests and schema loads of the client.
+        """
+        return self._client.instrumentation
 
     async def get_block(
         self,
@@ -117,8 +140,10 @@ class FullNodeClient(Client):
             params=block_identifier,
         )
         if block_identifier == {"block_id": "pending"}:
-            return cast(PendingStarknetBlock, PendingStarknetBlockSchema().load(res))
-        return cast(StarknetBlock, StarknetBlockSchema().load(res))
+            return cast(
+                PendingStarknetBlock, self._load(PendingStarknetBlockSchema(), res)
+            )
+        return cast(StarknetBlock, self._load(StarknetBlockSchema(), res))
 
     async def get_block_with_txs(
         self,
@@ -144,11 +169,11 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingStarknetBlockWithTxHashes,
-                PendingStarknetBlockWithTxHashesSchema().load(res),
+                self._load(PendingStarknetBlockWithTxHashesSchema(), res),
             )
         return cast(
             StarknetBlockWithTxHashes,
-            StarknetBlockWithTxHashesSchema().load(res),
+            self._load(StarknetBlockWithTxHashesSchema(), res),
         )
 
     async def get_block_with_receipts(
@@ -168,11 +193,11 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingStarknetBlockWithReceipts,
-                PendingStarknetBlockWithReceiptsSchema().load(res),
+                self._load(PendingStarknetBlockWithReceiptsSchema(), res),
             )
         return cast(
             StarknetBlockWithReceipts,
-            StarknetBlockWithReceiptsSchema().load(res),
+            self._load(StarknetBlockWithReceiptsSchema(), res),
         )
 
     # TODO (#809): add tests with multiple emitted keys
@@ -245,8 +270,9 @@ class FullNodeClient(Client):
 
         events_response = cast(
             EventsChunk,
-            EventsChunkSchema().load(
-                {"events": events_list, "continuation_token": continuation_token}
+            self._load(
+                EventsChunkSchema(),
+                {"events": events_list, "continuation_token": continuation_token},
             ),
         )
 
@@ -299,9 +325,9 @@ class FullNodeClient(Client):
         if block_identifier == {"block_id": "pending"}:
             return cast(
                 PendingBlockStateUpdate,
-                PendingBlockStateUpdateSchema().load(res),
+                self._load(PendingBlockStateUpdateSchema(), res),
             )
-        return cast(BlockStateUpdate, BlockStateUpdateSchema().load(res))
+        return cast(BlockStateUpdate, self._load(BlockStateUpdateSchema(), res))
 
     async def get_storage_at(
         self,
@@ -316,11 +342,7 @@ class FullNodeClient(Client):
 
         res = await self._client.call(
             method_name="getStorageAt",
-            params={
-                "contract_address": _to_rpc_felt(contract_address),
-                "key": _to_storage_key(key),
-                **block_identifier,
-            },
+            params=_get_storage_params(contract_address, key, block_identifier),
         )
         res = cast(str, res)
         return int(res, 16)
@@ -336,7 +358,7 @@ class FullNodeClient(Client):
             )
         except ClientError as ex:
             raise TransactionNotReceivedError() from ex
-        return cast(Transaction, TypesOfTransactionsSchema().load(res))
+        return cast(Transaction, self._load(TypesOfTransactionsSchema(), res))
 
     async def get_l1_message_hash(self, tx_hash: Hash) -> Hash:
         """
@@ -357,7 +379,7 @@ class FullNodeClient(Client):
             method_name="getTransactionReceipt",
             params={"transaction_hash": _to_rpc_felt(tx_hash)},
         )
-        return cast(TransactionReceipt, TransactionReceiptSchema().load(res))
+        return cast(TransactionReceipt, self._load(TransactionReceiptSchema(), res))
 
     async def estimate_fee(
         self,
@@ -375,13 +397,9 @@ class FullNodeClient(Client):
 
         res = await self._client.call(
             method_name="estimateFee",
-            params={
-                "request": [_create_broadcasted_txn(transaction=t) for t in tx],
-                "simulation_flags": (
-                    [SimulationFlag.SKIP_VALIDATE] if skip_validate else []
-                ),
-                **block_identifier,
-            },
+            params=_get_estimate_fee_params(
+                tx, _get_simulation_flags(skip_validate), block_identifier
+            ),
         )
 
         if single_transaction:
@@ -389,7 +407,7 @@ class FullNodeClient(Client):
 
         return cast(
             EstimatedFee,
-            EstimatedFeeSchema().load(res, many=not single_transaction),
+            self._load(EstimatedFeeSchema(), res, many=not single_transaction),
         )
 
     async def estimate_message_fee(
@@ -435,7 +453,7 @@ class FullNodeClient(Client):
                     **block_identifier,
                 },
             )
-            return cast(EstimatedFee, EstimatedFeeSchema().load(res))
+            return cast(EstimatedFee, self._load(EstimatedFeeSchema(), res))
         except ClientError as err:
             if err.code == RPC_CONTRACT_ERROR:
                 raise ClientError(
@@ -451,7 +469,7 @@ class FullNodeClient(Client):
     async def get_block_hash_and_number(self) -> BlockHashAndNumber:
         """Get the most recent accepted block hash and number"""
         res = await self._client.call(method_name="blockHashAndNumber", params={})
-        return cast(BlockHashAndNumber, BlockHashAndNumberSchema().load(res))
+        return cast(BlockHashAndNumber, self._load(BlockHashAndNumberSchema(), res))
 
     async def get_chain_id(self) -> str:
         return await self._client.call(method_name="chainId", params={})
@@ -461,7 +479,7 @@ class FullNodeClient(Client):
         sync_status = await self._client.call(method_name="syncing", params={})
         if isinstance(sync_status, bool):
             return sync_status
-        return cast(SyncStatus, SyncStatusSchema().load(sync_status))
+        return cast(SyncStatus, self._load(SyncStatusSchema(), sync_status))
 
     async def call_contract(
         self,
@@ -474,14 +492,7 @@ class FullNodeClient(Client):
         )
         res = await self._client.call(
             method_name="call",
-            params={
-                "request": {
-                    "contract_address": _to_rpc_felt(call.to_addr),
-                    "entry_point_selector": _to_rpc_felt(call.selector),
-                    "calldata": [_to_rpc_felt(i1) for i1 in call.calldata],
-                },
-                **block_identifier,
-            },
+            params=_get_call_params(call, block_identifier),
         )
         return [int(i, 16) for i in res]
 
@@ -493,7 +504,7 @@ class FullNodeClient(Client):
             params={"invoke_transaction": params},
         )
 
-        return cast(SentTransactionResponse, SentTransactionSchema().load(res))
+        return cast(SentTransactionResponse, self._load(SentTransactionSchema(), res))
 
     async def deploy_account(
         self, transaction: DeployAccount
@@ -507,7 +518,7 @@ class FullNodeClient(Client):
 
         return cast(
             DeployAccountTransactionResponse,
-            DeployAccountTransactionResponseSchema().load(res),
+            self._load(DeployAccountTransactionResponseSchema(), res),
         )
 
     async def declare(self, transaction: Declare) -> DeclareTransactionResponse:
@@ -520,7 +531,7 @@ class FullNodeClient(Client):
 
         return cast(
             DeclareTransactionResponse,
-            DeclareTransactionResponseSchema().load(res),
+            self._load(DeclareTransactionResponseSchema(), res),
         )
 
     async def get_class_hash_at(
@@ -563,9 +574,11 @@ class FullNodeClient(Client):
         if "sierra_program" in res:
             return cast(
                 SierraContractClass,
-                SierraContractClassSchema().load(res),
+                self._load(SierraContractClassSchema(), res),
             )
-        return cast(DeprecatedContractClass, DeprecatedContractClassSchema().load(res))
+        return cast(
+            DeprecatedContractClass, self._load(DeprecatedContractClassSchema(), res)
+        )
 
     async def get_transaction_by_block_id(
         self,
@@ -592,7 +605,7 @@ class FullNodeClient(Client):
                 "index": index,
             },
         )
-        return cast(Transaction, TypesOfTransactionsSchema().load(res))
+        return cast(Transaction, self._load(TypesOfTransactionsSchema(), res))
 
     async def get_block_transaction_count(
         self,
@@ -646,9 +659,11 @@ class FullNodeClient(Client):
         if "sierra_program" in res:
             return cast(
                 SierraContractClass,
-                SierraContractClassSchema().load(res),
+                self._load(SierraContractClassSchema(), res),
             )
-        return cast(DeprecatedContractClass, DeprecatedContractClassSchema().load(res))
+        return cast(
+            DeprecatedContractClass, self._load(DeprecatedContractClassSchema(), res)
+        )
 
     async def get_contract_nonce(
         self,
@@ -688,7 +703,7 @@ class FullNodeClient(Client):
         )
         return cast(
             TransactionStatusResponse,
-            TransactionStatusResponseSchema().load(res),
+            self._load(TransactionStatusResponseSchema(), res),
         )
 
     # ------------------------------- Trace API -------------------------------
@@ -709,7 +724,7 @@ class FullNodeClient(Client):
                 "transaction_hash": _to_rpc_felt(tx_hash),
             },
         )
-        return cast(TransactionTrace, TransactionTraceSchema().load(res))
+        return cast(TransactionTrace, self._load(TransactionTraceSchema(), res))
 
     async def simulate_transactions(
         self,
@@ -738,29 +753,41 @@ class FullNodeClient(Client):
         :param block_number: Block's number or literals `"pending"` or `"latest"`
         :return: The execution trace and consumed resources for each transaction.
         """
-        block_identifier = get_block_identifier(
-            block_hash=block_hash, block_number=block_number
+        res = await self.simulate_transactions_raw(
+            transactions,
+            skip_validate=skip_validate,
+            skip_fee_charge=skip_fee_charge,
+            block_hash=block_hash,
+            block_number=block_number,
+        )
+        return cast(
+            List[SimulatedTransaction],
+            self._load(SimulatedTransactionSchema(), res, many=True),
         )
 
-        simulation_flags = []
-        if skip_validate:
-            simulation_flags.append(SimulationFlag.SKIP_VALIDATE)
-        if skip_fee_charge:
-            simulation_flags.append(SimulationFlag.SKIP_FEE_CHARGE)
+    async def simulate_transactions_raw(
+        self,
+        transactions: List[AccountTransaction],
+        skip_validate: bool = False,
+        skip_fee_charge: bool = False,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[dict]:
+        # pylint: disable=too-many-arguments
+        """
+        Same as :meth:`simulate_transactions`, but returns the JSON response of the node
+        without building trace objects, e.g. to be walked with
+        :class:`~starknet_py.net.trace_walker.TraceWalker`.
 
-        res = await self._client.call(
+        :return: List of simulated transactions as returned by the node.
+        """
+        return await self._client.call(
             method_name="simulateTransactions",
-            params={
-                **block_identifier,
-                "simulation_flags": simulation_flags,
-                "transactions": [
-                    _create_broadcasted_txn(transaction=t) for t in transactions
-                ],
-            },
-        )
-        return cast(
-            List[SimulatedTransaction],
-            SimulatedTransactionSchema().load(res, many=True),
+            params=_get_simulate_transactions_params(
+                transactions,
+                _get_simulation_flags(skip_validate, skip_fee_charge),
+                get_block_identifier(block_hash=block_hash, block_number=block_number),
+            ),
         )
 
     async def trace_block_transactions(
@@ -775,45 +802,34 @@ class FullNodeClient(Client):
         :param block_number: Block's number or literals `"pending"` or `"latest"`
         :return: List of execution traces of all transactions included in the given block with transaction hashes.
         """
-        block_identifier = get_block_identifier(
+        res = await self.trace_block_transactions_raw(
             block_hash=block_hash, block_number=block_number
         )
-
-        res = await self._client.call(
-            method_name="traceBlockTransactions",
-            params={
-                **block_identifier,
-            },
-        )
         return cast(
             List[BlockTransactionTrace],
-            BlockTransactionTraceSchema().load(res, many=True),
+            self._load(BlockTransactionTraceSchema(), res, many=True),
         )
 
+    async def trace_block_transactions_raw(
+        self,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[dict]:
+        """
+        Same as :meth:`trace_block_transactions`, but returns the JSON response of the node
+        without building trace objects, e.g. to be walked with
+        :class:`~starknet_py.net.trace_walker.TraceWalker`.
 
-def get_block_identifier(
-    block_hash: Optional[Union[Hash, Tag]] = None,
-    block_number: Optional[Union[int, Tag]] = None,
-) -> dict:
-    return {"block_id": _get_raw_block_identifier(block_hash, block_number)}
-
-
-def _get_raw_block_identifier(
-    block_hash: Optional[Union[Hash, Tag]] = None,
-    block_number: Optional[Union[int, Tag]] = None,
-) -> Union[dict, Hash, Tag, None]:
-    if block_hash is not None and block_number is not None:
-        raise ValueError(
-            "Arguments block_hash and block_number are mutually exclusive."
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`
+        :param block_number: Block's number or literals `"pending"` or `"latest"`
+        :return: List of transaction traces as returned by the node.
+        """
+        return await self._client.call(
+            method_name="traceBlockTransactions",
+            params=get_block_identifier(
+                block_hash=block_hash, block_number=block_number
+            ),
         )
 
-    if block_hash in ("latest", "pending") or block_number in ("latest", "pending"):
-        return block_hash or block_number
-
-    if block_hash is not None:
-        return {"block_hash": _to_rpc_felt(block_hash)}
-
-    if block_number is not None:
-        return {"block_number": block_number}
-
-    return "pending"
+    def _load(self, schema: Schema, data: Any, **kwargs) -> Any:
+        return _load_measured(self._client.instrumentation, schema, data, **kwargs)
@@ -1,10 +1,16 @@
+import json
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-
-from aiohttp import ClientResponse, ClientSession
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from starknet_py.net.client_errors import ClientError
+from starknet_py.net.instrumentation import Instrumentation, RequestMetrics
+
+if TYPE_CHECKING:
+    # aiohttp is imported when the first request is sent, not to slow down importing clients
+    from aiohttp import ClientResponse, ClientSession
 
 
 class HttpMethod(Enum):
@@ -13,7 +19,7 @@ class HttpMethod(Enum):
 
 
 class HttpClient(ABC):
-    def __init__(self, url, session: Optional[ClientSession] = None):
+    def __init__(self, url, session: Optional["ClientSession"] = None):
         self.url = url
         self.session = session
 
@@ -24,35 +30,60 @@ class HttpClient(ABC):
         params: Optional[dict] = None,
         payload: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
     ):
+        body = await self.request_raw(
+            address=address,
+            http_method=http_method,
+            params=params,
+            data=_encode(payload),
+        )
+        return _decode(body)
+
+    async def request_raw(
+        self,
+        address: str,
+        http_method: HttpMethod,
+        params: Optional[dict] = None,
+        data: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Sends a request with an encoded JSON body and returns the response body without decoding it.
+        """
         kwargs = {
             "address": address,
             "http_method": http_method,
             "params": params,
-            "payload": payload,
+            "data": data,
         }
         if self.session:
             return await self._make_request(session=self.session, **kwargs)
 
+        from aiohttp import ClientSession  # pylint: disable=import-outside-toplevel
+
         async with ClientSession() as session:
             return await self._make_request(session=session, **kwargs)
 
     async def _make_request(
         self,
-        session: ClientSession,
+        session: "ClientSession",
         address: str,
         http_method: HttpMethod,
-        params: dict,
-        payload: dict,
-    ) -> dict:
+        params: Optional[dict],
+        data: Optional[bytes],
+    ) -> bytes:
         # pylint: disable=too-many-arguments
+        headers = {"Content-Type": "application/json"} if data is not None else None
         async with session.request(
-            method=http_method.value, url=address, params=params, json=payload
+            method=http_method.value,
+            url=address,
+            params=params,
+            data=data,
+            headers=headers,
         ) as request:
             await self.handle_request_error(request)
-            return await request.json(content_type=None)
+            return await request.read()
 
     @abstractmethod
-    async def handle_request_error(self, request: ClientResponse):
+    async def handle_request_error(self, request: "ClientResponse"):
         """
         Handle an errors returned by make_request
         """
@@ -62,11 +93,13 @@ class RpcHttpClient(HttpClient):
     def __init__(
         self,
         url,
-        session: Optional[ClientSession] = None,
+        session: Optional["ClientSession"] = None,
         method_prefix: str = "starknet",
+        instrumentation: Optional[Instrumentation] = None,
     ):
         super().__init__(url, session)
         self.method_prefix = method_prefix
+        self.instrumentation = instrumentation
 
     async def call(self, method_name: str, params: Optional[dict] = None):
         payload = {
@@ -76,29 +109,128 @@ class RpcHttpClient(HttpClient):
             "params": params if params else [],
         }
 
-        result = await self.request(
-            http_method=HttpMethod.POST, address=self.url, payload=payload
-        )
+        with self._measure(method_name, batch_size=1) as metrics:
+            result = await self._post(payload, metrics)
 
-        if "result" not in result:
-            self.handle_rpc_error(result)
-        return result["result"]
+            if "result" not in result:
+                self.handle_rpc_error(result)
+            return result["result"]
+
+    async def batch_call(
+        self,
+        calls: List[Tuple[str, Optional[dict]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Sends multiple calls in a single JSON-RPC batch request.
+
+        :param calls: List of (method_name, params) pairs.
+        :param return_exceptions: If True, errors of single calls are returned in place of their results
+            instead of being raised. Errors of the whole request are always raised.
+        :return: List of results in the same order as calls.
+        """
+        if not calls:
+            return []
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": f"{self.method_prefix}_{method_name}",
+                "id": index,
+                "params": params if params else [],
+            }
+            for index, (method_name, params) in enumerate(calls)
+        ]
+
+        methods = {method_name for method_name, _ in calls}
+        with self._measure(
+            methods.pop() if len(methods) == 1 else "batch", batch_size=len(calls)
+        ) as metrics:
+            response = await self._post(payload, metrics)
+
+            # Node responds with a single object if the whole batch was rejected
+            if not isinstance(response, list):
+                self.handle_rpc_error(response)
+
+            # Responses may come in any order
+            results_by_id = {result.get("id"): result for result in response}
+            results = []
+            for index in range(len(calls)):
+                result = results_by_id.get(index, {})
+                if "result" in result:
+                    results.append(result["result"])
+                elif return_exceptions:
+                    results.append(self._get_rpc_error(result))
+                else:
+                    self.handle_rpc_error(result)
+            return results
+
+    @contextmanager
+    def _measure(
+        self, method_name: str, batch_size: int
+    ) -> Iterator[Optional[RequestMetrics]]:
+        if self.instrumentation is None:
+            yield None
+            return
+
+        metrics = RequestMetrics(method=method_name, batch_size=batch_size)
+        try:
+            yield metrics
+        except Exception as exception:
+            metrics.error = exception
+            raise
+        finally:
+            self.instrumentation.on_request(metrics)
+
+    async def _post(self, payload: Any, metrics: Optional[RequestMetrics]) -> Any:
+        if metrics is None:
+            return await self.request(
+                http_method=HttpMethod.POST, address=self.url, payload=payload
+            )
+
+        data = _encode(payload)
+        metrics.request_size = len(data)
+        start = time.perf_counter()
+        try:
+            body = await self.request_raw(
+                http_method=HttpMethod.POST, address=self.url, data=data
+            )
+        finally:
+            received = time.perf_counter()
+            metrics.network_time = received - start
+        metrics.response_size = len(body)
+        response = _decode(body)
+        metrics.decode_time = time.perf_counter() - received
+        return response
 
     @staticmethod
     def handle_rpc_error(result: dict):
+        raise RpcHttpClient._get_rpc_error(result)
+
+    @staticmethod
+    def _get_rpc_error(result: dict) -> Exception:
         if "error" not in result:
-            raise ServerError(body=result)
-        raise ClientError(
+            return ServerError(body=result)
+        return ClientError(
             code=result["error"]["code"],
             message=result["error"]["message"],
             data=result["error"].get("data"),
         )
 
-    async def handle_request_error(self, request: ClientResponse):
+    async def handle_request_error(self, request: "ClientResponse"):
         await basic_error_handle(request)
 
 
-async def basic_error_handle(request: ClientResponse):
+def _encode(payload: Any) -> Optional[bytes]:
+    return json.dumps(payload).encode("utf-8") if payload is not None else None
+
+
+def _decode(body: bytes) -> Any:
+    # Same as ClientResponse.json, which returns None for an empty body
+    return json.loads(body) if body.strip() else None
+
+
+async def basic_error_handle(request: "ClientResponse"):
     if request.status >= 300:
         raise ClientError(code=str(request.status), message=await request.text())
 
@@ -0,0 +1,298 @@
+import bisect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from marshmallow import Schema
+
+DEFAULT_DURATION_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds of buckets of durations in seconds."""
+
+DEFAULT_SIZE_BUCKETS = tuple(256 * 4**exponent for exponent in range(10))
+"""Upper bounds of buckets of payload sizes in bytes, from 256 B to 64 MiB."""
+
+_BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Measurements of a single JSON-RPC request, possibly a batch.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    method: str
+    """Called method without the prefix, e.g. ``"getBlockWithTxs"``, or ``"batch"`` for batches of different methods."""
+    batch_size: int  #: Number of calls in the request, 1 for single calls.
+    started_at: float = field(default_factory=time.time)
+    """Unix timestamp of the start of the request, e.g. for the start time of a tracing span."""
+    request_size: int = 0  #: Size of the encoded request in bytes.
+    response_size: int = 0  #: Size of the response body in bytes.
+    network_time: float = 0.0
+    """Seconds from sending the request to receiving the whole response body."""
+    decode_time: float = 0.0  #: Seconds spent decoding JSON of the response.
+    error: Optional[Exception] = None
+    """Exception raised by the request (e.g. ClientError of a JSON-RPC error) or None."""
+
+    @property
+    def total_time(self) -> float:
+        """
+        Seconds spent on the request, from encoding it to decoding its response.
+        """
+        return self.network_time + self.decode_time
+
+
+class Instrumentation:
+    """
+    Hooks called by :class:`~starknet_py.net.full_node_client.FullNodeClient`, by default doing nothing.
+
+    Subclasses can record the measurements in any metrics or tracing system, e.g. create OpenTelemetry spans
+    from :class:`RequestMetrics`. Hooks are called synchronously on the event loop, so they should be fast.
+    """
+
+    def on_request(self, metrics: RequestMetrics):
+        """
+        Called after every JSON-RPC request, also when it failed.
+
+        :param metrics: Measurements of the request.
+        """
+
+    def on_schema_load(self, schema: str, duration: float):
+        """
+        Called after a response is loaded into client models.
+
+        :param schema: Name of the schema class, e.g. ``"StarknetBlockSchema"``.
+        :param duration: Seconds spent loading.
+        """
+
+
+@dataclass
+class Histogram:
+    """
+    Cumulative histogram of observed values, as in Prometheus.
+    """
+
+    bounds: Sequence[float]  #: Upper bounds of buckets, sorted.
+    counts: List[int] = field(init=False)
+    """Number of values in each bucket, the last one counts values above all bounds."""
+    sum: float = 0.0  #: Sum of observed values.
+    count: int = 0  #: Number of observed values.
+
+    def __post_init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float):
+        """
+        Adds a value to the histogram.
+
+        :param value: Observed value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """
+        :return: Pairs of the upper bound (``inf`` for the last bucket) and the number of values
+            less than or equal to it.
+        """
+        result = []
+        total = 0
+        for bound, count in zip([*self.bounds, float("inf")], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+# Metric name, help and label name of histograms collected by MetricsCollector
+_HISTOGRAMS = {
+    "request_duration": (
+        "rpc_request_duration_seconds",
+        "Duration of JSON-RPC requests, from encoding the request to decoding the response.",
+        "method",
+    ),
+    "network_duration": (
+        "rpc_network_duration_seconds",
+        "Duration of JSON-RPC requests spent waiting for the node.",
+        "method",
+    ),
+    "decode_duration": (
+        "rpc_decode_duration_seconds",
+        "Duration of decoding JSON of responses.",
+        "method",
+    ),
+    "request_size": (
+        "rpc_request_size_bytes",
+        "Size of encoded JSON-RPC requests.",
+        "method",
+    ),
+    "response_size": (
+        "rpc_response_size_bytes",
+        "Size of JSON-RPC response bodies.",
+        "method",
+    ),
+    "batch_size": (
+        "rpc_batch_size",
+        "Number of calls in JSON-RPC requests.",
+        "method",
+    ),
+    "schema_load_duration": (
+        "schema_load_duration_seconds",
+        "Duration of loading responses into client models.",
+        "schema",
+    ),
+}
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Instrumentation collecting in-memory histograms of requests, by method, and of schema loads, by schema.
+
+    Collected metrics can be exported in the Prometheus text format with :meth:`to_prometheus`,
+    e.g. served by an HTTP endpoint scraped by Prometheus.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str = "starknet_py",
+        duration_buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ):
+        """
+        :param namespace: Prefix of names of exported metrics.
+        :param duration_buckets: Upper bounds of buckets of durations in seconds.
+        :param size_buckets: Upper bounds of buckets of payload sizes in bytes.
+        """
+        self.namespace = namespace
+        self.duration_buckets = sorted(duration_buckets)
+        self.size_buckets = sorted(size_buckets)
+        self._histograms: Dict[str, Dict[str, Histogram]] = {
+            name: {} for name in _HISTOGRAMS
+        }
+        self._errors: Dict[Tuple[str, str], int] = {}
+
+    def on_request(self, metrics: RequestMetrics):
+        method = metrics.method
+        self._observe("request_duration", method, metrics.total_time)
+        self._observe("network_duration", method, metrics.network_time)
+        self._observe("decode_duration", method, metrics.decode_time)
+        self._observe("request_size", method, metrics.request_size)
+        self._observe("response_size", method, metrics.response_size)
+        self._observe("batch_size", method, metrics.batch_size)
+        if metrics.error is not None:
+            key = (method, type(metrics.error).__name__)
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def on_schema_load(self, schema: str, duration: float):
+        self._observe("schema_load_duration", schema, duration)
+
+    def histogram(self, name: str, label: str) -> Optional[Histogram]:
+        """
+        :param name: Name of the histogram, one of ``"request_duration"``, ``"network_duration"``,
+            ``"decode_duration"``, ``"request_size"``, ``"response_size"``, ``"batch_size"``
+            (labeled by method) or ``"schema_load_duration"`` (labeled by schema).
+        :param label: Method or schema name.
+        :return: Histogram or None if nothing was observed.
+        """
+        if name not in self._histograms:
+            raise ValueError(f"Unknown histogram {name}.")
+        return self._histograms[name].get(label)
+
+    def errors(self) -> Dict[Tuple[str, str], int]:
+        """
+        :return: Number of failed requests by method and exception class name.
+        """
+        return dict(self._errors)
+
+    def reset(self):
+        """
+        Removes all collected metrics.
+        """
+        for histograms in self._histograms.values():
+            histograms.clear()
+        self._errors.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        :return: Collected metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, (metric, description, label_name) in _HISTOGRAMS.items():
+            histograms = self._histograms[name]
+            if not histograms:
+                continue
+
+            metric = f"{self.namespace}_{metric}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+            for label, histogram in sorted(histograms.items()):
+                labels = f'{label_name}="{_escape(label)}"'
+                for bound, count in histogram.cumulative_counts():
+                    lines.append(
+                        f'{metric}_bucket{{{labels},le="{_format_bound(bound)}"}} {count}'
+                    )
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        if self._errors:
+            metric = f"{self.namespace}_rpc_errors_total"
+            lines.append(f"# HELP {metric} Number of failed JSON-RPC requests.")
+            lines.append(f"# TYPE {metric} counter")
+            for (method, error), count in sorted(self._errors.items()):
+                lines.append(
+                    f'{metric}{{method="{_escape(method)}",error="{_escape(error)}"}} {count}'
+                )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _observe(self, name: str, label: str, value: float):
+        histograms = self._histograms[name]
+        histogram = histograms.get(label)
+        if histogram is None:
+            if name == "batch_size":
+                bounds = _BATCH_SIZE_BUCKETS
+            elif name.endswith("duration"):
+                bounds = self.duration_buckets
+            else:
+                bounds = self.size_buckets
+            histogram = histograms[label] = Histogram(bounds)
+        histogram.observe(value)
+
+
+def _load_measured(
+    instrumentation: Optional[Instrumentation], schema: Schema, data: Any, **kwargs
+) -> Any:
+    """
+    Loads data with the schema, reporting the duration of loading to instrumentation if provided.
+    """
+    if instrumentation is None:
+        return schema.load(data, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        return schema.load(data, **kwargs)
+    finally:
+        instrumentation.on_schema_load(
+            type(schema).__name__, time.perf_counter() - start
+        )
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -10,10 +10,9 @@ import gzip
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union
 
 import marshmallow
-import marshmallow_dataclass
 from marshmallow import fields
 
 from starknet_py.hash.address import compute_address
@@ -134,6 +133,8 @@ class DeclareV3(_AccountTransactionV3):
     compiled_class_hash: int
     contract_class: SierraContractClass
     account_deployment_data: List[int] = field(default_factory=list)
+    # Precomputed class hash of contract_class, so it is not computed again for every hash of the transaction
+    class_hash: Optional[int] = field(default=None, compare=False)
 
     @property
     def type(self) -> TransactionType:
@@ -143,6 +144,7 @@ class DeclareV3(_AccountTransactionV3):
         return compute_declare_v3_transaction_hash(
             account_deployment_data=self.account_deployment_data,
             contract_class=self.contract_class,
+            class_hash=self.class_hash,
             compiled_class_hash=self.compiled_class_hash,
             common_fields=self.get_common_fields(
                 tx_prefix=TransactionHashPrefix.DECLARE,
@@ -164,6 +166,16 @@ class DeclareV2(_DeprecatedAccountTransaction):
     )
     compiled_class_hash: int = field(metadata={"marshmallow_field": Felt()})
     sender_address: int = field(metadata={"marshmallow_field": Felt()})
+    # Precomputed class hash of contract_class, so it is not computed again for every hash of the transaction
+    class_hash: Optional[int] = field(
+        default=None,
+        compare=False,
+        metadata={
+            "marshmallow_field": Felt(
+                allow_none=True, load_default=None, load_only=True
+            )
+        },
+    )
 
     @property
     def type(self) -> TransactionType:
@@ -172,6 +184,7 @@ class DeclareV2(_DeprecatedAccountTransaction):
     def calculate_hash(self, chain_id: int) -> int:
         return compute_declare_v2_transaction_hash(
             contract_class=self.contract_class,
+            class_hash=self.class_hash,
             compiled_class_hash=self.compiled_class_hash,
             chain_id=chain_id,
             sender_address=self.sender_address,
@@ -368,10 +381,31 @@ Declare = Union[DeclareV1, DeclareV2, DeclareV3]
 DeployAccount = Union[DeployAccountV1, DeployAccountV3]
 Invoke = Union[InvokeV1, InvokeV3]
 
-InvokeV1Schema = marshmallow_dataclass.class_schema(InvokeV1)
-DeclareV1Schema = marshmallow_dataclass.class_schema(DeclareV1)
-DeclareV2Schema = marshmallow_dataclass.class_schema(DeclareV2)
-DeployAccountV1Schema = marshmallow_dataclass.class_schema(DeployAccountV1)
+# Schemas generated from the dataclasses, created on first access (PEP 562) together with
+# the import of marshmallow_dataclass
+_DATACLASS_SCHEMAS = {
+    "InvokeV1Schema": InvokeV1,
+    "DeclareV1Schema": DeclareV1,
+    "DeclareV2Schema": DeclareV2,
+    "DeployAccountV1Schema": DeployAccountV1,
+}
+
+if TYPE_CHECKING:
+    InvokeV1Schema: Type[marshmallow.Schema]
+    DeclareV1Schema: Type[marshmallow.Schema]
+    DeclareV2Schema: Type[marshmallow.Schema]
+    DeployAccountV1Schema: Type[marshmallow.Schema]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _DATACLASS_SCHEMAS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import marshmallow_dataclass  # pylint: disable=import-outside-toplevel
+
+    schema = marshmallow_dataclass.class_schema(_DATACLASS_SCHEMAS[name])
+    globals()[name] = schema
+    return schema
 
 
 def compress_program(data: dict, program_name: str = "program") -> dict:
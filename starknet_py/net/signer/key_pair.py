@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from secrets import token_bytes
 
-from eth_keyfile.keyfile import extract_key_from_keyfile
-
 from starknet_py.constants import FIELD_PRIME
 from starknet_py.hash.utils import private_to_stark_key
 from starknet_py.net.client_models import Hash
@@ -52,5 +50,9 @@ class KeyPair:
         :param password: Password to decrypt the keystore file.
         :return: KeyPair object.
         """
+        # eth_keyfile takes a few hundred milliseconds to import, so it's imported only when needed
+        # pylint: disable=import-outside-toplevel
+        from eth_keyfile.keyfile import extract_key_from_keyfile
+
         key = extract_key_from_keyfile(path, password)
         return KeyPair.from_private_key(int.from_bytes(key, byteorder="big"))
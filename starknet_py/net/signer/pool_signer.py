@@ -0,0 +1,187 @@
+import asyncio
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from starknet_py.hash.utils import message_signature
+from starknet_py.net.models import AddressRepresentation, parse_address
+from starknet_py.net.models.chains import ChainId
+from starknet_py.net.models.transaction import AccountTransaction
+from starknet_py.net.signer.base_signer import BaseSigner
+from starknet_py.net.signer.key_pair import KeyPair
+from starknet_py.utils.typed_data import TypedData
+
+# Private keys available to the workers, by id of the signer owning the pool
+_worker_private_keys: Dict[str, int] = {}
+
+
+class PoolSigner(BaseSigner):
+    """
+    Signer producing the same signatures as :class:`~starknet_py.net.signer.stark_curve_signer.StarkCurveSigner`,
+    which computes hashes and signatures in a pool of workers.
+
+    With processes (the default), the private key is handed to the worker processes when they start and
+    is not kept by the signer, so the key is resident only in the workers. With threads, the key stays in the
+    current process, but signing doesn't need to pickle transactions and the native signing code
+    releases the GIL.
+
+    Use the async methods to sign without blocking the event loop. Methods of :class:`BaseSigner` wait for
+    the result of the worker, so signing through them blocks the calling thread.
+    The pool is shut down with :meth:`close` or when the signer is used as a context manager.
+    """
+
+    def __init__(
+        self,
+        account_address: AddressRepresentation,
+        key_pair: KeyPair,
+        chain_id: ChainId,
+        *,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param account_address: Address of the account contract.
+        :param key_pair: Key pair of the account contract.
+        :param chain_id: ChainId of the chain.
+        :param max_workers: Number of workers. Defaults to the number of CPUs.
+        :param use_processes: If True, workers are processes, otherwise they are threads.
+        """
+        max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("Argument max_workers must be greater than 0.")
+
+        self.address = parse_address(account_address)
+        self.chain_id = chain_id
+        self.max_workers = max_workers
+        self._public_key = key_pair.public_key
+        self._id = uuid.uuid4().hex
+        self._executor: Executor
+
+        if use_processes:
+            # The key is passed through a queue rather than in initializer arguments,
+            # which the executor keeps for workers started later
+            context = multiprocessing.get_context()
+            keys_queue = context.Queue()
+            for _ in range(max_workers):
+                keys_queue.put(key_pair.private_key)
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._id, keys_queue),
+            )
+        else:
+            _worker_private_keys[self._id] = key_pair.private_key
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def public_key(self) -> int:
+        return self._public_key
+
+    def sign_transaction(self, transaction: AccountTransaction) -> List[int]:
+        return self._executor.submit(
+            _sign_transactions, self._id, self.chain_id, [transaction]
+        ).result()[0]
+
+    def sign_message(self, typed_data: TypedData, account_address: int) -> List[int]:
+        return self._executor.submit(
+            _sign_message, self._id, typed_data, account_address
+        ).result()
+
+    async def sign_transaction_async(
+        self, transaction: AccountTransaction
+    ) -> List[int]:
+        """
+        Sign a transaction without blocking the event loop.
+
+        :param transaction: Transaction to sign.
+        :return: transaction signature
+        """
+        return (await self.sign_transactions([transaction]))[0]
+
+    async def sign_message_async(
+        self, typed_data: TypedData, account_address: int
+    ) -> List[int]:
+        """
+        Sign TypedData object without blocking the event loop. See :meth:`sign_message`.
+
+        :param typed_data: TypedData to be signed.
+        :param account_address: account address.
+        :return: the signature of the JSON object.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _sign_message, self._id, typed_data, account_address
+        )
+
+    async def sign_transactions(
+        self, transactions: Sequence[AccountTransaction]
+    ) -> List[List[int]]:
+        """
+        Sign a batch of transactions without blocking the event loop.
+        Transactions are split evenly between the workers.
+
+        :param transactions: Transactions to sign.
+        :return: List of signatures, in the same order as transactions.
+        """
+        if not transactions:
+            return []
+
+        chunk_size = -(-len(transactions) // self.max_workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    _sign_transactions,
+                    self._id,
+                    self.chain_id,
+                    list(transactions[start : start + chunk_size]),
+                )
+                for start in range(0, len(transactions), chunk_size)
+            )
+        )
+        return [signature for chunk in chunks for signature in chunk]
+
+    def close(self):
+        """
+        Shuts down the workers, waiting for pending signatures.
+        """
+        self._executor.shutdown(wait=True)
+        _worker_private_keys.pop(self._id, None)
+
+    def __enter__(self) -> "PoolSigner":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _init_worker(signer_id: str, keys_queue: "multiprocessing.Queue"):
+    _worker_private_keys[signer_id] = keys_queue.get()
+
+
+def _sign_transactions(
+    signer_id: str, chain_id: ChainId, transactions: List[AccountTransaction]
+) -> List[List[int]]:
+    private_key = _worker_private_keys[signer_id]
+    signatures = []
+    for transaction in transactions:
+        tx_hash = transaction.calculate_hash(chain_id)
+        # pylint: disable=invalid-name
+        r, s = message_signature(msg_hash=tx_hash, priv_key=private_key)
+        signatures.append([r, s])
+    return signatures
+
+
+def _sign_message(
+    signer_id: str, typed_data: TypedData, account_address: int
+) -> List[int]:
+    msg_hash = typed_data.message_hash(account_address)
+    # pylint: disable=invalid-name
+    r, s = message_signature(
+        msg_hash=msg_hash, priv_key=_worker_private_keys[signer_id]
+    )
+    return [r, s]
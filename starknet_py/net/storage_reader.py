@@ -0,0 +1,185 @@
+import asyncio
+import itertools
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from starknet_py.cairo.data_types import (
+    BoolType,
+    CairoType,
+    FeltType,
+    NamedTupleType,
+    StructType,
+    TupleType,
+    UintType,
+    UnitType,
+)
+from starknet_py.hash.storage import get_storage_var_address
+from starknet_py.net.client_models import Hash, Tag
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import parse_address
+from starknet_py.serialization import CairoDataSerializer, serializer_for_type
+
+
+class StorageQuery(NamedTuple):
+    """
+    Storage variable read by :class:`StorageReader`.
+    """
+
+    contract_address: Hash  #: Address of the contract.
+    var_name: str  #: Name of the storage variable.
+    keys: Sequence[int] = ()
+    """Keys of the mapping, empty for a plain storage variable."""
+    cairo_type: Optional[CairoType] = None
+    """Type of the value, used to decode values taking multiple slots. Defaults to a single felt."""
+
+
+class StorageReader:
+    """
+    Reads many storage variables, of one or many contracts, at once.
+
+    Storage addresses are computed locally and values are fetched with JSON-RPC batch requests,
+    all at the same block. Values taking multiple slots (e.g. u256 or structs) occupy consecutive
+    addresses and are decoded with the Cairo serializers.
+    """
+
+    def __init__(
+        self,
+        client: FullNodeClient,
+        *,
+        batch_size: int = 100,
+        max_concurrent_requests: int = 5,
+    ):
+        """
+        :param client: Client used to fetch storage values.
+        :param batch_size: Number of storage slots fetched in a single request.
+        :param max_concurrent_requests: Maximal number of requests sent at the same time.
+        """
+        if batch_size <= 0:
+            raise ValueError("Argument batch_size must be greater than 0.")
+        if max_concurrent_requests <= 0:
+            raise ValueError("Argument max_concurrent_requests must be greater than 0.")
+
+        self.client = client
+        self.batch_size = batch_size
+        self.max_concurrent_requests = max_concurrent_requests
+
+    async def read(
+        self,
+        queries: Sequence[
+            Union[StorageQuery, Tuple[Hash, str], Tuple[Hash, str, Sequence[int]]]
+        ],
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> List[Any]:
+        """
+        Read values of storage variables.
+
+        Without a block, or at the ``"latest"`` block, the hash of the latest block is fetched first,
+        so that all values come from the same block even if a new one is produced in the meantime.
+
+        :param queries: Storage variables to read, as :class:`StorageQuery` or tuples of its fields.
+        :param block_hash: Block's hash or literals `"pending"` or `"latest"`.
+        :param block_number: Block's number or literals `"pending"` or `"latest"`.
+        :return: List of values, in the same order as queries.
+        """
+        if block_hash is not None and block_number is not None:
+            raise ValueError(
+                "Arguments block_hash and block_number are mutually exclusive."
+            )
+
+        queries = [StorageQuery(*query) for query in queries]
+        slots, slot_indices = self._get_slots(queries)
+        block_identifier = await self._pin_block(block_hash, block_number)
+        values = await self._fetch(slots, block_identifier)
+
+        serializers: Dict[int, CairoDataSerializer] = {}
+        results = []
+        for query, indices in zip(queries, slot_indices):
+            data = [values[index] for index in indices]
+            if query.cairo_type is None:
+                results.append(data[0])
+                continue
+
+            serializer = serializers.get(id(query.cairo_type))
+            if serializer is None:
+                serializer = serializer_for_type(query.cairo_type)
+                serializers[id(query.cairo_type)] = serializer
+            results.append(serializer.deserialize(data))
+        return results
+
+    @staticmethod
+    def _get_slots(
+        queries: List[StorageQuery],
+    ) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
+        # Slots read by many queries are fetched once
+        slots: Dict[Tuple[int, int], int] = {}
+        addresses: Dict[Tuple[str, Tuple[int, ...]], int] = {}
+        slot_indices = []
+        for query in queries:
+            size = (
+                _storage_size(query.cairo_type) if query.cairo_type is not None else 1
+            )
+            variable = (query.var_name, tuple(query.keys))
+            if variable not in addresses:
+                addresses[variable] = get_storage_var_address(
+                    query.var_name, *query.keys
+                )
+
+            contract_address = parse_address(query.contract_address)
+            indices = []
+            for offset in range(size):
+                slot = (contract_address, addresses[variable] + offset)
+                indices.append(slots.setdefault(slot, len(slots)))
+            slot_indices.append(indices)
+        return list(slots), slot_indices
+
+    async def _pin_block(
+        self,
+        block_hash: Optional[Union[Hash, Tag]],
+        block_number: Optional[Union[int, Tag]],
+    ) -> Dict[str, Any]:
+        block_id = block_hash if block_hash is not None else block_number
+        if block_id is not None and block_id != "latest":
+            return (
+                {"block_hash": block_hash}
+                if block_hash is not None
+                else {"block_number": block_number}
+            )
+
+        head = await self.client.get_block_hash_and_number()
+        return {"block_hash": head.block_hash}
+
+    async def _fetch(
+        self, slots: List[Tuple[int, int]], block_identifier: Dict[str, Any]
+    ) -> List[int]:
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def fetch_batch(batch: List[Tuple[int, int]]) -> List[int]:
+            async with semaphore:
+                return await self.client.get_storage_at_batch(batch, **block_identifier)
+
+        results = await asyncio.gather(
+            *(
+                fetch_batch(slots[start : start + self.batch_size])
+                for start in range(0, len(slots), self.batch_size)
+            )
+        )
+        return list(itertools.chain.from_iterable(results))
+
+
+def _storage_size(cairo_type: CairoType) -> int:
+    """
+    Number of consecutive storage slots taken by a value of the type.
+    """
+    if isinstance(cairo_type, (FeltType, BoolType)):
+        return 1
+    if isinstance(cairo_type, UintType):
+        return max(cairo_type.bits // 128, 1)
+    if isinstance(cairo_type, UnitType):
+        return 0
+    if isinstance(cairo_type, TupleType):
+        return sum(_storage_size(member) for member in cairo_type.types)
+    if isinstance(cairo_type, (NamedTupleType, StructType)):
+        return sum(_storage_size(member) for member in cairo_type.types.values())
+    raise ValueError(
+        f"Values of type {cairo_type} can't be read from storage, their size is not fixed."
+    )
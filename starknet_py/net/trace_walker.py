@@ -0,0 +1,348 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# Root invocations of a transaction trace, in the order they are executed.
+# The constructor of a deployed account runs before its validation.
+_ROOT_INVOCATIONS = (
+    "constructor_invocation",
+    "validate_invocation",
+    "execute_invocation",
+    "function_invocation",
+    "fee_transfer_invocation",
+)
+
+
+@dataclass(frozen=True)
+class TraceCall:
+    """
+    Function invocation found by :class:`TraceWalker`.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    transaction_index: int  #: Index of the transaction in the walked traces.
+    transaction_hash: Optional[int]
+    """Hash of the transaction, None for simulated transactions."""
+    invocation: str
+    """Root invocation the call belongs to, e.g. ``"execute_invocation"``."""
+    call_index: int
+    """Index of the call in the pre-order of all calls of the transaction."""
+    parent_index: int
+    """``call_index`` of the calling function, -1 for root invocations."""
+    depth: int  #: Depth of the call, 0 for root invocations.
+    caller_address: int
+    contract_address: int
+    class_hash: int
+    entry_point_selector: int
+    entry_point_type: str
+    call_type: str
+    calldata: List[int]
+    result: List[int]
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    """
+    Event emitted by a function invocation, found by :class:`TraceWalker`.
+    """
+
+    transaction_index: int  #: Index of the transaction in the walked traces.
+    transaction_hash: Optional[int]
+    """Hash of the transaction, None for simulated transactions."""
+    call_index: int  #: ``call_index`` of the emitting invocation.
+    contract_address: int  #: Address of the emitting contract.
+    order: int  #: Order of the event within the transaction.
+    keys: List[int]
+    data: List[int]
+
+
+@dataclass(frozen=True)
+class TraceMessage:
+    """
+    Message to L1 sent by a function invocation, found by :class:`TraceWalker`.
+    """
+
+    transaction_index: int  #: Index of the transaction in the walked traces.
+    transaction_hash: Optional[int]
+    """Hash of the transaction, None for simulated transactions."""
+    call_index: int  #: ``call_index`` of the sending invocation.
+    from_address: int
+    to_address: int
+    order: int  #: Order of the message within the transaction.
+    payload: List[int]
+
+
+@dataclass(frozen=True)
+class TraceStorageWrite:
+    """
+    Storage write from the state diff of a transaction, found by :class:`TraceWalker`.
+    """
+
+    transaction_index: int  #: Index of the transaction in the walked traces.
+    transaction_hash: Optional[int]
+    """Hash of the transaction, None for simulated transactions."""
+    contract_address: int
+    key: int
+    value: int
+
+
+TraceNode = Union[TraceCall, TraceEvent, TraceMessage, TraceStorageWrite]
+
+
+@dataclass
+class CallTable:
+    """
+    Calls of many transactions flattened into columns, one row per call.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    transaction_hashes: List[Optional[int]] = field(default_factory=list)
+    """Hashes of the walked transactions, indexed by ``transaction_index``."""
+    transaction_index: List[int] = field(default_factory=list)
+    call_index: List[int] = field(default_factory=list)
+    parent_index: List[int] = field(default_factory=list)
+    depth: List[int] = field(default_factory=list)
+    caller_address: List[int] = field(default_factory=list)
+    contract_address: List[int] = field(default_factory=list)
+    class_hash: List[int] = field(default_factory=list)
+    entry_point_selector: List[int] = field(default_factory=list)
+    calldata: List[List[int]] = field(default_factory=list)
+    result: List[List[int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.call_index)
+
+    def append(self, call: TraceCall):
+        """
+        Adds a row of the call.
+
+        :param call: Call to add.
+        """
+        self.transaction_index.append(call.transaction_index)
+        self.call_index.append(call.call_index)
+        self.parent_index.append(call.parent_index)
+        self.depth.append(call.depth)
+        self.caller_address.append(call.caller_address)
+        self.contract_address.append(call.contract_address)
+        self.class_hash.append(call.class_hash)
+        self.entry_point_selector.append(call.entry_point_selector)
+        self.calldata.append(call.calldata)
+        self.result.append(call.result)
+
+
+class TraceWalker:
+    """
+    Walks transaction traces as returned by the node, without building the whole trace objects.
+
+    Call trees are walked depth-first, in the order of execution. Only nodes of subscribed types
+    are yielded and only their fields are decoded, so filtering e.g. calls to a single selector
+    skips decoding calldata, events and messages of all other calls.
+
+    Traces can be obtained with
+    :meth:`~starknet_py.net.full_node_client.FullNodeClient.trace_block_transactions_raw`
+    or :meth:`~starknet_py.net.full_node_client.FullNodeClient.simulate_transactions_raw`.
+    """
+
+    def __init__(
+        self,
+        *,
+        calls: bool = True,
+        events: bool = False,
+        messages: bool = False,
+        storage_writes: bool = False,
+        contract_addresses: Optional[Iterable[int]] = None,
+        selectors: Optional[Iterable[int]] = None,
+        event_keys: Optional[Iterable[int]] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        :param calls: If True, yields function invocations.
+        :param events: If True, yields emitted events.
+        :param messages: If True, yields messages sent to L1.
+        :param storage_writes: If True, yields storage writes from state diffs of transactions.
+            State diffs are included in traces of simulated transactions only.
+        :param contract_addresses: If provided, yields only nodes of these contracts, i.e. calls to them,
+            events and messages they emit and writes to their storage.
+        :param selectors: If provided, yields only calls of these entry points.
+        :param event_keys: If provided, yields only events with the first key (the event selector) among these.
+        """
+        self.calls = calls
+        self.events = events
+        self.messages = messages
+        self.storage_writes = storage_writes
+        self.contract_addresses = _to_set(contract_addresses)
+        self.selectors = _to_set(selectors)
+        self.event_keys = _to_set(event_keys)
+
+    def walk(self, traces: List[dict]) -> Iterator[TraceNode]:
+        """
+        Walk traces, yielding subscribed nodes in the order of execution.
+
+        :param traces: List of block transaction traces (with ``transaction_hash`` and ``trace_root``),
+            simulated transactions (with ``transaction_trace``) or bare transaction traces.
+        :return: Iterator of nodes.
+        """
+        for transaction_index, (transaction_hash, trace) in enumerate(
+            _unwrap_traces(traces)
+        ):
+            yield from self._walk_transaction(
+                transaction_index, transaction_hash, trace
+            )
+
+    def flatten(self, traces: List[dict]) -> CallTable:
+        """
+        Flatten call trees of traces into a :class:`CallTable` of subscribed calls.
+
+        :param traces: Traces, as in :meth:`walk`.
+        :return: Table of calls.
+        """
+        table = CallTable()
+        for transaction_index, (transaction_hash, trace) in enumerate(
+            _unwrap_traces(traces)
+        ):
+            table.transaction_hashes.append(transaction_hash)
+            for node in self._walk_transaction(
+                transaction_index, transaction_hash, trace
+            ):
+                if isinstance(node, TraceCall):
+                    table.append(node)
+        return table
+
+    def _walk_transaction(
+        self, transaction_index: int, transaction_hash: Optional[int], trace: dict
+    ) -> Iterator[TraceNode]:
+        call_index = 0
+        for invocation in _ROOT_INVOCATIONS:
+            root = trace.get(invocation)
+            if root is None or "revert_reason" in root:
+                continue
+
+            # Stack of (invocation, parent call index, depth), children pushed in reverse
+            stack: List[Tuple[Dict[str, Any], int, int]] = [(root, -1, 0)]
+            while stack:
+                node, parent_index, depth = stack.pop()
+                yield from self._visit(
+                    node,
+                    transaction_index,
+                    transaction_hash,
+                    invocation,
+                    call_index,
+                    parent_index,
+                    depth,
+                )
+                stack.extend(
+                    (child, call_index, depth + 1) for child in reversed(node["calls"])
+                )
+                call_index += 1
+
+        if self.storage_writes and trace.get("state_diff") is not None:
+            yield from self._visit_state_diff(
+                transaction_index, transaction_hash, trace["state_diff"]
+            )
+
+    def _visit(
+        self,
+        node: Dict[str, Any],
+        transaction_index: int,
+        transaction_hash: Optional[int],
+        invocation: str,
+        call_index: int,
+        parent_index: int,
+        depth: int,
+    ) -> Iterator[TraceNode]:
+        # pylint: disable=too-many-arguments
+        contract_address = int(node["contract_address"], 16)
+        if (
+            self.contract_addresses is not None
+            and contract_address not in self.contract_addresses
+        ):
+            return
+
+        if self.calls:
+            selector = int(node["entry_point_selector"], 16)
+            if self.selectors is None or selector in self.selectors:
+                yield TraceCall(
+                    transaction_index=transaction_index,
+                    transaction_hash=transaction_hash,
+                    invocation=invocation,
+                    call_index=call_index,
+                    parent_index=parent_index,
+                    depth=depth,
+                    caller_address=int(node["caller_address"], 16),
+                    contract_address=contract_address,
+                    class_hash=int(node["class_hash"], 16),
+                    entry_point_selector=selector,
+                    entry_point_type=node["entry_point_type"],
+                    call_type=node["call_type"],
+                    calldata=_to_ints(node["calldata"]),
+                    result=_to_ints(node["result"]),
+                )
+
+        if self.events:
+            for event in node["events"]:
+                keys = event["keys"]
+                if self.event_keys is not None and (
+                    not keys or int(keys[0], 16) not in self.event_keys
+                ):
+                    continue
+                yield TraceEvent(
+                    transaction_index=transaction_index,
+                    transaction_hash=transaction_hash,
+                    call_index=call_index,
+                    contract_address=contract_address,
+                    order=event["order"],
+                    keys=_to_ints(keys),
+                    data=_to_ints(event["data"]),
+                )
+
+        if self.messages:
+            for message in node["messages"]:
+                yield TraceMessage(
+                    transaction_index=transaction_index,
+                    transaction_hash=transaction_hash,
+                    call_index=call_index,
+                    from_address=int(message["from_address"], 16),
+                    to_address=int(message["to_address"], 16),
+                    order=message["order"],
+                    payload=_to_ints(message["payload"]),
+                )
+
+    def _visit_state_diff(
+        self,
+        transaction_index: int,
+        transaction_hash: Optional[int],
+        state_diff: Dict[str, Any],
+    ) -> Iterator[TraceStorageWrite]:
+        for storage_diff in state_diff["storage_diffs"]:
+            contract_address = int(storage_diff["address"], 16)
+            if (
+                self.contract_addresses is not None
+                and contract_address not in self.contract_addresses
+            ):
+                continue
+
+            for entry in storage_diff["storage_entries"]:
+                yield TraceStorageWrite(
+                    transaction_index=transaction_index,
+                    transaction_hash=transaction_hash,
+                    contract_address=contract_address,
+                    key=int(entry["key"], 16),
+                    value=int(entry["value"], 16),
+                )
+
+
+def _to_set(values: Optional[Iterable[int]]) -> Optional[Set[int]]:
+    return set(values) if values is not None else None
+
+
+def _to_ints(values: List[str]) -> List[int]:
+    return [int(value, 16) for value in values]
+
+
+def _unwrap_traces(traces: List[dict]) -> Iterator[Tuple[Optional[int], dict]]:
+    for trace in traces:
+        if "trace_root" in trace:
+            yield int(trace["transaction_hash"], 16), trace["trace_root"]
+        elif "transaction_trace" in trace:
+            yield None, trace["transaction_trace"]
+        else:
+            yield None, trace
@@ -1,19 +1,41 @@
 from __future__ import annotations
 
-import random
-from typing import List, NamedTuple, Optional, Union, cast
+import secrets
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
 
-from starknet_py.abi.v0 import AbiParser
 from starknet_py.common import int_from_hex
 from starknet_py.constants import DEFAULT_DEPLOYER_ADDRESS, FIELD_PRIME
-from starknet_py.hash.address import compute_address
+from starknet_py.hash.address import AddressParams, compute_address, compute_addresses
+from starknet_py.hash.salt_search import (
+    AddressPredicate,
+    SaltSearchResult,
+    search_salts,
+)
 from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.hash.utils import pedersen_hash
 from starknet_py.net.client_models import Call, Hash
 from starknet_py.net.models import AddressRepresentation, parse_address
-from starknet_py.serialization import serializer_for_function
+from starknet_py.serialization import (
+    FunctionSerializationAdapter,
+    serializer_for_function,
+)
 from starknet_py.utils.constructor_args_translator import translate_constructor_args
 
+if TYPE_CHECKING:
+    from starknet_py.abi.v0 import Abi
+
 
 class ContractDeployment(NamedTuple):
     """
@@ -110,7 +132,7 @@ class Deployer:
         salt = cast(int, _get_random_salt() if salt is None else salt)
         class_hash = int_from_hex(class_hash)
 
-        calldata = _deployer_serializer.serialize(
+        calldata = _get_deployer_serializer().serialize(
             classHash=class_hash,
             salt=salt,
             unique=int(self._unique),
@@ -127,61 +149,143 @@ class Deployer:
 
         return ContractDeployment(call=call, address=address)
 
+    def compute_addresses(
+        self,
+        params: Iterable[AddressParams],
+        *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[int]:
+        """
+        Computes addresses of many contracts deployed through the UDC, the same as addresses returned by
+        :meth:`create_contract_deployment_raw`.
+
+        :param params: Tuples of class hash, plain Cairo constructor calldata and salt of contracts.
+        :param executor: Optional executor (e.g. ProcessPoolExecutor) computing chunks of addresses in parallel.
+        :param chunk_size: Number of addresses computed in a single task of the executor.
+        :return: Iterator of addresses in the same order as params.
+        """
+        return compute_addresses(
+            (
+                (class_hash, constructor_calldata, self._deployment_salt(salt))
+                for class_hash, constructor_calldata, salt in params
+            ),
+            deployer_address=self._deployment_deployer_address(),
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+
+    def search_salts(
+        self,
+        predicate: AddressPredicate,
+        class_hash: Hash,
+        *,
+        raw_calldata: Optional[List[int]] = None,
+        matches_count: int = 1,
+        start_salt: int = 0,
+        max_salts: Optional[int] = None,
+        processes: Optional[int] = None,
+        progress: Optional[Callable[[int, float], None]] = None,
+    ) -> SaltSearchResult:
+        # pylint: disable=too-many-arguments
+        """
+        Searches salts with which a contract deployed through the UDC gets an address matching the predicate.
+        Found salts can be passed to :meth:`create_contract_deployment_raw`.
+
+        :param predicate: Function returning True for matching addresses, e.g.
+            :class:`~starknet_py.hash.salt_search.AddressPattern`.
+        :param class_hash: The class_hash of the contract to be deployed.
+        :param raw_calldata: Plain Cairo constructor args of the contract to be deployed.
+        :param matches_count: Number of matches to find.
+        :param start_salt: First checked salt.
+        :param max_salts: Maximal number of checked salts.
+        :param processes: Number of processes. Defaults to the number of CPUs.
+        :param progress: Optional function periodically called with the number of checked salts and salts per second.
+        :return: SaltSearchResult with found salts and addresses.
+        """
+        return search_salts(
+            predicate,
+            class_hash=int_from_hex(class_hash),
+            constructor_calldata=raw_calldata or [],
+            deployer_address=self._deployment_deployer_address(),
+            account_address=(
+                parse_address(self.account_address)
+                if self.account_address is not None
+                else None
+            ),
+            matches_count=matches_count,
+            start_salt=start_salt,
+            max_salts=max_salts,
+            processes=processes,
+            progress=progress,
+        )
+
     def _compute_address(
         self, salt: int, class_hash: int, constructor_calldata: List[int]
     ) -> int:
-        deployer_address = self.deployer_address if self._unique else 0
-        salt = (
-            pedersen_hash(parse_address(self.account_address), salt)
-            if self.account_address is not None
-            else salt
-        )
         return compute_address(
             class_hash=class_hash,
             constructor_calldata=constructor_calldata,
-            salt=salt,
-            deployer_address=deployer_address,
+            salt=self._deployment_salt(salt),
+            deployer_address=self._deployment_deployer_address(),
+        )
+
+    def _deployment_deployer_address(self) -> int:
+        return self.deployer_address if self._unique else 0
+
+    def _deployment_salt(self, salt: int) -> int:
+        return (
+            pedersen_hash(parse_address(self.account_address), salt)
+            if self.account_address is not None
+            else salt
         )
 
 
 def _get_random_salt() -> int:
-    return random.Random().randrange(0, FIELD_PRIME)
-
-
-_deployer_abi = AbiParser(
-    [
-        {
-            "data": [
-                {"name": "address", "type": "felt"},
-                {"name": "deployer", "type": "felt"},
-                {"name": "unique", "type": "felt"},
-                {"name": "classHash", "type": "felt"},
-                {"name": "calldata_len", "type": "felt"},
-                {"name": "calldata", "type": "felt*"},
-                {"name": "salt", "type": "felt"},
-            ],
-            "keys": [],
-            "name": "ContractDeployed",
-            "type": "event",
-        },
-        {
-            "inputs": [
-                {"name": "classHash", "type": "felt"},
-                {"name": "salt", "type": "felt"},
-                {"name": "unique", "type": "felt"},
-                {"name": "calldata_len", "type": "felt"},
-                {"name": "calldata", "type": "felt*"},
-            ],
-            "name": "deployContract",
-            "outputs": [{"name": "address", "type": "felt"}],
-            "type": "function",
-        },
-    ]
-).parse()
-
-_deployer_serializer = serializer_for_function(
-    _deployer_abi.functions["deployContract"]
-)
+    return secrets.randbelow(FIELD_PRIME)
+
+
+# ABI of the UDC, parsed when the first contract deployment is created
+_DEPLOYER_ABI = [
+    {
+        "data": [
+            {"name": "address", "type": "felt"},
+            {"name": "deployer", "type": "felt"},
+            {"name": "unique", "type": "felt"},
+            {"name": "classHash", "type": "felt"},
+            {"name": "calldata_len", "type": "felt"},
+            {"name": "calldata", "type": "felt*"},
+            {"name": "salt", "type": "felt"},
+        ],
+        "keys": [],
+        "name": "ContractDeployed",
+        "type": "event",
+    },
+    {
+        "inputs": [
+            {"name": "classHash", "type": "felt"},
+            {"name": "salt", "type": "felt"},
+            {"name": "unique", "type": "felt"},
+            {"name": "calldata_len", "type": "felt"},
+            {"name": "calldata", "type": "felt*"},
+        ],
+        "name": "deployContract",
+        "outputs": [{"name": "address", "type": "felt"}],
+        "type": "function",
+    },
+]
+
+
+@lru_cache(maxsize=None)
+def _get_deployer_abi() -> Abi:
+    from starknet_py.abi.v0 import AbiParser  # pylint: disable=import-outside-toplevel
+
+    return AbiParser(_DEPLOYER_ABI).parse()
+
+
+@lru_cache(maxsize=None)
+def _get_deployer_serializer() -> FunctionSerializationAdapter:
+    return serializer_for_function(_get_deployer_abi().functions["deployContract"])
 
 
 def _is_list_of_ints_or_strings(data: Union[List, dict]) -> bool:
@@ -1,9 +1,23 @@
+import asyncio
 import json
 import re
+import time
 from enum import Enum
-from typing import AsyncGenerator, List, Tuple, TypedDict, Union, cast
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from starknet_py.abi.v0.shape import AbiDictList
+from starknet_py.class_store import ClassStore
 from starknet_py.constants import (
     RPC_CLASS_HASH_NOT_FOUND_ERROR,
     RPC_CONTRACT_ERROR,
@@ -53,6 +67,100 @@ class ImplementationType(Enum):
     ADDRESS = "address"
 
 
+class AbiResolverCache:
+    """
+    Cache which can be shared between :class:`ContractAbiResolver` instances.
+
+    ABIs are stored by class hash for the lifetime of the cache, as classes never change.
+    Implementations of proxies are stored by proxy address for ``implementation_ttl`` seconds,
+    as proxies can be upgraded. Concurrent requests for the same class are sent only once.
+
+    A cache shouldn't be shared between clients connected to different networks.
+    """
+
+    def __init__(self, implementation_ttl: float = 60.0):
+        """
+        :param implementation_ttl: Number of seconds after which resolved proxy implementation expires.
+        """
+        self.implementation_ttl = implementation_ttl
+        self._abis: Dict[int, Tuple[AbiDictList, int]] = {}
+        self._pending_abis: Dict[
+            int, "asyncio.Future[Optional[Tuple[AbiDictList, int]]]"
+        ] = {}
+        self._implementations: Dict[int, Tuple[float, int, ImplementationType]] = {}
+
+    async def get_abi(
+        self,
+        class_hash: int,
+        fetch: Callable[[int], Awaitable[Tuple[AbiDictList, int]]],
+    ) -> Tuple[AbiDictList, int]:
+        """
+        Returns abi and cairo version of a class, calling ``fetch`` only if the class is not cached
+        and is not being fetched already.
+
+        :param class_hash: Hash of the class.
+        :param fetch: Function fetching abi and cairo version of the class with given hash.
+        """
+        if class_hash in self._abis:
+            return self._abis[class_hash]
+
+        if class_hash in self._pending_abis:
+            result = await asyncio.shield(self._pending_abis[class_hash])
+            if result is None:
+                # The caller fetching the class was cancelled, so it has to be fetched again
+                return await self.get_abi(class_hash, fetch)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_abis[class_hash] = future
+        try:
+            result = await fetch(class_hash)
+        except asyncio.CancelledError:
+            # Only this caller is cancelled, the callers waiting for the result fetch the class again
+            future.set_result(None)
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Retrieve the exception so that it isn't reported as never retrieved
+            future.exception()
+            raise
+        finally:
+            del self._pending_abis[class_hash]
+
+        self._abis[class_hash] = result
+        future.set_result(result)
+        return result
+
+    def get_implementation(
+        self, address: int
+    ) -> Optional[Tuple[int, ImplementationType]]:
+        """
+        :return: Implementation of proxy at ``address`` and its type or None if it is not cached or has expired.
+        """
+        cached = self._implementations.get(address)
+        if cached is None:
+            return None
+
+        expires_at, implementation, implementation_type = cached
+        if time.monotonic() >= expires_at:
+            del self._implementations[address]
+            return None
+        return implementation, implementation_type
+
+    def set_implementation(
+        self, address: int, implementation: int, implementation_type: ImplementationType
+    ):
+        self._implementations[address] = (
+            time.monotonic() + self.implementation_ttl,
+            implementation,
+            implementation_type,
+        )
+
+    def clear(self):
+        self._abis.clear()
+        self._implementations.clear()
+
+
 class ContractAbiResolver:
     """
     Class for resolving abi of a contract
@@ -63,15 +171,60 @@ class ContractAbiResolver:
         address: Address,
         client: Client,
         proxy_config: ProxyConfig,
+        cache: Optional[AbiResolverCache] = None,
+        class_store: Optional[ClassStore] = None,
     ):
         """
         :param address: Contract's address
         :param client: Client used for resolving abi
         :param proxy_config: Proxy config for resolving proxy
+        :param cache: Optional cache of abis and proxy implementations
+        :param class_store: Optional persistent store consulted before fetching classes
         """
         self.address = address
         self.client = client
         self.proxy_config = proxy_config
+        self.cache = cache
+        self.class_store = class_store
+
+    @staticmethod
+    async def resolve_many(
+        addresses: List[Address],
+        client: Client,
+        proxy_config: ProxyConfig,
+        cache: Optional[AbiResolverCache] = None,
+        max_concurrency: int = 20,
+        class_store: Optional[ClassStore] = None,
+    ) -> List[Tuple[AbiDictList, int]]:
+        """
+        Returns abis and cairo versions of many contracts. Classes shared between contracts are fetched once.
+
+        :param addresses: Contracts' addresses
+        :param client: Client used for resolving abi
+        :param proxy_config: Proxy config for resolving proxy
+        :param cache: Optional cache of abis and proxy implementations. If not provided, a cache is created
+            for the duration of this call.
+        :param max_concurrency: Maximal number of contracts resolved at the same time.
+        :param class_store: Optional persistent store consulted before fetching classes.
+        :return: List of abis and cairo versions in the same order as addresses.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("Argument max_concurrency must be greater than 0.")
+
+        cache = cache if cache is not None else AbiResolverCache()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _resolve(address: Address) -> Tuple[AbiDictList, int]:
+            async with semaphore:
+                return await ContractAbiResolver(
+                    address=address,
+                    client=client,
+                    proxy_config=proxy_config,
+                    cache=cache,
+                    class_store=class_store,
+                ).resolve()
+
+        return list(await asyncio.gather(*(_resolve(address) for address in addresses)))
 
     async def resolve(self) -> Tuple[AbiDictList, int]:
         """
@@ -93,14 +246,8 @@ class ContractAbiResolver:
         :raises ContractNotFoundError: when contract could not be found at address
         :raises AbiNotFoundError: when abi is not present in contract class at address
         """
-        contract_class = await _get_class_at(address=self.address, client=self.client)
-
-        if contract_class.abi is None:
-            raise AbiNotFoundError()
-
-        return self._get_abi_from_contract_class(
-            contract_class
-        ), self._get_cairo_version(contract_class)
+        class_hash = await _get_class_hash_at(address=self.address, client=self.client)
+        return await self._get_abi_by_class_hash(class_hash)
 
     async def resolve_abi(self) -> Tuple[AbiDictList, int]:
         """
@@ -110,35 +257,83 @@ class ContractAbiResolver:
         :raises ProxyResolutionError: when given ProxyChecks were not sufficient to resolve proxy
         :raises AbiNotFoundError: when abi is not present in proxied contract class at address
         """
+        cached = (
+            self.cache.get_implementation(self.address)
+            if self.cache is not None
+            else None
+        )
+        if cached is not None:
+            abi = await self._get_abi_for_implementation(*cached)
+            if abi is not None:
+                return abi
+
         implementation_generator = self._get_implementation_from_proxy()
 
         # implementation is either a class_hash or address
-        async for implementation, implementation_type in implementation_generator:
-            try:
-                if implementation_type == ImplementationType.CLASS_HASH:
-                    contract_class = await self.client.get_class_by_hash(implementation)
-                else:
-                    contract_class = await _get_class_at(
-                        address=implementation, client=self.client
-                    )
-
-                if contract_class.abi is None:
-                    # Some contract_class has been found, but it does not have abi
-                    raise AbiNotFoundError()
-
-                return self._get_abi_from_contract_class(
-                    contract_class
-                ), self._get_cairo_version(contract_class)
-            except ClientError as err:
-                if not (
-                    "is not declared" in err.message
-                    or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
-                    or isinstance(err, ContractNotFoundError)
-                ):
-                    raise err
+        try:
+            async for implementation, implementation_type in implementation_generator:
+                abi = await self._get_abi_for_implementation(
+                    implementation, implementation_type
+                )
+                if abi is not None:
+                    if self.cache is not None:
+                        self.cache.set_implementation(
+                            self.address, implementation, implementation_type
+                        )
+                    return abi
+        finally:
+            # Cancels proxy checks that are still running
+            await implementation_generator.aclose()
 
         raise ProxyResolutionError(self.proxy_config.get("proxy_checks", []))
 
+    async def _get_abi_for_implementation(
+        self, implementation: int, implementation_type: ImplementationType
+    ) -> Optional[Tuple[AbiDictList, int]]:
+        """
+        :return: Abi and cairo version of the implementation or None if implementation doesn't exist.
+        """
+        try:
+            if implementation_type == ImplementationType.CLASS_HASH:
+                class_hash = implementation
+            else:
+                class_hash = await _get_class_hash_at(
+                    address=implementation, client=self.client
+                )
+            return await self._get_abi_by_class_hash(class_hash)
+        except ClientError as err:
+            if not (
+                "is not declared" in err.message
+                or err.code == RPC_CLASS_HASH_NOT_FOUND_ERROR
+                or isinstance(err, ContractNotFoundError)
+            ):
+                raise err
+        return None
+
+    async def _get_abi_by_class_hash(self, class_hash: int) -> Tuple[AbiDictList, int]:
+        if self.cache is None:
+            return await self._fetch_abi(class_hash)
+        return await self.cache.get_abi(class_hash, self._fetch_abi)
+
+    async def _fetch_abi(self, class_hash: int) -> Tuple[AbiDictList, int]:
+        if self.class_store is not None:
+            stored = self.class_store.get_abi(class_hash)
+            if stored is not None:
+                return stored
+
+        contract_class = await self.client.get_class_by_hash(class_hash)
+
+        if contract_class.abi is None:
+            # Some contract_class has been found, but it does not have abi
+            raise AbiNotFoundError()
+
+        if self.class_store is not None:
+            self.class_store.put_class(class_hash, contract_class)
+
+        return self._get_abi_from_contract_class(
+            contract_class
+        ), self._get_cairo_version(contract_class)
+
     @staticmethod
     def _get_cairo_version(
         contract_class: Union[DeprecatedContractClass, SierraContractClass]
@@ -158,36 +353,59 @@ class ContractAbiResolver:
     async def _get_implementation_from_proxy(
         self,
     ) -> AsyncGenerator[Tuple[int, ImplementationType], None]:
-        proxy_checks = self.proxy_config.get("proxy_checks", [])
-        for proxy_check in proxy_checks:
-            try:
-                implementation = await proxy_check.implementation_hash(
-                    address=self.address, client=self.client
+        # All checks run concurrently, but implementations are yielded in the order of proxy checks,
+        # so that the result doesn't depend on which check finishes first.
+        lookups: List[Tuple["asyncio.Future[Optional[int]]", ImplementationType]] = []
+        for proxy_check in self.proxy_config.get("proxy_checks", []):
+            hash_check = proxy_check.implementation_hash(
+                address=self.address, client=self.client
+            )
+            address_check = proxy_check.implementation_address(
+                address=self.address, client=self.client
+            )
+            lookups.append(
+                (
+                    asyncio.ensure_future(self._run_proxy_check(hash_check)),
+                    ImplementationType.CLASS_HASH,
                 )
-                if implementation is not None:
-                    yield implementation, ImplementationType.CLASS_HASH
-
-                implementation = await proxy_check.implementation_address(
-                    address=self.address, client=self.client
+            )
+            lookups.append(
+                (
+                    asyncio.ensure_future(self._run_proxy_check(address_check)),
+                    ImplementationType.ADDRESS,
                 )
+            )
+
+        try:
+            for lookup, implementation_type in lookups:
+                implementation = await lookup
                 if implementation is not None:
-                    yield implementation, ImplementationType.ADDRESS
-            except ClientError as err:
-                err_msg = (
-                    r"(Entry point ((0x[0-9a-f]+)|(EntryPointSelector\(StarkFelt\(\"0x[0-9a-f]+)\"\)\))"
-                    r" not found in contract)|(is not declared)|(is not deployed)"
-                )
-                if not (
-                    re.search(err_msg, err.message, re.IGNORECASE)
-                    or err.code
-                    in [
-                        RPC_CLASS_HASH_NOT_FOUND_ERROR,
-                        RPC_CONTRACT_NOT_FOUND_ERROR,
-                        RPC_CONTRACT_ERROR,
-                        RPC_INVALID_MESSAGE_SELECTOR_ERROR,  # removed in RPC v0.3.0, backwards compatibility for nodes
-                    ]
-                ):
-                    raise err
+                    yield implementation, implementation_type
+        finally:
+            for lookup, _ in lookups:
+                lookup.cancel()
+
+    @staticmethod
+    async def _run_proxy_check(check: Awaitable[Optional[int]]) -> Optional[int]:
+        try:
+            return await check
+        except ClientError as err:
+            err_msg = (
+                r"(Entry point ((0x[0-9a-f]+)|(EntryPointSelector\(StarkFelt\(\"0x[0-9a-f]+)\"\)\))"
+                r" not found in contract)|(is not declared)|(is not deployed)"
+            )
+            if not (
+                re.search(err_msg, err.message, re.IGNORECASE)
+                or err.code
+                in [
+                    RPC_CLASS_HASH_NOT_FOUND_ERROR,
+                    RPC_CONTRACT_NOT_FOUND_ERROR,
+                    RPC_CONTRACT_ERROR,
+                    RPC_INVALID_MESSAGE_SELECTOR_ERROR,  # removed in RPC v0.3.0, backwards compatibility for nodes
+                ]
+            ):
+                raise err
+        return None
 
 
 class AbiNotFoundError(Exception):
@@ -216,12 +434,9 @@ class ProxyResolutionError(Exception):
         super().__init__(self.message)
 
 
-async def _get_class_at(
-    address: Address, client: Client
-) -> Union[DeprecatedContractClass, SierraContractClass]:
+async def _get_class_hash_at(address: Address, client: Client) -> int:
     try:
-        contract_class_hash = await client.get_class_hash_at(contract_address=address)
-        contract_class = await client.get_class_by_hash(class_hash=contract_class_hash)
+        return await client.get_class_hash_at(contract_address=address)
     except ClientError as err:
         if (
             "is not deployed" in err.message
@@ -230,5 +445,3 @@ async def _get_class_at(
         ):
             raise ContractNotFoundError(address=address) from err
         raise err
-
-    return contract_class
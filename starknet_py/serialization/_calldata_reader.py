@@ -29,12 +29,36 @@ class CalldataReader:
         if size < 1:
             raise ValueError("size must be greater than 0")
 
+        self._ensure_available(size)
+        data = self._data[self._position : self._position + size]
+        self._position += size
+        return data
+
+    def read_one(self) -> int:
+        """
+        Reads a single value without creating an intermediate list.
+        """
+        self._ensure_available(1)
+        value = self._data[self._position]
+        self._position += 1
+        return value
+
+    def peek(self, size: int) -> CairoData:
+        """
+        Returns next `size` values without moving the cursor. Use together with `skip` to read values
+        in bulk only after they have been validated.
+        """
+        self._ensure_available(size)
+        return self._data[self._position : self._position + size]
+
+    def skip(self, size: int):
+        self._ensure_available(size)
+        self._position += size
+
+    def _ensure_available(self, size: int):
         if size > self.remaining_len:
             raise OutOfBoundsError(
                 position=self._position,
                 requested_size=size,
                 remaining_size=self.remaining_len,
             )
-        data = self._data[self._position : self._position + size]
-        self._position += size
-        return data
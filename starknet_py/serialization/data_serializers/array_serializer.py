@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Generator, List
+from typing import Generator, List, Optional, Tuple
 
+from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization._context import (
     DeserializationContext,
     SerializationContext,
@@ -12,6 +13,13 @@ from starknet_py.serialization.data_serializers._common import (
 from starknet_py.serialization.data_serializers.cairo_data_serializer import (
     CairoDataSerializer,
 )
+from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.data_serializers.uint256_serializer import (
+    Uint256Serializer,
+)
+from starknet_py.serialization.data_serializers.uint_serializer import UintSerializer
+
+U128_UPPER_BOUND = 2**128
 
 
 @dataclass
@@ -30,7 +38,11 @@ class ArraySerializer(CairoDataSerializer[List, List]):
 
     def deserialize_with_context(self, context: DeserializationContext) -> List:
         with context.push_entity("len"):
-            [size] = context.reader.read(1)
+            size = context.reader.read_one()
+
+        result = self._deserialize_in_bulk(context, size)
+        if result is not None:
+            return result
 
         return deserialize_to_list([self.inner_serializer] * size, context)
 
@@ -41,3 +53,48 @@ class ArraySerializer(CairoDataSerializer[List, List]):
         yield from serialize_from_list(
             [self.inner_serializer] * len(value), context, value
         )
+
+    def _deserialize_in_bulk(
+        self, context: DeserializationContext, size: int
+    ) -> Optional[List[int]]:
+        """
+        Fast path for arrays of felts and uints. Elements are validated and decoded in a single pass over the
+        calldata, without going through the context of every element.
+
+        Returns None if the fast path can't be used. In that case the reader is left untouched, so that the generic
+        path can deserialize the data and report a precise error if something is wrong.
+        """
+        layout = self._bulk_layout()
+        if layout is None or size == 0:
+            return None
+
+        width, upper_bound = layout
+        if size * width > context.reader.remaining_len:
+            return None
+
+        values = context.reader.peek(size * width)
+        if not all(0 <= value < upper_bound for value in values):
+            return None
+
+        context.reader.skip(size * width)
+        if width == 1:
+            return values
+
+        values_iter = iter(values)
+        return [low + (high << 128) for low, high in zip(values_iter, values_iter)]
+
+    def _bulk_layout(self) -> Optional[Tuple[int, int]]:
+        """
+        :return: number of values taken by a single element and exclusive upper bound of each of these values or
+            None if elements can't be deserialized in bulk.
+        """
+        inner = self.inner_serializer
+        if isinstance(inner, FeltSerializer):
+            return 1, FIELD_PRIME
+        if isinstance(inner, Uint256Serializer):
+            return 2, U128_UPPER_BOUND
+        if isinstance(inner, UintSerializer):
+            if inner.bits < 256:
+                return 1, 2**inner.bits
+            return 2, U128_UPPER_BOUND
+        return None
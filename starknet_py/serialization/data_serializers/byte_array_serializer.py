@@ -30,15 +30,15 @@ class ByteArraySerializer(CairoDataSerializer[str, str]):
 
     def deserialize_with_context(self, context: DeserializationContext) -> str:
         with context.push_entity("data_array_len"):
-            [size] = context.reader.read(1)
+            size = context.reader.read_one()
 
         data = deserialize_to_list([FeltSerializer()] * size, context)
 
         with context.push_entity("pending_word"):
-            [pending_word] = context.reader.read(1)
+            pending_word = context.reader.read_one()
 
         with context.push_entity("pending_word_len"):
-            [pending_word_len] = context.reader.read(1)
+            pending_word_len = context.reader.read_one()
 
         pending_word = decode_shortstring(pending_word)
         context.ensure_valid_value(
@@ -34,7 +34,7 @@ class EnumSerializer(CairoDataSerializer[Union[Dict, TupleDataclass], TupleDatac
     def deserialize_with_context(
         self, context: DeserializationContext
     ) -> TupleDataclass:
-        [variant_index] = context.reader.read(1)
+        variant_index = context.reader.read_one()
         variant_name, serializer = self._get_variant(variant_index)
 
         with context.push_entity("enum.variant: " + variant_name):
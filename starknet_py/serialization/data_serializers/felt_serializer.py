@@ -21,7 +21,7 @@ class FeltSerializer(CairoDataSerializer[int, int]):
     """
 
     def deserialize_with_context(self, context: DeserializationContext) -> int:
-        [val] = context.reader.read(1)
+        val = context.reader.read_one()
         self._ensure_felt(context, val)
         return val
 
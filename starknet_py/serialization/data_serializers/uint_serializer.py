@@ -41,7 +41,7 @@ class UintSerializer(CairoDataSerializer[Union[int, Uint256Dict], int]):
 
     def deserialize_with_context(self, context: DeserializationContext) -> int:
         if self.bits < 256:
-            (uint,) = context.reader.read(1)
+            uint = context.reader.read_one()
             with context.push_entity("uint" + str(self.bits)):
                 self._ensure_valid_uint(uint, context, self.bits)
 
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from starknet_py.abi.v0 import Abi as AbiV0
+from starknet_py.abi.v1 import Abi as AbiV1
+from starknet_py.abi.v2 import Abi as AbiV2
+from starknet_py.abi.v2.shape import FLAT_KIND, KEY_KIND, NESTED_KIND
+from starknet_py.cairo.data_types import CairoType, EventType
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.serialization._context import DeserializationContext
+from starknet_py.serialization.data_serializers._common import deserialize_to_dict
+from starknet_py.serialization.data_serializers.cairo_data_serializer import (
+    CairoDataSerializer,
+)
+from starknet_py.serialization.factory import serializer_for_payload
+
+if TYPE_CHECKING:
+    # Importing at runtime would create a cycle: client_models -> serialization.
+    from starknet_py.net.client_models import Event
+
+
+@dataclass
+class DecodedEvent:
+    """
+    Dataclass representing an event decoded with a contract's ABI.
+    """
+
+    name: str  #: Name of the event as defined in the ABI.
+    data: Dict[str, Any]  #: Values of all event members (both keys and data).
+    event: Event  #: Decoded event.
+
+
+@dataclass
+class _EventEntry:
+    name: str
+    members: List[str]
+    keys_serializers: OrderedDict[str, CairoDataSerializer]
+    data_serializers: OrderedDict[str, CairoDataSerializer]
+
+
+class EventDecoder:
+    """
+    Decodes events emitted by a contract using its parsed ABI.
+
+    Selectors of all events (including events of embedded components) are resolved once, when the decoder
+    is created. Decoding an event is then a single dictionary lookup followed by deserialization
+    of its keys and data. Events that are not defined in the ABI are skipped.
+    """
+
+    def __init__(self, abi: Union[AbiV0, AbiV1, AbiV2]):
+        """
+        :param abi: Parsed ABI of the contract that emitted events.
+        """
+        self._index: Dict[Tuple[int, ...], _EventEntry] = {}
+
+        if isinstance(abi, AbiV2):
+            self._index_abi_v2(abi)
+        elif isinstance(abi, AbiV1):
+            for event in abi.events.values():
+                self._add_event(event.name, event.inputs, {}, (_selector(event.name),))
+        else:
+            for event in abi.events.values():
+                self._add_event(event.name, event.data, {}, (_selector(event.name),))
+
+        # Lengths of selector paths in keys, the shortest first
+        self._depths = sorted({len(path) for path in self._index})
+
+    def decode(self, event: Event) -> Optional[DecodedEvent]:
+        """
+        Decode a single event.
+
+        :param event: Event to decode.
+        :return: DecodedEvent or None if the event is not defined in the ABI.
+        :raises InvalidValueException: when the event matches the ABI but its payload can't be deserialized.
+        """
+        keys = event.keys
+        for depth in self._depths:
+            entry = self._index.get(tuple(keys[:depth]))
+            if entry is not None:
+                return self._decode_entry(entry, event, depth)
+
+        return None
+
+    def decode_many(self, events: Iterable[Event]) -> List[DecodedEvent]:
+        """
+        Decode a batch of events, skipping the ones that are not defined in the ABI.
+
+        :param events: Events to decode.
+        :return: List of decoded events in the original order.
+        """
+        decoded_events = []
+        for event in events:
+            decoded = self.decode(event)
+            if decoded is not None:
+                decoded_events.append(decoded)
+        return decoded_events
+
+    async def decode_stream(
+        self, events: AsyncIterable[Event]
+    ) -> AsyncIterator[DecodedEvent]:
+        """
+        Decode events as they arrive, skipping the ones that are not defined in the ABI.
+
+        :param events: Asynchronous iterable of events.
+        :return: Asynchronous iterator of decoded events.
+        """
+        async for event in events:
+            decoded = self.decode(event)
+            if decoded is not None:
+                yield decoded
+
+    def decode_parallel(
+        self, events: Sequence[Event], executor: Executor, chunk_size: int = 1000
+    ) -> List[DecodedEvent]:
+        """
+        Decode a large batch of events in chunks using the provided executor, e.g. a ProcessPoolExecutor.
+        Events that are not defined in the ABI are skipped.
+
+        :param events: Events to decode.
+        :param executor: Executor running the decoding.
+        :param chunk_size: Number of events decoded in a single task.
+        :return: List of decoded events in the original order.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Argument chunk_size must be greater than 0.")
+
+        chunks = [
+            events[start : start + chunk_size]
+            for start in range(0, len(events), chunk_size)
+        ]
+        return [
+            decoded
+            for decoded_chunk in executor.map(self.decode_many, chunks)
+            for decoded in decoded_chunk
+        ]
+
+    @staticmethod
+    def _decode_entry(entry: _EventEntry, event: Event, depth: int) -> DecodedEvent:
+        values = {}
+        with DeserializationContext.create(event.keys[depth:]) as context:
+            values.update(deserialize_to_dict(entry.keys_serializers, context))
+        with DeserializationContext.create(event.data) as context:
+            values.update(deserialize_to_dict(entry.data_serializers, context))
+
+        return DecodedEvent(
+            name=entry.name,
+            data={name: values[name] for name in entry.members},
+            event=event,
+        )
+
+    def _index_abi_v2(self, abi: AbiV2):
+        nested_events = {
+            variant_type.name
+            for event in abi.events.values()
+            if _is_enum_event(event)
+            for variant_type in event.types.values()
+            if isinstance(variant_type, EventType)
+        }
+
+        # Only events which are not variants of other events can be emitted directly
+        for event in abi.events.values():
+            if event.name in nested_events:
+                continue
+            if _is_enum_event(event):
+                self._index_enum_event(event, ())
+            else:
+                self._add_event(
+                    event.name, event.types, event.kinds, (_selector(event.name),)
+                )
+
+    def _index_enum_event(self, event: EventType, path: Tuple[int, ...]):
+        for variant_name, variant_type in event.types.items():
+            if not isinstance(variant_type, EventType):
+                continue
+
+            # Nested variants add their selector to keys, flat ones pass keys to the inner event
+            variant_path = (
+                path
+                if event.kinds[variant_name] == FLAT_KIND
+                else (*path, get_selector_from_name(variant_name))
+            )
+            if _is_enum_event(variant_type):
+                self._index_enum_event(variant_type, variant_path)
+            elif variant_path:
+                self._add_event(
+                    variant_type.name,
+                    variant_type.types,
+                    variant_type.kinds,
+                    variant_path,
+                )
+
+    def _add_event(
+        self,
+        name: str,
+        members: Dict[str, CairoType],
+        kinds: Dict[str, str],
+        path: Tuple[int, ...],
+    ):
+        keys_serializer = serializer_for_payload(
+            {
+                member: cairo_type
+                for member, cairo_type in members.items()
+                if kinds.get(member) == KEY_KIND
+            }
+        )
+        data_serializer = serializer_for_payload(
+            {
+                member: cairo_type
+                for member, cairo_type in members.items()
+                if kinds.get(member) != KEY_KIND
+            }
+        )
+        self._index[path] = _EventEntry(
+            name=name,
+            members=[
+                member
+                for member in members
+                if member in keys_serializer.serializers
+                or member in data_serializer.serializers
+            ],
+            keys_serializers=keys_serializer.serializers,
+            data_serializers=data_serializer.serializers,
+        )
+
+
+def _is_enum_event(event: EventType) -> bool:
+    return bool(event.kinds) and all(
+        kind in (NESTED_KIND, FLAT_KIND) for kind in event.kinds.values()
+    )
+
+
+def _selector(event_name: str) -> int:
+    # Events are emitted with a selector of their name without the module path
+    return get_selector_from_name(event_name.split("::")[-1])
@@ -0,0 +1,2 @@
+from .mirrored_client import MirroredClient
+from .state_mirror import MirroredBlock, StateMirror
@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING, Optional, Union, cast
+
+from starknet_py.net.client_models import Hash, Tag
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import parse_address
+from starknet_py.state_mirror.state_mirror import StateMirror
+from starknet_py.utils.sync import add_sync_methods
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@add_sync_methods
+class MirroredClient(FullNodeClient):
+    """
+    FullNodeClient serving storage, nonces and class hashes from a :class:`StateMirror`.
+
+    Reads at blocks covered by the mirror (identified by number or hash) are served locally.
+    All other requests, including reads of values unknown to the mirror, are sent to the node.
+    """
+
+    def __init__(
+        self,
+        node_url: str,
+        mirror: StateMirror,
+        session: Optional["aiohttp.ClientSession"] = None,
+        *,
+        latest_from_mirror: bool = False,
+    ):
+        """
+        :param node_url: Url of the node providing rpc interface.
+        :param mirror: State mirror serving reads.
+        :param session: Aiohttp session to be used for request.
+        :param latest_from_mirror: If True, reads at the ``"latest"`` block (or without a block)
+            are served at the head of the mirror, even if the node already has newer blocks.
+        """
+        super().__init__(node_url=node_url, session=session)
+        self.mirror = mirror
+        self.latest_from_mirror = latest_from_mirror
+
+    async def get_storage_at(
+        self,
+        contract_address: Hash,
+        key: int,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> int:
+        mirrored_block_number = self._mirrored_block_number(block_hash, block_number)
+        if mirrored_block_number is not None:
+            value = self.mirror.get_storage_at(
+                parse_address(contract_address), key, mirrored_block_number
+            )
+            if value is not None:
+                return value
+
+        return await super().get_storage_at(
+            contract_address, key, block_hash=block_hash, block_number=block_number
+        )
+
+    async def get_contract_nonce(
+        self,
+        contract_address: Hash,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> int:
+        mirrored_block_number = self._mirrored_block_number(block_hash, block_number)
+        if mirrored_block_number is not None:
+            nonce = self.mirror.get_contract_nonce(
+                parse_address(contract_address), mirrored_block_number
+            )
+            if nonce is not None:
+                return nonce
+
+        return await super().get_contract_nonce(
+            contract_address, block_hash=block_hash, block_number=block_number
+        )
+
+    async def get_class_hash_at(
+        self,
+        contract_address: Hash,
+        block_hash: Optional[Union[Hash, Tag]] = None,
+        block_number: Optional[Union[int, Tag]] = None,
+    ) -> int:
+        mirrored_block_number = self._mirrored_block_number(block_hash, block_number)
+        if mirrored_block_number is not None:
+            class_hash = self.mirror.get_class_hash_at(
+                parse_address(contract_address), mirrored_block_number
+            )
+            if class_hash is not None:
+                return class_hash
+
+        return await super().get_class_hash_at(
+            contract_address, block_hash=block_hash, block_number=block_number
+        )
+
+    def _mirrored_block_number(
+        self,
+        block_hash: Optional[Union[Hash, Tag]],
+        block_number: Optional[Union[int, Tag]],
+    ) -> Optional[int]:
+        if block_hash is not None and block_number is not None:
+            raise ValueError(
+                "Arguments block_hash and block_number are mutually exclusive."
+            )
+
+        block_id = block_hash if block_hash is not None else block_number
+        if block_id == "pending":
+            return None
+        if block_id is None or block_id == "latest":
+            head = self.mirror.head
+            return head.block_number if head and self.latest_from_mirror else None
+
+        if block_hash is not None:
+            block = self.mirror.get_block(block_hash=parse_address(block_hash))
+            return block.block_number if block is not None else None
+        return cast(int, block_number)
@@ -0,0 +1,329 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from starknet_py.net.block_range import BlockRangeStats
+from starknet_py.net.client_models import BlockStateUpdate
+from starknet_py.net.full_node_client import FullNodeClient
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS blocks ("
+    "block_number INTEGER PRIMARY KEY, "
+    "block_hash BLOB NOT NULL UNIQUE, "
+    "new_root BLOB NOT NULL, "
+    "old_root BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS storage ("
+    "contract BLOB NOT NULL, "
+    "key BLOB NOT NULL, "
+    "block_number INTEGER NOT NULL, "
+    "value BLOB NOT NULL, "
+    "PRIMARY KEY (contract, key, block_number)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS nonces ("
+    "contract BLOB NOT NULL, "
+    "block_number INTEGER NOT NULL, "
+    "nonce BLOB NOT NULL, "
+    "PRIMARY KEY (contract, block_number)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS class_hashes ("
+    "contract BLOB NOT NULL, "
+    "block_number INTEGER NOT NULL, "
+    "class_hash BLOB NOT NULL, "
+    "PRIMARY KEY (contract, block_number)) WITHOUT ROWID",
+)
+
+_VERSIONED_TABLES = ("storage", "nonces", "class_hashes", "blocks")
+
+
+@dataclass(frozen=True)
+class MirroredBlock:
+    """
+    Block whose state update was applied to :class:`StateMirror`.
+    """
+
+    block_number: int
+    block_hash: int
+    new_root: int
+    old_root: int
+
+
+class StateMirror:
+    """
+    Local mirror of contracts' storage, nonces and class hashes, kept in a SQLite database.
+
+    State updates are applied block by block. Every value is stored with the number of the block
+    that set it, so the state can be read at any mirrored block and blocks can be reverted after a reorg.
+
+    A value not set in any mirrored block is unknown, unless the mirror starts at the genesis block.
+    Then storage values and nonces which were never set are 0.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        :param path: Path to the database file. It is created if it doesn't exist.
+            ``":memory:"`` can be used to create a mirror kept in memory.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    @property
+    def first_block(self) -> Optional[MirroredBlock]:
+        """
+        The oldest mirrored block, None if the mirror is empty.
+        """
+        return self._get_block("ORDER BY block_number ASC LIMIT 1")
+
+    @property
+    def head(self) -> Optional[MirroredBlock]:
+        """
+        The newest mirrored block, None if the mirror is empty.
+        """
+        return self._get_block("ORDER BY block_number DESC LIMIT 1")
+
+    def get_block(
+        self,
+        block_hash: Optional[int] = None,
+        block_number: Optional[int] = None,
+    ) -> Optional[MirroredBlock]:
+        """
+        :param block_hash: Hash of the block.
+        :param block_number: Number of the block.
+        :return: Mirrored block or None if the block is not mirrored.
+        """
+        if (block_hash is None) == (block_number is None):
+            raise ValueError("Exactly one of block_hash and block_number is required.")
+
+        if block_hash is not None:
+            return self._get_block("WHERE block_hash = ?", (_encode(block_hash),))
+        return self._get_block("WHERE block_number = ?", (block_number,))
+
+    def apply_state_update(self, block_number: int, state_update: BlockStateUpdate):
+        """
+        Applies the state update of the block following the head of the mirror.
+
+        :param block_number: Number of the block.
+        :param state_update: State update of the block.
+        """
+        state_diff = state_update.state_diff
+        storage = [
+            (
+                _encode(item.address),
+                _encode(entry.key),
+                block_number,
+                _encode(entry.value),
+            )
+            for item in state_diff.storage_diffs
+            for entry in item.storage_entries
+        ]
+        nonces = [
+            (_encode(nonce.contract_address), block_number, _encode(nonce.nonce))
+            for nonce in state_diff.nonces
+        ]
+        class_hashes = [
+            (_encode(contract.address), block_number, _encode(contract.class_hash))
+            for contract in state_diff.deployed_contracts
+        ] + [
+            (
+                _encode(replaced.contract_address),
+                block_number,
+                _encode(replaced.class_hash),
+            )
+            for replaced in state_diff.replaced_classes
+        ]
+
+        with self._lock, self._connection:
+            head = self._get_block_unlocked("ORDER BY block_number DESC LIMIT 1")
+            if head is not None and (
+                block_number != head.block_number + 1
+                or state_update.old_root != head.new_root
+            ):
+                raise ValueError(
+                    f"State update of block {block_number} doesn't follow the head of the mirror "
+                    f"(block {head.block_number}). Revert the mirror first if the chain was reorganized."
+                )
+
+            self._connection.execute(
+                "INSERT INTO blocks (block_number, block_hash, new_root, old_root) VALUES (?, ?, ?, ?)",
+                (
+                    block_number,
+                    _encode(state_update.block_hash),
+                    _encode(state_update.new_root),
+                    _encode(state_update.old_root),
+                ),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO storage (contract, key, block_number, value) VALUES (?, ?, ?, ?)",
+                storage,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO nonces (contract, block_number, nonce) VALUES (?, ?, ?)",
+                nonces,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO class_hashes (contract, block_number, class_hash) VALUES (?, ?, ?)",
+                class_hashes,
+            )
+
+    def revert_to(self, block_number: int):
+        """
+        Removes changes of all blocks after the given one, e.g. blocks rolled back by a reorg.
+
+        :param block_number: Number of the last block to keep.
+        """
+        with self._lock, self._connection:
+            for table in _VERSIONED_TABLES:
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE block_number > ?", (block_number,)
+                )
+
+    async def sync(
+        self,
+        client: FullNodeClient,
+        to_block_number: int,
+        *,
+        from_block_number: int = 0,
+        batch_size: int = 10,
+        max_concurrent_requests: int = 5,
+        stats: Optional[BlockRangeStats] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        """
+        Fetches and applies state updates of blocks up to ``to_block_number``,
+        using :meth:`~starknet_py.net.full_node_client.FullNodeClient.iter_blocks`.
+
+        :param client: Client used to fetch state updates.
+        :param to_block_number: Number of the last applied block.
+        :param from_block_number: Number of the first block, used only when the mirror is empty.
+        :param batch_size: Number of state updates fetched in a single request.
+        :param max_concurrent_requests: Maximal number of requests sent at the same time.
+        :param stats: Optional BlockRangeStats updated while state updates are fetched.
+        """
+        head = self.head
+        start = head.block_number + 1 if head is not None else from_block_number
+        async for block_number, state_update in client.iter_blocks(
+            start,
+            to_block_number,
+            "state_update",
+            batch_size=batch_size,
+            max_concurrent_requests=max_concurrent_requests,
+            stats=stats,
+        ):
+            self.apply_state_update(block_number, state_update)
+
+    def get_storage_at(
+        self, contract_address: int, key: int, block_number: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        :param contract_address: Address of the contract.
+        :param key: Storage key.
+        :param block_number: Number of the block, defaults to the head of the mirror.
+        :return: Value of the storage slot or None if it is unknown.
+        """
+        return self._get_value(
+            "SELECT value FROM storage WHERE contract = ? AND key = ? AND block_number <= ? "
+            "ORDER BY block_number DESC LIMIT 1",
+            (_encode(contract_address), _encode(key)),
+            block_number,
+            default=0,
+        )
+
+    def get_contract_nonce(
+        self, contract_address: int, block_number: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        :param contract_address: Address of the contract.
+        :param block_number: Number of the block, defaults to the head of the mirror.
+        :return: Nonce of the contract or None if it is unknown.
+        """
+        return self._get_value(
+            "SELECT nonce FROM nonces WHERE contract = ? AND block_number <= ? "
+            "ORDER BY block_number DESC LIMIT 1",
+            (_encode(contract_address),),
+            block_number,
+            default=0,
+        )
+
+    def get_class_hash_at(
+        self, contract_address: int, block_number: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        :param contract_address: Address of the contract.
+        :param block_number: Number of the block, defaults to the head of the mirror.
+        :return: Class hash of the contract or None if it is unknown or the contract is not deployed.
+        """
+        return self._get_value(
+            "SELECT class_hash FROM class_hashes WHERE contract = ? AND block_number <= ? "
+            "ORDER BY block_number DESC LIMIT 1",
+            (_encode(contract_address),),
+            block_number,
+            default=None,
+        )
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_value(
+        self,
+        query: str,
+        params: Tuple,
+        block_number: Optional[int],
+        default: Optional[int],
+    ) -> Optional[int]:
+        with self._lock:
+            (first, last) = self._connection.execute(
+                "SELECT MIN(block_number), MAX(block_number) FROM blocks"
+            ).fetchone()
+            block_number = block_number if block_number is not None else last
+            if first is None or not first <= block_number <= last:
+                return None
+
+            row = self._connection.execute(query, (*params, block_number)).fetchone()
+
+        if row is not None:
+            return _decode(row[0])
+        # Values never set since the genesis block have their default value
+        return default if first == 0 else None
+
+    def _get_block(self, condition: str, params: Tuple = ()) -> Optional[MirroredBlock]:
+        with self._lock:
+            return self._get_block_unlocked(condition, params)
+
+    def _get_block_unlocked(
+        self, condition: str, params: Tuple = ()
+    ) -> Optional[MirroredBlock]:
+        row = self._connection.execute(
+            f"SELECT block_number, block_hash, new_root, old_root FROM blocks {condition}",
+            params,
+        ).fetchone()
+        if row is None:
+            return None
+
+        block_number, block_hash, new_root, old_root = row
+        return MirroredBlock(
+            block_number=block_number,
+            block_hash=_decode(block_hash),
+            new_root=_decode(new_root),
+            old_root=_decode(old_root),
+        )
+
+
+def _encode(value: int) -> bytes:
+    return value.to_bytes(32, byteorder="big")
+
+
+def _decode(value: bytes) -> int:
+    return int.from_bytes(value, byteorder="big")
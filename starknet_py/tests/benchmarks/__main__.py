@@ -0,0 +1,69 @@
+"""
+Runs benchmarks of starknet_py hot paths and compares them with the stored baseline.
+
+Usage: ``python -m starknet_py.tests.benchmarks [-k FILTER] [--quick] [--save] [--baseline PATH]``
+"""
+
+import argparse
+import asyncio
+import sys
+
+from starknet_py.tests.benchmarks.runner import (
+    BASELINE_PATH,
+    compare,
+    format_comparison,
+    load_baseline,
+    load_benchmarks,
+    run_benchmark,
+    save_baseline,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m starknet_py.tests.benchmarks")
+    parser.add_argument(
+        "-k", dest="name_filter", default="", help="Run benchmarks containing it."
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Call every benchmark once."
+    )
+    parser.add_argument(
+        "--baseline", default=str(BASELINE_PATH), help="Path to the baseline file."
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store results in the baseline file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.3,
+        help="Ratio to the baseline reported as a regression.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any benchmark regressed.",
+    )
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    loop = asyncio.new_event_loop()
+    results = []
+    regressions = 0
+    try:
+        for bench in load_benchmarks(args.name_filter):
+            result = run_benchmark(bench, loop, quick=args.quick)
+            results.append(result)
+            (comparison,) = compare([result], baseline)
+            regressions += (comparison.ratio or 0) > args.threshold
+            print(format_comparison(comparison, args.threshold), flush=True)
+    finally:
+        loop.close()
+
+    if args.save:
+        save_baseline(results, args.baseline)
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+import json
+
+import starknet_py.tests.e2e.fixtures.abi_v1_structures as abi_v1_fixtures
+from starknet_py.abi.v0 import AbiParser as AbiParserV0
+from starknet_py.abi.v1 import AbiParser as AbiParserV1
+from starknet_py.abi.v2 import AbiParser as AbiParserV2
+from starknet_py.contract import Contract
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.tests.benchmarks.runner import benchmark
+from starknet_py.tests.e2e.fixtures.constants import (
+    CAIRO_0_CONTRACTS_ABI_DIR,
+    PRECOMPILED_CONTRACTS_DIR,
+)
+
+
+def _argent_abi() -> list:
+    return json.loads(
+        (PRECOMPILED_CONTRACTS_DIR / "argent_account.json").read_text("utf-8")
+    )["abi"]
+
+
+def _complex_abi_v0() -> list:
+    return json.loads(
+        (CAIRO_0_CONTRACTS_ABI_DIR / "complex_contract_abi.json").read_text("utf-8")
+    )
+
+
+def _pool_abi_v1() -> list:
+    return [
+        abi_v1_fixtures.user_dict,
+        abi_v1_fixtures.pool_id_dict,
+        abi_v1_fixtures.user_added_dict,
+        abi_v1_fixtures.pool_id_added_dict,
+        abi_v1_fixtures.get_user_dict,
+        abi_v1_fixtures.delete_pool_dict,
+    ]
+
+
+@benchmark("abi.parse_v1_pool_contract", setup=_pool_abi_v1)
+def parse_v1(abi: list):
+    AbiParserV1(abi).parse()
+
+
+@benchmark("abi.parse_v1_empty")
+def parse_v1_empty():
+    # Only the core structures, included in every Cairo 1 ABI
+    AbiParserV1([]).parse()
+
+
+@benchmark("abi.parse_v2_argent_account", setup=_argent_abi, repeat=3)
+def parse_v2(abi: list):
+    AbiParserV2(abi).parse()
+
+
+@benchmark("abi.parse_v0_complex_contract", setup=_complex_abi_v0)
+def parse_v0(abi: list):
+    AbiParserV0(abi).parse()
+
+
+@benchmark("abi.contract_argent_account", setup=_argent_abi, repeat=3)
+def create_contract(abi: list):
+    Contract(
+        address=0x1,
+        abi=abi,
+        provider=FullNodeClient(node_url="http://127.0.0.1:1/"),
+        cairo_version=1,
+    )
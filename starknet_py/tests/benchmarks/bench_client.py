@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+
+import aiohttp
+
+from starknet_py.hash.sierra_class_hash import compute_sierra_class_hash
+from starknet_py.net.client_models import SierraContractClass
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.trace_walker import TraceWalker
+from starknet_py.tests.benchmarks.fixtures import (
+    ARGENT_ACCOUNT_CLASS_HASH,
+    MockNode,
+    argent_account_class,
+    block_traces,
+    block_with_receipts,
+)
+from starknet_py.tests.benchmarks.runner import benchmark
+
+_TRANSACTIONS = 200
+
+
+@dataclass
+class _Context:
+    node: MockNode
+    session: aiohttp.ClientSession
+    client: FullNodeClient
+
+
+async def _start_node() -> _Context:
+    node = MockNode(
+        {
+            "getBlockWithReceipts": block_with_receipts(600000, _TRANSACTIONS),
+            "traceBlockTransactions": block_traces(_TRANSACTIONS),
+            "getClass": argent_account_class(),
+        }
+    )
+    await node.start()
+    # A single session, so that connections are reused as with a long-running client
+    session = aiohttp.ClientSession()
+    return _Context(
+        node=node, session=session, client=FullNodeClient(node.url, session=session)
+    )
+
+
+async def _stop_node(context: _Context):
+    await context.session.close()
+    await context.node.stop()
+
+
+@benchmark(
+    "client.get_block_with_receipts_200",
+    setup=_start_node,
+    teardown=_stop_node,
+)
+async def get_block_with_receipts(context: _Context):
+    block = await context.client.get_block_with_receipts(block_number=600000)
+    assert len(block.transactions) == _TRANSACTIONS
+
+
+@benchmark(
+    "client.trace_block_transactions_200",
+    setup=_start_node,
+    teardown=_stop_node,
+)
+async def trace_block_transactions(context: _Context):
+    traces = await context.client.trace_block_transactions(block_number=600000)
+    assert len(traces) == _TRANSACTIONS
+
+
+@benchmark(
+    "client.trace_block_transactions_raw_walk_200",
+    setup=_start_node,
+    teardown=_stop_node,
+)
+async def trace_block_transactions_walk(context: _Context):
+    traces = await context.client.trace_block_transactions_raw(block_number=600000)
+    assert len(TraceWalker().flatten(traces)) == 7 * _TRANSACTIONS
+
+
+@benchmark(
+    "client.get_class_by_hash_argent_account",
+    setup=_start_node,
+    teardown=_stop_node,
+    repeat=3,
+)
+async def get_class_by_hash(context: _Context):
+    contract_class = await context.client.get_class_by_hash(ARGENT_ACCOUNT_CLASS_HASH)
+    assert isinstance(contract_class, SierraContractClass)
+
+
+@benchmark(
+    "client.get_class_by_hash_argent_account_class_hash",
+    setup=_start_node,
+    teardown=_stop_node,
+    repeat=3,
+)
+async def get_class_by_hash_and_compute_class_hash(context: _Context):
+    # Checks that a class fetched from a node hashes to the class hash it was requested by
+    contract_class = await context.client.get_class_by_hash(ARGENT_ACCOUNT_CLASS_HASH)
+    assert isinstance(contract_class, SierraContractClass)
+    assert compute_sierra_class_hash(contract_class) == ARGENT_ACCOUNT_CLASS_HASH
@@ -0,0 +1,98 @@
+from typing import List, Tuple
+
+from starknet_py.common import create_casm_class, create_sierra_compiled_contract
+from starknet_py.hash.address import compute_address, compute_addresses
+from starknet_py.hash.casm_class_hash import compute_casm_class_hash
+from starknet_py.hash.hash_method import HashMethod
+from starknet_py.hash.sierra_class_hash import compute_sierra_class_hash
+from starknet_py.net.client_models import CasmClass, SierraCompiledContract
+from starknet_py.tests.benchmarks.fixtures import (
+    ARGENT_ACCOUNT_CLASS_HASH,
+    ARGENT_ACCOUNT_COMPILED_CLASS_HASH,
+)
+from starknet_py.tests.benchmarks.runner import benchmark
+from starknet_py.tests.e2e.fixtures.constants import PRECOMPILED_CONTRACTS_DIR
+from starknet_py.utils.merkle_tree import MerkleTree
+
+_ADDRESSES = 300
+_LEAVES = 256
+
+
+def _sierra_class() -> SierraCompiledContract:
+    return create_sierra_compiled_contract(
+        (PRECOMPILED_CONTRACTS_DIR / "argent_account.json").read_text("utf-8")
+    )
+
+
+def _casm_class(file_name: str) -> CasmClass:
+    return create_casm_class((PRECOMPILED_CONTRACTS_DIR / file_name).read_text("utf-8"))
+
+
+@benchmark("hash.sierra_class_hash_argent_account", setup=_sierra_class, repeat=3)
+def sierra_class_hash(contract: SierraCompiledContract):
+    assert compute_sierra_class_hash(contract) == ARGENT_ACCOUNT_CLASS_HASH
+
+
+@benchmark(
+    "hash.casm_class_hash_argent_account",
+    setup=lambda: _casm_class("argent_account.casm"),
+    repeat=3,
+)
+def casm_class_hash(casm_class: CasmClass):
+    assert compute_casm_class_hash(casm_class) == ARGENT_ACCOUNT_COMPILED_CLASS_HASH
+
+
+@benchmark(
+    "hash.casm_class_hash_v2_6",
+    setup=lambda: _casm_class("starknet_contract_v2_6.casm"),
+    repeat=3,
+)
+def casm_class_hash_v2_6(casm_class: CasmClass):
+    assert (
+        compute_casm_class_hash(casm_class)
+        == 0x603DD72504D8B0BC54DF4F1102FDCF87FC3B2B94750A9083A5876913EEC08E4
+    )
+
+
+def _address_params() -> List[Tuple[int, List[int], int]]:
+    # Accounts of the same class and public keys, differing in salts only
+    return [
+        (ARGENT_ACCOUNT_CLASS_HASH, [0x123, 0x0], salt) for salt in range(_ADDRESSES)
+    ]
+
+
+@benchmark("hash.compute_address_loop_300", setup=_address_params, repeat=3)
+def compute_address_loop(params: List[Tuple[int, List[int], int]]):
+    for class_hash, constructor_calldata, salt in params:
+        compute_address(
+            class_hash=class_hash, constructor_calldata=constructor_calldata, salt=salt
+        )
+
+
+@benchmark("hash.compute_addresses_300", setup=_address_params, repeat=3)
+def compute_addresses_bulk(params: List[Tuple[int, List[int], int]]):
+    list(compute_addresses(params))
+
+
+def _leaves() -> List[int]:
+    return [0x1000 + index for index in range(_LEAVES)]
+
+
+def _tree() -> MerkleTree:
+    return MerkleTree(_leaves(), HashMethod.PEDERSEN)
+
+
+@benchmark("hash.merkle_tree_build_256", setup=_leaves, repeat=3)
+def merkle_tree_build(leaves: List[int]):
+    MerkleTree(leaves, HashMethod.PEDERSEN)
+
+
+@benchmark("hash.merkle_tree_get_proofs_256", setup=_tree)
+def merkle_tree_get_proofs(tree: MerkleTree):
+    for index in range(_LEAVES):
+        tree.get_proof(index)
+
+
+@benchmark("hash.merkle_tree_update", setup=_tree)
+def merkle_tree_update(tree: MerkleTree):
+    tree.update(_LEAVES // 2, tree.leaves[_LEAVES // 2] + 1)
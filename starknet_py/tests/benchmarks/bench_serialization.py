@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from starknet_py.cairo.data_types import ArrayType, FeltType, StructType, UintType
+from starknet_py.serialization.factory import serializer_for_type
+from starknet_py.tests.benchmarks.runner import benchmark
+
+_LENGTH = 10_000
+
+_U256_ARRAY = ArrayType(UintType(256))
+_FELT_ARRAY = ArrayType(FeltType())
+_STRUCT_ARRAY = ArrayType(
+    StructType(
+        "Transfer",
+        OrderedDict(sender=FeltType(), recipient=FeltType(), amount=UintType(256)),
+    )
+)
+
+
+def _u256_array() -> Tuple[Any, list, list]:
+    serializer = serializer_for_type(_U256_ARRAY)
+    values = [2**200 + index for index in range(_LENGTH)]
+    return serializer, values, serializer.serialize(values)
+
+
+def _felt_array() -> Tuple[Any, list, list]:
+    serializer = serializer_for_type(_FELT_ARRAY)
+    values = list(range(_LENGTH))
+    return serializer, values, serializer.serialize(values)
+
+
+def _struct_array() -> Tuple[Any, list, list]:
+    serializer = serializer_for_type(_STRUCT_ARRAY)
+    values = [
+        {"sender": index, "recipient": index + 1, "amount": 2**130 + index}
+        for index in range(_LENGTH // 10)
+    ]
+    return serializer, values, serializer.serialize(values)
+
+
+@benchmark("serialization.encode_u256_array", setup=_u256_array)
+def encode_u256_array(context: Tuple[Any, list, list]):
+    serializer, values, _ = context
+    serializer.serialize(values)
+
+
+@benchmark("serialization.decode_u256_array", setup=_u256_array)
+def decode_u256_array(context: Tuple[Any, list, list]):
+    serializer, _, calldata = context
+    serializer.deserialize(calldata)
+
+
+@benchmark("serialization.decode_felt_array", setup=_felt_array)
+def decode_felt_array(context: Tuple[Any, list, list]):
+    serializer, _, calldata = context
+    serializer.deserialize(calldata)
+
+
+@benchmark("serialization.encode_struct_array", setup=_struct_array)
+def encode_struct_array(context: Tuple[Any, list, list]):
+    serializer, values, _ = context
+    serializer.serialize(values)
+
+
+@benchmark("serialization.decode_struct_array", setup=_struct_array)
+def decode_struct_array(context: Tuple[Any, list, list]):
+    serializer, _, calldata = context
+    serializer.deserialize(calldata)
@@ -0,0 +1,59 @@
+from typing import Tuple
+
+from starknet_py.net.client_models import ResourceBounds, ResourceBoundsMapping
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.models.transaction import InvokeV1, InvokeV3
+from starknet_py.net.signer.stark_curve_signer import KeyPair, StarkCurveSigner
+from starknet_py.tests.benchmarks.fixtures import invoke_transaction
+from starknet_py.tests.benchmarks.runner import benchmark
+
+_ACCOUNT_ADDRESS = 0x100000
+_CALLDATA = [int(value, 16) for value in invoke_transaction(0)["calldata"]]
+
+
+def _invoke_v1() -> InvokeV1:
+    return InvokeV1(
+        version=1,
+        signature=[],
+        nonce=7,
+        max_fee=10**15,
+        sender_address=_ACCOUNT_ADDRESS,
+        calldata=_CALLDATA,
+    )
+
+
+def _invoke_v3() -> InvokeV3:
+    return InvokeV3(
+        version=3,
+        signature=[],
+        nonce=7,
+        resource_bounds=ResourceBoundsMapping(
+            l1_gas=ResourceBounds(max_amount=0x1000, max_price_per_unit=10**10),
+            l2_gas=ResourceBounds.init_with_zeros(),
+        ),
+        sender_address=_ACCOUNT_ADDRESS,
+        calldata=_CALLDATA,
+    )
+
+
+@benchmark("transactions.invoke_v1_hash", setup=_invoke_v1)
+def invoke_v1_hash(transaction: InvokeV1):
+    transaction.calculate_hash(StarknetChainId.SEPOLIA)
+
+
+@benchmark("transactions.invoke_v3_hash", setup=_invoke_v3)
+def invoke_v3_hash(transaction: InvokeV3):
+    transaction.calculate_hash(StarknetChainId.SEPOLIA)
+
+
+def _signer_and_invoke_v3() -> Tuple[StarkCurveSigner, InvokeV3]:
+    signer = StarkCurveSigner(
+        _ACCOUNT_ADDRESS, KeyPair.from_private_key(0x1234), StarknetChainId.SEPOLIA
+    )
+    return signer, _invoke_v3()
+
+
+@benchmark("transactions.invoke_v3_sign", setup=_signer_and_invoke_v3)
+def invoke_v3_sign(context: Tuple[StarkCurveSigner, InvokeV3]):
+    signer, transaction = context
+    signer.sign_transaction(transaction)
@@ -0,0 +1,40 @@
+import json
+from typing import List, Tuple
+
+from starknet_py.tests.benchmarks.runner import benchmark
+from starknet_py.tests.e2e.fixtures.constants import TYPED_DATA_DIR
+from starknet_py.utils.typed_data import TypedData, TypedDataHasher
+
+_ACCOUNT_ADDRESS = 0xCD2A3D9F938E13CD947EC05ABC7FE734DF8DD826
+_MESSAGES = 100
+
+
+def _load(file_name: str) -> dict:
+    return json.loads((TYPED_DATA_DIR / file_name).read_text("utf-8"))
+
+
+@benchmark(
+    "typed_data.message_hash_rev_0",
+    setup=lambda: _load("typed_data_rev_0_example.json"),
+)
+def message_hash_rev_0(typed_data: dict):
+    TypedData.from_dict(typed_data).message_hash(_ACCOUNT_ADDRESS)
+
+
+@benchmark(
+    "typed_data.message_hash_rev_1",
+    setup=lambda: _load("typed_data_rev_1_example.json"),
+)
+def message_hash_rev_1(typed_data: dict):
+    TypedData.from_dict(typed_data).message_hash(_ACCOUNT_ADDRESS)
+
+
+def _hasher_and_messages() -> Tuple[TypedDataHasher, List[dict]]:
+    typed_data = TypedData.from_dict(_load("typed_data_rev_1_example.json"))
+    return TypedDataHasher.from_typed_data(typed_data), [typed_data.message] * _MESSAGES
+
+
+@benchmark("typed_data.hasher_message_hashes_100", setup=_hasher_and_messages)
+def hasher_message_hashes(context: Tuple[TypedDataHasher, List[dict]]):
+    hasher, messages = context
+    hasher.message_hashes(messages, _ACCOUNT_ADDRESS)
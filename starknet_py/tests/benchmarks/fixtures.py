@@ -0,0 +1,271 @@
+"""
+Node responses served to :class:`~starknet_py.net.full_node_client.FullNodeClient` in benchmarks.
+
+Blocks and traces are generated with the shape of mainnet responses: every transaction is a multicall
+invoking a token transfer and a swap, with nested calls, events and resources.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from starknet_py.tests.e2e.fixtures.constants import PRECOMPILED_CONTRACTS_DIR
+
+ARGENT_ACCOUNT_CLASS_HASH = (
+    0x1A736D6ED154502257F02B1CCDF4D9D1089F80811CD6ACAD48E6B6A9D1F2003
+)
+ARGENT_ACCOUNT_COMPILED_CLASS_HASH = (
+    0x29787A427A423FFC5986D43E630077A176E4391FCEF3EBF36014B154069AE4
+)
+
+_TOKEN = 0x49D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7
+_ROUTER = 0x41FD22B238FA21CFCF5DD45A8548974D8263B3A531A60388411C5E230F97023
+_TRANSFER = 0x83AFD3F4CAEDC6EEBF44246FE54E38C95E3179A5EC9EA81740ECA5B482D12E
+_SWAP = 0x15543C3708653CDA9D418B4CCD3BE11368E40636C10C44B18CFE756B6D88B29
+_TRANSFER_EVENT = 0x99CD8BDE557814842A3121E8DDFD433A539B8C9F14BF31EBF108D12E6196E9
+_EXECUTION_RESOURCES = {
+    "steps": 12000,
+    "memory_holes": 120,
+    "range_check_builtin_applications": 400,
+    "pedersen_builtin_applications": 30,
+    "data_availability": {"l1_gas": 0, "l1_data_gas": 192},
+}
+
+
+def _hex(value: int) -> str:
+    return hex(value)
+
+
+def _account(index: int) -> int:
+    return 0x100000 + index
+
+
+def _transaction_hash(index: int) -> int:
+    return 0xABC0000 + index
+
+
+def _calldata(index: int) -> List[str]:
+    return [
+        _hex(value)
+        for value in (
+            2,
+            _TOKEN,
+            _TRANSFER,
+            3,
+            _ROUTER,
+            10**18 + index,
+            0,
+            _ROUTER,
+            _SWAP,
+            4,
+            _TOKEN,
+            0x1234,
+            10**18 + index,
+            0,
+        )
+    ]
+
+
+def invoke_transaction(index: int) -> Dict[str, Any]:
+    return {
+        "transaction_hash": _hex(_transaction_hash(index)),
+        "type": "INVOKE",
+        "version": "0x3",
+        "sender_address": _hex(_account(index)),
+        "calldata": _calldata(index),
+        "signature": [_hex(2**250 + index), _hex(2**249 + index)],
+        "nonce": _hex(index),
+        "resource_bounds": {
+            "l1_gas": {"max_amount": "0x1000", "max_price_per_unit": "0x2540be400"},
+            "l2_gas": {"max_amount": "0x0", "max_price_per_unit": "0x0"},
+        },
+        "tip": "0x0",
+        "paymaster_data": [],
+        "account_deployment_data": [],
+        "nonce_data_availability_mode": "L1",
+        "fee_data_availability_mode": "L1",
+    }
+
+
+def _event(from_address: int, index: int) -> Dict[str, Any]:
+    return {
+        "from_address": _hex(from_address),
+        "keys": [_hex(_TRANSFER_EVENT)],
+        "data": [_hex(_account(index)), _hex(_ROUTER), _hex(10**18 + index), "0x0"],
+    }
+
+
+def receipt(index: int) -> Dict[str, Any]:
+    return {
+        "transaction_hash": _hex(_transaction_hash(index)),
+        "type": "INVOKE",
+        "execution_status": "SUCCEEDED",
+        "finality_status": "ACCEPTED_ON_L2",
+        "actual_fee": {"amount": _hex(10**14 + index), "unit": "FRI"},
+        "events": [_event(_TOKEN, index), _event(_TOKEN, index + 1)],
+        "messages_sent": [],
+        "execution_resources": _EXECUTION_RESOURCES,
+    }
+
+
+def _block_header(block_number: int) -> Dict[str, Any]:
+    return {
+        "block_hash": _hex(0xB10C000 + block_number),
+        "parent_hash": _hex(0xB10C000 + block_number - 1),
+        "block_number": block_number,
+        "new_root": _hex(0x5007 + block_number),
+        "timestamp": 1700000000 + 6 * block_number,
+        "sequencer_address": _hex(
+            0x1176A1BD84444C89232EC27754698E5D2E7E1A7F1539F12027F28B23EC9F3D8
+        ),
+        "l1_gas_price": {
+            "price_in_fri": "0x1d1a94a20000",
+            "price_in_wei": "0x3b9aca08",
+        },
+        "l1_data_gas_price": {"price_in_fri": "0x1", "price_in_wei": "0x1"},
+        "l1_da_mode": "BLOB",
+        "starknet_version": "0.13.1.1",
+        "status": "ACCEPTED_ON_L2",
+    }
+
+
+def block_with_receipts(block_number: int, transactions: int) -> Dict[str, Any]:
+    return {
+        **_block_header(block_number),
+        "transactions": [
+            {"transaction": invoke_transaction(index), "receipt": receipt(index)}
+            for index in range(transactions)
+        ],
+    }
+
+
+def _invocation(
+    contract_address: int,
+    selector: int,
+    caller_address: int,
+    calldata: List[str],
+    calls: Optional[List[Dict[str, Any]]] = None,
+    events: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    # pylint: disable=too-many-arguments
+    return {
+        "contract_address": _hex(contract_address),
+        "entry_point_selector": _hex(selector),
+        "calldata": calldata,
+        "caller_address": _hex(caller_address),
+        "class_hash": _hex(contract_address + 1),
+        "entry_point_type": "EXTERNAL",
+        "call_type": "CALL",
+        "result": ["0x1"],
+        "calls": calls or [],
+        "events": events or [],
+        "messages": [],
+        "execution_resources": {"steps": 2000, "range_check_builtin_applications": 40},
+    }
+
+
+def _transfer_invocation(caller_address: int, index: int, order: int) -> Dict[str, Any]:
+    event = _event(_TOKEN, index)
+    return _invocation(
+        _TOKEN,
+        _TRANSFER,
+        caller_address,
+        [_hex(_ROUTER), _hex(10**18 + index), "0x0"],
+        events=[{"order": order, "keys": event["keys"], "data": event["data"]}],
+    )
+
+
+def transaction_trace(index: int) -> Dict[str, Any]:
+    account = _account(index)
+    swap = _invocation(
+        _ROUTER,
+        _SWAP,
+        account,
+        _calldata(index)[10:],
+        calls=[
+            _transfer_invocation(_ROUTER, index, 1),
+            _transfer_invocation(_ROUTER, index + 1, 2),
+        ],
+    )
+    execute = _invocation(
+        account,
+        0x15D40A3D6CA2AC30F4031E42BE28DA9B056FEF9BB7357AC5E85627EE876E5AD,
+        0,
+        _calldata(index),
+        calls=[_transfer_invocation(account, index, 0), swap],
+    )
+    return {
+        "transaction_hash": _hex(_transaction_hash(index)),
+        "trace_root": {
+            "type": "INVOKE",
+            "validate_invocation": _invocation(
+                account,
+                0x162DA33A4585851FE8D3AF3C2A9C60B557814E221E0D4F30FF0B2189D9C7775,
+                0,
+                _calldata(index),
+            ),
+            "execute_invocation": execute,
+            "fee_transfer_invocation": _transfer_invocation(account, index, 3),
+            "execution_resources": _EXECUTION_RESOURCES,
+        },
+    }
+
+
+def block_traces(transactions: int) -> List[Dict[str, Any]]:
+    return [transaction_trace(index) for index in range(transactions)]
+
+
+def argent_account_class() -> Dict[str, Any]:
+    """
+    Argent account class as returned by ``starknet_getClass``.
+    """
+    contract_class = json.loads(
+        (PRECOMPILED_CONTRACTS_DIR / "argent_account.json").read_text("utf-8")
+    )
+    return {
+        "sierra_program": contract_class["sierra_program"],
+        "contract_class_version": contract_class["contract_class_version"],
+        "entry_points_by_type": contract_class["entry_points_by_type"],
+        "abi": json.dumps(contract_class["abi"]),
+    }
+
+
+class MockNode:
+    """
+    Local HTTP server answering JSON-RPC requests with fixed results.
+    """
+
+    def __init__(self, results: Dict[str, Any]):
+        """
+        :param results: Results of JSON-RPC methods, by method name without the ``starknet_`` prefix.
+        """
+        self._responses = {
+            f"starknet_{method}": json.dumps(result)
+            for method, result in results.items()
+        }
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    async def start(self):
+        app = web.Application(client_max_size=0)
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        # Results are pre-serialized, only the envelope is built per request
+        body = (
+            f'{{"jsonrpc": "2.0", "id": {payload["id"]}, '
+            f'"result": {self._responses[payload["method"]]}}}'
+        )
+        return web.Response(text=body, content_type="application/json")
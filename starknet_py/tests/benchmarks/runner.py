@@ -0,0 +1,230 @@
+import asyncio
+import functools
+import importlib
+import inspect
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+_BENCHMARK_MODULES = (
+    "bench_abi",
+    "bench_serialization",
+    "bench_hash",
+    "bench_typed_data",
+    "bench_transactions",
+    "bench_client",
+)
+
+
+@dataclass
+class Benchmark:
+    """
+    Benchmarked function with its setup.
+    """
+
+    name: str
+    func: Callable
+    setup: Optional[Callable] = None
+    """Called once before timing, its result is passed to ``func`` and ``teardown``."""
+    teardown: Optional[Callable] = None
+    repeat: int = 5  #: Number of timed rounds.
+    min_time: float = 0.1  #: Minimal duration of a round in seconds.
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timings of a benchmark.
+    """
+
+    name: str
+    number: int  #: Number of calls in every round.
+    times: List[float]  #: Seconds per call in every round.
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+
+@dataclass
+class Comparison:
+    """
+    Result of a benchmark compared with its baseline.
+    """
+
+    name: str
+    current: float  #: Median seconds per call.
+    baseline: Optional[float]  #: Median seconds per call in the baseline, if recorded.
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """
+        Current time divided by the baseline time, above 1 when slower.
+        """
+        return self.current / self.baseline if self.baseline else None
+
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    *,
+    setup: Optional[Callable] = None,
+    teardown: Optional[Callable] = None,
+    repeat: int = 5,
+    min_time: float = 0.1,
+) -> Callable[[Callable], Callable]:
+    """
+    Registers a benchmark. ``func``, ``setup`` and ``teardown`` can be coroutine functions.
+
+    :param name: Unique name of the benchmark, prefixed with its area, e.g. ``"abi.parse_v2"``.
+    :param setup: Function called once before timing, its result is passed to the benchmarked function.
+    :param teardown: Function called with the result of ``setup`` after timing.
+    :param repeat: Number of timed rounds.
+    :param min_time: Minimal duration of a round in seconds, calls are repeated until it is reached.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if name in _BENCHMARKS:
+            raise ValueError(f"Benchmark {name} is already registered.")
+        _BENCHMARKS[name] = Benchmark(
+            name=name,
+            func=func,
+            setup=setup,
+            teardown=teardown,
+            repeat=repeat,
+            min_time=min_time,
+        )
+        return func
+
+    return decorator
+
+
+def load_benchmarks(name_filter: str = "") -> List[Benchmark]:
+    """
+    :param name_filter: Only benchmarks with names containing it are returned.
+    :return: Registered benchmarks, sorted by name.
+    """
+    for module in _BENCHMARK_MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+    return [_BENCHMARKS[name] for name in sorted(_BENCHMARKS) if name_filter in name]
+
+
+def run_benchmark(
+    bench: Benchmark, loop: asyncio.AbstractEventLoop, quick: bool = False
+) -> BenchmarkResult:
+    """
+    Times a benchmark. The first call calibrates the number of calls per round.
+
+    :param bench: Benchmark to run.
+    :param loop: Event loop running coroutine functions.
+    :param quick: If True, the benchmarked function is called only once.
+    :return: Timings of the benchmark.
+    """
+    context = _call(loop, bench.setup) if bench.setup is not None else None
+    func = (
+        functools.partial(bench.func, context)
+        if bench.setup is not None
+        else bench.func
+    )
+    try:
+        start = time.perf_counter()
+        _call(loop, func)
+        first = time.perf_counter() - start
+        if quick:
+            return BenchmarkResult(name=bench.name, number=1, times=[first])
+
+        number = max(1, int(bench.min_time / first)) if first > 0 else 1000
+        times = []
+        for _ in range(bench.repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                _call(loop, func)
+            times.append((time.perf_counter() - start) / number)
+        return BenchmarkResult(name=bench.name, number=number, times=times)
+    finally:
+        if bench.teardown is not None:
+            _call(loop, bench.teardown, context)
+
+
+def compare(
+    results: Iterable[BenchmarkResult], baseline: Dict[str, float]
+) -> List[Comparison]:
+    """
+    :param results: Timings of benchmarks.
+    :param baseline: Median seconds per call by benchmark name.
+    :return: Comparisons in the order of results.
+    """
+    return [
+        Comparison(
+            name=result.name, current=result.median, baseline=baseline.get(result.name)
+        )
+        for result in results
+    ]
+
+
+def load_baseline(path: Union[str, Path] = BASELINE_PATH) -> Dict[str, float]:
+    """
+    :param path: Path to the baseline file.
+    :return: Median seconds per call by benchmark name, empty if the file doesn't exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text("utf-8"))["benchmarks"]
+
+
+def save_baseline(
+    results: Iterable[BenchmarkResult], path: Union[str, Path] = BASELINE_PATH
+):
+    """
+    Stores medians of results, together with the interpreter and machine they were measured on.
+    Entries of benchmarks not in results are kept.
+
+    :param results: Timings of benchmarks.
+    :param path: Path to the baseline file.
+    """
+    benchmarks = load_baseline(path)
+    benchmarks.update({result.name: result.median for result in results})
+    baseline = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    Path(path).write_text(json.dumps(baseline, indent=2) + "\n", "utf-8")
+
+
+def format_comparison(comparison: Comparison, threshold: float) -> str:
+    ratio = comparison.ratio
+    if ratio is None:
+        change = "no baseline"
+    else:
+        change = f"{ratio:6.2f}x"
+        if ratio > threshold:
+            change += "  REGRESSION"
+    return f"{comparison.name:<55} {_format_time(comparison.current):>10}  {change}"
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _call(loop: asyncio.AbstractEventLoop, func: Callable, *args: Any) -> Any:
+    result = func(*args)
+    if inspect.isawaitable(result):
+        result = loop.run_until_complete(result)
+    return result
@@ -2,7 +2,7 @@ import pytest
 
 from starknet_py.abi.v0 import AbiParser
 from starknet_py.constants import DEFAULT_DEPLOYER_ADDRESS
-from starknet_py.net.udc_deployer.deployer import _deployer_abi
+from starknet_py.net.udc_deployer.deployer import _get_deployer_abi
 
 
 @pytest.fixture(scope="package", autouse=True)
@@ -19,4 +19,4 @@ async def check_if_udc_is_deployed(client):
 async def check_if_udc_has_expected_abi(gateway_client):
     code = await gateway_client.get_code(contract_address=DEFAULT_DEPLOYER_ADDRESS)
 
-    assert AbiParser(code.abi).parse() == _deployer_abi
+    assert AbiParser(code.abi).parse() == _get_deployer_abi()
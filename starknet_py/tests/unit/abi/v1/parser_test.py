@@ -172,3 +172,38 @@ def test_missing_type_used(missing_name, input_dict):
         UnknownCairoTypeError, match=f"Type '{missing_name}' is not defined.*"
     ):
         AbiParser([input_dict]).parse()
+
+
+def test_core_structures_are_shared():
+    eth_address = "core::starknet::eth_address::EthAddress"
+    user_struct_dict = {
+        "type": "struct",
+        "name": "Wallet",
+        "members": [{"name": "owner", "type": eth_address}],
+    }
+
+    first = AbiParser([user_struct_dict]).parse()
+    second = AbiParser([fixtures.pool_id_dict]).parse()
+
+    assert first.defined_structures[eth_address] == (
+        fixtures.core_structures[eth_address]
+    )
+    assert first.defined_structures[eth_address] is (
+        second.defined_structures[eth_address]
+    )
+    assert first.defined_structures["Wallet"].types["owner"] is (
+        first.defined_structures[eth_address]
+    )
+
+
+def test_core_structure_redefined():
+    core_struct_dict = {
+        "type": "struct",
+        "name": "core::starknet::eth_address::EthAddress",
+        "members": [{"name": "address", "type": "core::felt252"}],
+    }
+    with pytest.raises(
+        AbiParsingError,
+        match="Name 'core::starknet::eth_address::EthAddress' was used more than once in defined structures",
+    ):
+        AbiParser([core_struct_dict]).parse()
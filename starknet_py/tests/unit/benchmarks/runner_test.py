@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from starknet_py.tests.benchmarks.runner import (
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    format_comparison,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+@pytest.fixture(name="loop")
+def create_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_run_benchmark(loop):
+    calls = []
+    torn_down = []
+
+    async def func(context):
+        calls.append(context)
+
+    bench = Benchmark(
+        name="test.func",
+        func=func,
+        setup=lambda: "context",
+        teardown=torn_down.append,
+        repeat=2,
+        min_time=0.001,
+    )
+
+    result = run_benchmark(bench, loop)
+
+    assert len(result.times) == 2
+    assert len(calls) == 1 + 2 * result.number
+    assert set(calls) == {"context"}
+    assert torn_down == ["context"]
+
+
+def test_run_benchmark_quick(loop):
+    calls = []
+    result = run_benchmark(
+        Benchmark(name="test.func", func=lambda: calls.append(1)), loop, quick=True
+    )
+
+    assert result.number == 1 and len(result.times) == 1
+    assert calls == [1]
+
+
+def test_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    assert load_baseline(path) == {}
+
+    save_baseline(
+        [
+            BenchmarkResult(name="a", number=1, times=[1.0, 3.0, 2.0]),
+            BenchmarkResult(name="b", number=1, times=[1.0]),
+        ],
+        path,
+    )
+    save_baseline([BenchmarkResult(name="a", number=1, times=[4.0])], path)
+
+    baseline = load_baseline(path)
+    assert baseline == {"a": 4.0, "b": 1.0}
+
+    comparisons = compare(
+        [
+            BenchmarkResult(name="b", number=1, times=[2.0]),
+            BenchmarkResult(name="c", number=1, times=[1.0]),
+        ],
+        baseline,
+    )
+    assert [comparison.ratio for comparison in comparisons] == [2.0, None]
+    assert format_comparison(comparisons[0], threshold=1.3).endswith("REGRESSION")
+    assert "no baseline" in format_comparison(comparisons[1], threshold=1.3)
@@ -0,0 +1,167 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from starknet_py.class_store import ClassStore
+from starknet_py.class_store.__main__ import main
+from starknet_py.class_store.prewarm import prewarm_class_store
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import (
+    DeprecatedContractClass,
+    EntryPoint,
+    EntryPointsByType,
+    SierraContractClass,
+    SierraEntryPoint,
+    SierraEntryPointsByType,
+)
+from starknet_py.proxy.contract_abi_resolver import ContractAbiResolver
+
+sierra_abi = [{"type": "function", "name": "sierra_function"}]
+deprecated_abi = [
+    {"type": "function", "name": "deprecated_function", "inputs": [], "outputs": []}
+]
+
+sierra_class = SierraContractClass(
+    contract_class_version="0.1.0",
+    sierra_program=[1, 2, 3],
+    entry_points_by_type=SierraEntryPointsByType(
+        constructor=[],
+        external=[SierraEntryPoint(selector=0x10, function_idx=0)],
+        l1_handler=[],
+    ),
+    abi=json.dumps(sierra_abi),
+)
+deprecated_class = DeprecatedContractClass(
+    program="H4sIAAAAAAAA",
+    entry_points_by_type=EntryPointsByType(
+        constructor=[],
+        external=[EntryPoint(offset=2, selector=0x20)],
+        l1_handler=[],
+    ),
+    abi=deprecated_abi,
+)
+
+
+@pytest.fixture(name="class_store")
+def fixture_class_store(tmp_path) -> ClassStore:
+    with ClassStore(tmp_path / "classes.sqlite", store_classes=True) as store:
+        yield store
+
+
+@pytest.mark.parametrize(
+    "contract_class, abi, cairo_version",
+    [(sierra_class, sierra_abi, 1), (deprecated_class, deprecated_abi, 0)],
+)
+def test_put_class(class_store, contract_class, abi, cairo_version):
+    class_store.put_class(0x1, contract_class)
+
+    assert 0x1 in class_store
+    assert class_store.get_abi(0x1) == (abi, cairo_version)
+    assert class_store.get_class(0x1) == contract_class
+
+
+def test_abi_only_store(tmp_path):
+    with ClassStore(tmp_path / "classes.sqlite") as class_store:
+        class_store.put_class(0x1, sierra_class)
+
+        assert class_store.get_abi(0x1) == (sierra_abi, 1)
+        assert class_store.get_class(0x1) is None
+        assert class_store.get_abi(0x2) is None
+
+
+def test_store_persists(tmp_path):
+    with ClassStore(tmp_path / "classes.sqlite") as class_store:
+        class_store.put_abi(0x1, sierra_abi, 1)
+
+    with ClassStore(tmp_path / "classes.sqlite") as class_store:
+        assert class_store.get_abi(0x1) == (sierra_abi, 1)
+
+
+def test_eviction_removes_least_recently_used():
+    entry_size = len(json.dumps(sierra_abi))
+    with ClassStore(":memory:", max_size=3 * entry_size) as class_store:
+        for class_hash in [0x1, 0x2, 0x3]:
+            class_store.put_abi(class_hash, sierra_abi, 1)
+        class_store.get_abi(0x1)
+
+        class_store.put_abi(0x4, sierra_abi, 1)
+
+        assert [class_hash in class_store for class_hash in [0x1, 0x2, 0x3, 0x4]] == [
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert class_store.size == 3 * entry_size
+
+        class_store.evict(entry_size)
+        assert class_store.size == entry_size
+        assert 0x4 in class_store
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size must be greater than 0"):
+        ClassStore(":memory:", max_size=0)
+
+
+@pytest.mark.asyncio
+async def test_resolver_uses_class_store():
+    client = MagicMock()
+    client.get_class_hash_at = AsyncMock(return_value=0x1)
+    client.get_class_by_hash = AsyncMock(return_value=sierra_class)
+
+    with ClassStore(":memory:") as class_store:
+        for _ in range(2):
+            result = await ContractAbiResolver(
+                address=0x123, client=client, proxy_config={}, class_store=class_store
+            ).resolve()
+            assert result == (sierra_abi, 1)
+
+    client.get_class_by_hash.assert_awaited_once_with(0x1)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_class_store():
+    client = MagicMock()
+    client.get_class_hash_at = AsyncMock(
+        side_effect=lambda contract_address: {0x10: 0x1, 0x11: 0x2}[contract_address]
+    )
+    client.get_class_by_hash = AsyncMock(
+        side_effect=[
+            sierra_class,
+            ClientError(code=1, message="Unexpected"),
+        ]
+    )
+
+    with ClassStore(":memory:") as class_store:
+        errors = await prewarm_class_store(class_store, ["0x10", 0x11], client)
+
+        assert class_store.get_abi(0x1) == (sierra_abi, 1)
+        assert 0x2 not in class_store
+    assert list(errors) == [0x11]
+    assert isinstance(errors[0x11], ClientError)
+
+
+def test_prewarm_cli(tmp_path, mocker):
+    addresses_file = tmp_path / "addresses.txt"
+    addresses_file.write_text("0x10\n\n0x11\n")
+    prewarm = mocker.patch(
+        "starknet_py.class_store.__main__.prewarm_class_store",
+        AsyncMock(return_value={}),
+    )
+
+    exit_code = main(
+        [
+            "0x12",
+            "--addresses-file",
+            str(addresses_file),
+            "--node-url",
+            "http://localhost:5050",
+            "--store",
+            str(tmp_path / "classes.sqlite"),
+        ]
+    )
+
+    assert exit_code == 0
+    assert prewarm.await_args.args[1] == [0x12, 0x10, 0x11]
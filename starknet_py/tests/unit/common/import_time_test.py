@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Dependencies taking most of the import time, imported only when they are used
+LAZY_DEPENDENCIES = {
+    "aiohttp",  # first request
+    "Crypto",  # keccak
+    "crypto_cpp_py",  # pedersen hash and signatures, imports sympy
+    "eth_keyfile",  # KeyPair.from_keystore
+    "lark",  # ABI parsing
+    "marshmallow_dataclass",  # deprecated transaction schemas
+    "sympy",
+}
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """
+    :return: Cumulative import times in microseconds of all modules imported by ``import module``,
+        as reported by ``python -X importtime``.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "starknet_py.net.full_node_client",
+        "starknet_py.net.account.account",
+        "starknet_py.net.udc_deployer.deployer",
+        "starknet_py.contract",
+        "starknet_py.hash.address",
+    ],
+)
+def test_heavy_dependencies_are_imported_lazily(module):
+    times = _import_times(module)
+
+    assert module in times
+    imported = {name.split(".")[0] for name in times}
+    assert not imported & LAZY_DEPENDENCIES, (
+        f"Importing {module} imports {sorted(imported & LAZY_DEPENDENCIES)}, "
+        f"which should be imported on first use."
+    )
+
+
+def test_lazy_dependencies_are_imported_on_first_use():
+    code = (
+        "import sys\n"
+        "from starknet_py.hash.utils import pedersen_hash\n"
+        "from starknet_py.abi.v2 import AbiParser\n"
+        "assert 'crypto_cpp_py' not in sys.modules\n"
+        "pedersen_hash(1, 2)\n"
+        "assert 'crypto_cpp_py' in sys.modules and 'lark' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
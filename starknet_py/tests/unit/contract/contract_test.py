@@ -1,7 +1,23 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
 from starknet_py.contract import Contract, DeclareResult, DeployResult
+from starknet_py.hash import class_hash_cache as class_hash_cache_module
+from starknet_py.hash import transaction as transaction_hash_module
+from starknet_py.hash.class_hash_cache import ClassHashCache
+from starknet_py.net.account.account import Account
 from starknet_py.net.account.base_account import BaseAccount
+from starknet_py.net.client_models import DeclareTransactionResponse
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+from starknet_py.tests.e2e.fixtures.constants import (
+    MAX_FEE,
+    MAX_RESOURCE_BOUNDS_L1,
+    PRECOMPILED_CONTRACTS_DIR,
+)
+from starknet_py.tests.e2e.fixtures.misc import read_contract
 
 
 @pytest.mark.parametrize("param", ["_account", "class_hash", "compiled_contract"])
@@ -59,3 +75,53 @@ def test_throws_on_wrong_abi(account):
             provider=account,
             cairo_version=1,
         )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "declare, fee_kwargs",
+    [
+        (Contract.declare_v2, {"max_fee": MAX_FEE}),
+        (Contract.declare_v3, {"l1_resource_bounds": MAX_RESOURCE_BOUNDS_L1}),
+    ],
+)
+async def test_declare_with_class_hash_cache(mocker, declare, fee_kwargs):
+    client = FullNodeClient(node_url="/rpc")
+    mocker.patch.object(
+        client,
+        "declare",
+        AsyncMock(
+            return_value=DeclareTransactionResponse(transaction_hash=1, class_hash=2)
+        ),
+    )
+    account = Account(
+        client=client,
+        address=0x123,
+        key_pair=KeyPair.from_private_key(0x456),
+        chain=StarknetChainId.SEPOLIA,
+    )
+    compiled_contract = read_contract(
+        "argent_account.json", directory=PRECOMPILED_CONTRACTS_DIR
+    )
+    compiled_contract_casm = read_contract(
+        "argent_account.casm", directory=PRECOMPILED_CONTRACTS_DIR
+    )
+    kwargs = {
+        "compiled_contract_casm": compiled_contract_casm,
+        "nonce": 0,
+        **fee_kwargs,
+    }
+    expected = await declare(account, compiled_contract, **kwargs)
+
+    cache = ClassHashCache()
+    first = await declare(account, compiled_contract, class_hash_cache=cache, **kwargs)
+    spies = [
+        mocker.spy(transaction_hash_module, "compute_sierra_class_hash"),
+        mocker.spy(class_hash_cache_module, "compute_sierra_class_hash"),
+        mocker.spy(class_hash_cache_module, "compute_casm_class_hash"),
+    ]
+    second = await declare(account, compiled_contract, class_hash_cache=cache, **kwargs)
+
+    assert first.declare_transaction == expected.declare_transaction
+    assert second.declare_transaction == expected.declare_transaction
+    assert all(spy.call_count == 0 for spy in spies)
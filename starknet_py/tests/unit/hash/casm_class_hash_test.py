@@ -1,8 +1,14 @@
 # fmt: off
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from starknet_py.common import create_casm_class
-from starknet_py.hash.casm_class_hash import compute_casm_class_hash
+from starknet_py.hash import casm_class_hash as casm_class_hash_module
+from starknet_py.hash.casm_class_hash import (
+    BytecodeSegmentHashCache,
+    compute_casm_class_hash,
+)
 from starknet_py.tests.e2e.fixtures.constants import PRECOMPILED_CONTRACTS_DIR
 from starknet_py.tests.e2e.fixtures.misc import (
     ContractVersion,
@@ -48,3 +54,49 @@ def test_precompiled_compute_casm_class_hash(casm_contract_class_source, expecte
     casm_class = create_casm_class(casm_contract_class_str)
     casm_class_hash = compute_casm_class_hash(casm_class)
     assert casm_class_hash == expected_casm_class_hash
+
+
+@pytest.mark.parametrize("use_executor, use_cache", [(True, False), (False, True), (True, True)])
+def test_compute_casm_class_hash_with_executor_and_cache(use_executor, use_cache):
+    casm_class = create_casm_class(
+        read_contract("starknet_contract_v2_6.casm", directory=PRECOMPILED_CONTRACTS_DIR)
+    )
+    cache = BytecodeSegmentHashCache() if use_cache else None
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            casm_class_hash = compute_casm_class_hash(
+                casm_class,
+                executor=executor if use_executor else None,
+                segment_hash_cache=cache,
+            )
+            assert casm_class_hash == 0x603dd72504d8b0bc54df4f1102fdcf87fc3b2b94750a9083a5876913eec08e4
+
+
+def test_segment_hash_cache_rehashes_changed_segments(mocker):
+    casm_class = create_casm_class(
+        read_contract("starknet_contract_v2_6.casm", directory=PRECOMPILED_CONTRACTS_DIR)
+    )
+    cache = BytecodeSegmentHashCache()
+    compute_casm_class_hash(casm_class, segment_hash_cache=cache)
+
+    casm_class.bytecode[-1] += 1
+    poseidon_spy = mocker.spy(casm_class_hash_module, "poseidon_hash_iter")
+    casm_class_hash = compute_casm_class_hash(casm_class, segment_hash_cache=cache)
+
+    # Hash of the changed segment and hash of the root node
+    assert poseidon_spy.call_count == 2
+    assert casm_class_hash == compute_casm_class_hash(casm_class)
+
+
+def test_segment_hash_cache_eviction():
+    cache = BytecodeSegmentHashCache(max_size=2)
+    cache.set([1], 1)
+    cache.set([2], 2)
+    assert cache.get([1]) == 1
+
+    cache.set([3], 3)
+
+    assert cache.get([2]) is None
+    assert cache.get([1]) == 1
+    assert cache.get([3]) == 3
@@ -0,0 +1,89 @@
+import pytest
+
+from starknet_py.common import create_sierra_compiled_contract
+from starknet_py.hash import class_hash_cache as class_hash_cache_module
+from starknet_py.hash.class_hash_cache import ClassHashCache
+from starknet_py.hash.sierra_class_hash import compute_sierra_class_hash
+from starknet_py.tests.e2e.fixtures.constants import PRECOMPILED_CONTRACTS_DIR
+from starknet_py.tests.e2e.fixtures.misc import read_contract
+
+CASM_FILE = PRECOMPILED_CONTRACTS_DIR / "minimal_contract_compiled_v2_1.casm"
+COMPILED_CLASS_HASH = 0x186F6C4CA3AF40DBCBF3F08F828AB0EE072938AAAEDCCC74EF3B9840CBD9FB3
+SIERRA_FILE = PRECOMPILED_CONTRACTS_DIR / "argent_account.json"
+
+
+def test_compiled_class_hash_is_cached(mocker):
+    compute_spy = mocker.spy(class_hash_cache_module, "compute_casm_class_hash")
+    cache = ClassHashCache()
+
+    assert cache.compiled_class_hash_from_file(CASM_FILE) == COMPILED_CLASS_HASH
+    assert cache.compiled_class_hash(CASM_FILE.read_text()) == COMPILED_CLASS_HASH
+
+    assert compute_spy.call_count == 1
+
+
+def test_sierra_class_hash():
+    compiled_contract = read_contract(
+        "argent_account.json", directory=PRECOMPILED_CONTRACTS_DIR
+    )
+    cache = ClassHashCache()
+
+    assert cache.class_hash_from_file(SIERRA_FILE) == compute_sierra_class_hash(
+        create_sierra_compiled_contract(compiled_contract)
+    )
+
+
+def test_class_hash_and_compiled_class_hash_are_separate(mocker):
+    mocker.patch.object(class_hash_cache_module, "_compute_class_hash", return_value=1)
+    mocker.patch.object(
+        class_hash_cache_module, "compute_casm_class_hash", return_value=2
+    )
+    mocker.patch.object(class_hash_cache_module, "create_casm_class")
+    cache = ClassHashCache()
+
+    assert cache.class_hash("{}") == 1
+    assert cache.compiled_class_hash("{}") == 2
+
+
+def test_hashes_are_persisted(tmp_path, mocker):
+    path = tmp_path / "cache" / "class_hashes.json"
+    ClassHashCache(path).compiled_class_hash_from_file(CASM_FILE)
+    compute_spy = mocker.spy(class_hash_cache_module, "compute_casm_class_hash")
+
+    cache = ClassHashCache(path)
+
+    assert cache.compiled_class_hash_from_file(CASM_FILE) == COMPILED_CLASS_HASH
+    assert compute_spy.call_count == 0
+
+    cache.clear()
+    assert not path.exists()
+
+
+def test_damaged_file_is_ignored(tmp_path):
+    path = tmp_path / "class_hashes.json"
+    path.write_text("{not json")
+
+    cache = ClassHashCache(path)
+
+    assert cache.compiled_class_hash_from_file(CASM_FILE) == COMPILED_CLASS_HASH
+    assert (
+        ClassHashCache(path).compiled_class_hash_from_file(CASM_FILE)
+        == COMPILED_CLASS_HASH
+    )
+
+
+def test_memory_eviction(mocker):
+    compute = mocker.patch.object(
+        class_hash_cache_module, "_compute_class_hash", side_effect=len
+    )
+    cache = ClassHashCache(max_size=2)
+
+    for artifact in ["a", "bb", "a", "ccc", "a", "bb"]:
+        assert cache.class_hash(artifact) == len(artifact)
+
+    assert [call.args[0] for call in compute.call_args_list] == ["a", "bb", "ccc", "bb"]
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size must be greater than 0"):
+        ClassHashCache(max_size=0)
@@ -0,0 +1,89 @@
+# fmt: off
+import copy
+import json
+
+import pytest
+
+from starknet_py.hash.class_hash import _iter_json, compute_class_hash
+from starknet_py.net.client_models import (
+    DeprecatedContractClass,
+    EntryPoint,
+    EntryPointsByType,
+)
+
+
+def _contract_class(with_compiler_version, empty_attributes, with_debug_info):
+    program = {
+        "attributes": [] if empty_attributes else [
+            {"name": "error_message", "value": "Ownable: caller", "start_pc": 1, "end_pc": 5,
+             "accessible_scopes": [], "flow_tracking_data": None},
+            {"name": "error_message", "value": "Überflow ✓", "start_pc": 7, "end_pc": 9,
+             "accessible_scopes": ["__main__"],
+             "flow_tracking_data": {"ap_tracking": {"group": 1, "offset": 0}, "reference_ids": {}}},
+        ],
+        "builtins": ["pedersen", "range_check"],
+        "data": [hex(i * 7919 + 3) for i in range(30)],
+        "hints": {
+            str(i): [{"code": f"memory[ap] = {i}", "accessible_scopes": ["__main__"],
+                      "flow_tracking_data": {"ap_tracking": {"group": i, "offset": 0}, "reference_ids": {}}}]
+            for i in range(0, 200, 7)
+        },
+        "identifiers": {
+            "__main__.foo": {"type": "function", "decorators": ["external"], "pc": 3},
+            "__main__.foo.Args": {"type": "struct", "size": 2, "full_name": "__main__.foo.Args", "members": {
+                "a": {"cairo_type": "felt", "offset": 0}, "b": {"cairo_type": "(x: felt, y: felt*)", "offset": 1}}},
+            "__main__.foo.Return": {"type": "type_definition", "cairo_type": "(res: felt, other :felt)"},
+            "__main__.bar": {"type": "reference", "cairo_type": "felt", "value": 1.5, "pc": None},
+        },
+        "main_scope": "__main__",
+        "prime": "0x800000000000011000000000000000000000000000000000000000000000001",
+        "reference_manager": {"references": [
+            {"ap_tracking_data": {"group": 0, "offset": 0}, "pc": 0, "value": "[cast(fp + (-3), felt*)]"}
+        ]},
+    }
+    if with_debug_info:
+        program["debug_info"] = {"file_contents": {"a.cairo": "func foo() {}"}}
+    if with_compiler_version:
+        program["compiler_version"] = "0.11.0"
+
+    return DeprecatedContractClass(
+        program=program,
+        entry_points_by_type=EntryPointsByType(
+            constructor=[
+                EntryPoint(offset=0x10, selector=0x28ffe4ff0f226a9107253e17a904099aa4f63a02a5621de0576e5aa71bc5194)
+            ],
+            external=[EntryPoint(offset=3, selector=0x1), EntryPoint(offset=5, selector=0x2)],
+            l1_handler=[],
+        ),
+        abi=[{"type": "function", "name": "foo", "inputs": [{"name": "a", "type": "felt"}], "outputs": []}],
+    )
+
+
+@pytest.mark.parametrize(
+    "with_compiler_version, empty_attributes, with_debug_info, expected_class_hash",
+    [
+        (True, False, True, 0x4ffb69f64b86b4ca02ce933b32b2c814c0e1fa3cede09ecdc02b3ddb0d56cf2),
+        (False, False, True, 0x49347d9fc628b0c8ef231a82c7931d5cb756a6bd872e802056d2df1762cbfda),
+        (True, True, True, 0x46db5f729812c8a204f9592a6a67773f05ddd06824dcf4a5090adededec016e),
+        (False, True, False, 0x6d7cf7684ae183f7fd82f153249e41a1e35918d08efc5cbef6711b5ba4eb236),
+    ],
+)
+def test_compute_class_hash(with_compiler_version, empty_attributes, with_debug_info, expected_class_hash):
+    contract_class = _contract_class(with_compiler_version, empty_attributes, with_debug_info)
+    original_contract_class = copy.deepcopy(contract_class)
+
+    assert compute_class_hash(contract_class) == expected_class_hash
+    assert contract_class == original_contract_class
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        {"a": {"b": {"c": {"d": [1, 2]}}}, "e": None, "f": "ü\"\n"},
+        {"data": [hex(i) for i in range(2500)], "nested": [{"x": 1.5, "y": True}] * 1025},
+    ],
+)
+def test_iter_json(value):
+    assert "".join(_iter_json(value, depth=3)) == json.dumps(value)
@@ -1,13 +1,23 @@
 # pylint: disable=line-too-long
 # fmt: off
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from poseidon_py.poseidon_hash import poseidon_hash_many
 
+from starknet_py.constants import EC_ORDER
 from starknet_py.hash.utils import (
+    _batch_inverse,
     compute_hash_on_elements,
     encode_uint,
     encode_uint_list,
     keccak256,
+    message_signature,
     pedersen_hash,
+    poseidon_hash_iter,
+    private_to_stark_key,
+    verify_many,
+    verify_message_signature,
 )
 
 
@@ -85,3 +95,50 @@ def test_keccak256_strings(string, expected_hash):
 )
 def test_keccak256_ints(value, expected_hash):
     assert keccak256(encode_uint(value)) == expected_hash
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 10, 11])
+def test_poseidon_hash_iter(length):
+    data = [3**i for i in range(length)]
+
+    assert poseidon_hash_iter(iter(data)) == poseidon_hash_many(data)
+
+
+def test_batch_inverse():
+    values = [1, 2, 3, EC_ORDER - 1, 2**200 + 7]
+
+    assert _batch_inverse(values, EC_ORDER) == [
+        pow(value, -1, EC_ORDER) for value in values
+    ]
+    assert not _batch_inverse([], EC_ORDER)
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_verify_many(use_executor):
+    private_key = 0x1234
+    public_key = private_to_stark_key(private_key)
+    messages = [
+        (msg_hash, list(message_signature(msg_hash, private_key)), public_key)
+        for msg_hash in range(1, 6)
+    ]
+    messages += [
+        # Signature of a different message
+        (100, messages[0][1], public_key),
+        # Different public key
+        (messages[1][0], messages[1][1], private_to_stark_key(private_key + 1)),
+        # Malformed signatures
+        (1, [1, 0], public_key),
+        (1, [1], public_key),
+        # Duplicated message
+        messages[2],
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = verify_many(
+            messages, executor=executor if use_executor else None, chunk_size=3
+        )
+
+    assert results == [True] * 5 + [False] * 4 + [True]
+    assert results[:7] == [
+        verify_message_signature(*message) for message in messages[:7]
+    ]
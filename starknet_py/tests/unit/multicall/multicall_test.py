@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.abi.v2 import Abi
+from starknet_py.cairo.data_types import FeltType, UintType
+from starknet_py.contract import PreparedFunctionCall
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.multicall import MulticallClient
+from starknet_py.net.client_models import Call
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.serialization.factory import serializer_for_function_v1
+
+AGGREGATOR_ADDRESS = 0x123
+
+calls = [
+    Call(to_addr=0x1, selector=0x10, calldata=[]),
+    Call(to_addr=0x2, selector=0x20, calldata=[7, 8]),
+    Call(to_addr=0x3, selector=0x30, calldata=[9]),
+]
+
+
+@pytest.mark.parametrize("cairo_version, calls_size", [(1, 2), (0, 8)])
+@pytest.mark.asyncio
+async def test_call_with_aggregator(cairo_version, calls_size):
+    client = FullNodeClient(node_url="/rpc")
+    multicall = MulticallClient(
+        client,
+        AGGREGATOR_ADDRESS,
+        aggregator_cairo_version=cairo_version,
+        batch_size=2,
+    )
+
+    with patch(
+        f"{FullNodeClient.__module__}.FullNodeClient.call_contract", AsyncMock()
+    ) as mocked_call_contract:
+        mocked_call_contract.side_effect = [
+            [100, 2, 1, 5, 2, 6, 7],
+            [100, 1, 0],
+        ]
+
+        results = await multicall.call_raw(calls, block_number=100)
+
+    assert results == [[5], [6, 7], []]
+    assert mocked_call_contract.call_count == 2
+
+    (aggregate_call,), kwargs = mocked_call_contract.call_args_list[0]
+    assert aggregate_call.to_addr == AGGREGATOR_ADDRESS
+    assert aggregate_call.selector == get_selector_from_name("aggregate")
+    assert aggregate_call.calldata == [calls_size, 0x1, 0x10, 0, 0x2, 0x20, 2, 7, 8]
+    assert kwargs == {"block_hash": None, "block_number": 100}
+
+
+@pytest.mark.parametrize(
+    "result", [[100, 2, 1, 5], [100, 2, 1, 5, 1, 6, 7], [100, 2, 1, 5, 3, 6]]
+)
+@pytest.mark.asyncio
+async def test_call_with_aggregator_unexpected_response(result):
+    client = FullNodeClient(node_url="/rpc")
+    multicall = MulticallClient(client, AGGREGATOR_ADDRESS)
+
+    with patch(
+        f"{FullNodeClient.__module__}.FullNodeClient.call_contract", AsyncMock()
+    ) as mocked_call_contract:
+        mocked_call_contract.return_value = result
+
+        with pytest.raises(ValueError, match="Unexpected aggregator response"):
+            await multicall.call_raw(calls[:2])
+
+
+@pytest.mark.asyncio
+async def test_call_with_json_rpc_batching():
+    client = FullNodeClient(node_url="/rpc")
+    multicall = MulticallClient(client, batch_size=2)
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request", AsyncMock()
+    ) as mocked_request:
+        mocked_request.side_effect = [
+            [
+                {"jsonrpc": "2.0", "id": 1, "result": ["0x6", "0x7"]},
+                {"jsonrpc": "2.0", "id": 0, "result": ["0x5"]},
+            ],
+            [{"jsonrpc": "2.0", "id": 0, "result": []}],
+        ]
+
+        results = await multicall.call_raw(calls, block_number="latest")
+
+    assert results == [[5], [6, 7], []]
+
+    payload = mocked_request.call_args_list[0][1]["payload"]
+    assert [request["method"] for request in payload] == ["starknet_call"] * 2
+    assert payload[1]["params"] == {
+        "request": {
+            "contract_address": "0x2",
+            "entry_point_selector": "0x20",
+            "calldata": ["0x7", "0x8"],
+        },
+        "block_id": "latest",
+    }
+
+
+@pytest.mark.asyncio
+async def test_call_deserializes_prepared_function_calls():
+    client = FullNodeClient(node_url="/rpc")
+    multicall = MulticallClient(client, AGGREGATOR_ADDRESS)
+    function = Abi.Function(
+        name="balance_of",
+        inputs=OrderedDict(account=FeltType()),
+        outputs=[UintType(256)],
+    )
+    prepared_call = PreparedFunctionCall(
+        to_addr=0x2,
+        selector=get_selector_from_name("balance_of"),
+        calldata=[0x5],
+        _client=client,
+        _payload_transformer=serializer_for_function_v1(function),
+    )
+
+    with patch(
+        f"{FullNodeClient.__module__}.FullNodeClient.call_contract", AsyncMock()
+    ) as mocked_call_contract:
+        mocked_call_contract.return_value = [100, 2, 1, 5, 2, 1, 2]
+
+        results = await multicall.call([calls[0], prepared_call])
+
+    assert results == [[5], (1 + (2 << 128),)]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError, match="Argument batch_size must be greater than 0."):
+        MulticallClient(FullNodeClient(node_url="/rpc"), batch_size=0)
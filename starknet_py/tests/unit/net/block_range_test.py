@@ -0,0 +1,98 @@
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.block_range import BlockRangeStats
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+
+
+class _FakeNode:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: List[List[int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_blocks_batch(self, block_numbers: List[int], kind: str):
+        self.requests.append(block_numbers)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later blocks come back first
+        await asyncio.sleep(self.delay / (1 + block_numbers[0]))
+        self.in_flight -= 1
+        return [f"{kind}-{number}" for number in block_numbers]
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_in_order():
+    client = FullNodeClient(node_url="")
+    node = _FakeNode(delay=0.01)
+    stats = BlockRangeStats()
+
+    with patch.object(client, "get_blocks_batch", node.get_blocks_batch):
+        blocks = [
+            block
+            async for block in client.iter_blocks(
+                3, 24, "traces", batch_size=4, max_concurrent_requests=3, stats=stats
+            )
+        ]
+
+    assert blocks == [(number, f"traces-{number}") for number in range(3, 25)]
+    assert node.requests[0] == [3, 4, 5, 6]
+    assert node.requests[-1] == [23, 24]
+    assert node.max_in_flight <= 3
+    assert stats.requests == 6
+    assert stats.blocks_fetched == stats.blocks_yielded == 22
+    assert stats.buffered_blocks == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_backpressure():
+    client = FullNodeClient(node_url="")
+    node = _FakeNode()
+
+    with patch.object(client, "get_blocks_batch", node.get_blocks_batch):
+        blocks = client.iter_blocks(0, 99, batch_size=5, max_concurrent_requests=2)
+        assert await blocks.__anext__() == (0, "receipts-0")
+        await asyncio.sleep(0.01)
+
+        # Only the window of requests is sent until the consumer takes more blocks
+        assert len(node.requests) == 2
+        await blocks.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_empty_range():
+    client = FullNodeClient(node_url="")
+
+    assert [block async for block in client.iter_blocks(5, 4)] == []
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_invalid_arguments():
+    client = FullNodeClient(node_url="")
+
+    with pytest.raises(ValueError, match="Unknown block kind"):
+        await client.iter_blocks(0, 1, "blocks").__anext__()  # type: ignore
+    with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+        await client.iter_blocks(0, 1, batch_size=0).__anext__()
+
+
+@pytest.mark.asyncio
+async def test_get_blocks_batch():
+    client = FullNodeClient(node_url="")
+
+    with patch.object(
+        RpcHttpClient, "batch_call", AsyncMock(return_value=[[], []])
+    ) as batch_call:
+        assert await client.get_blocks_batch([7, 8], "traces") == [[], []]
+
+    batch_call.assert_awaited_once_with(
+        [
+            ("traceBlockTransactions", {"block_id": {"block_number": 7}}),
+            ("traceBlockTransactions", {"block_id": {"block_number": 8}}),
+        ]
+    )
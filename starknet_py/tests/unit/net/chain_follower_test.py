@@ -0,0 +1,207 @@
+from typing import Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from starknet_py.net.chain_follower import (
+    BlockApplied,
+    ChainFollower,
+    PendingTransactions,
+    ReorgTooDeepError,
+)
+from starknet_py.net.client_models import (
+    BlockHashAndNumber,
+    PendingStarknetBlockWithTxHashes,
+    StarknetBlockWithTxHashes,
+)
+
+
+class _FakeChain:
+    """
+    Chain of blocks, where hash of a block is its number plus a fork offset.
+    """
+
+    def __init__(self, length: int, block_time: int = 6):
+        self.block_time = block_time
+        self.blocks: Dict[int, Mock] = {}
+        self.pending_transactions: List[int] = []
+        self.extend(length)
+
+    def extend(self, count: int, fork: int = 0):
+        start = len(self.blocks)
+        for number in range(start, start + count):
+            parent_hash = self.blocks[number - 1].block_hash if number > 0 else 0
+            self.blocks[number] = Mock(
+                spec=StarknetBlockWithTxHashes,
+                block_number=number,
+                block_hash=1000 * fork + number + 1,
+                parent_hash=parent_hash,
+                timestamp=number * self.block_time,
+            )
+
+    def fork(self, depth: int, length: int, fork: int):
+        for number in range(len(self.blocks) - depth, len(self.blocks)):
+            del self.blocks[number]
+        self.extend(length, fork)
+
+    async def get_block_hash_and_number(self):
+        head = self.blocks[len(self.blocks) - 1]
+        return BlockHashAndNumber(
+            block_hash=head.block_hash, block_number=head.block_number
+        )
+
+    async def get_block_with_tx_hashes(self, block_number=None):
+        if block_number == "pending":
+            return Mock(
+                spec=PendingStarknetBlockWithTxHashes,
+                parent_hash=self.blocks[len(self.blocks) - 1].block_hash,
+                transactions=list(self.pending_transactions),
+            )
+        return self.blocks[block_number]
+
+
+def _follower(
+    chain: _FakeChain, start_block_number: Optional[int] = None, **kwargs
+) -> ChainFollower:
+    return ChainFollower(chain, start_block_number, **kwargs)  # type: ignore
+
+
+def _summary(events) -> List[str]:
+    return [
+        (
+            f"+{event.block.block_number}"
+            if isinstance(event, BlockApplied)
+            else f"-{event.block.block_number}"
+        )
+        for event in events
+    ]
+
+
+@pytest.mark.asyncio
+async def test_follow_new_blocks():
+    chain = _FakeChain(5)
+    follower = _follower(chain, start_block_number=2)
+
+    assert _summary(await follower.poll()) == ["+2", "+3", "+4"]
+    assert await follower.poll() == []
+
+    chain.extend(2)
+    assert _summary(await follower.poll()) == ["+5", "+6"]
+    assert follower.head is not None and follower.head.block_number == 6
+
+
+@pytest.mark.asyncio
+async def test_follow_from_head():
+    chain = _FakeChain(5)
+    follower = _follower(chain)
+
+    assert _summary(await follower.poll()) == ["+4"]
+
+
+@pytest.mark.asyncio
+async def test_reorg():
+    chain = _FakeChain(6)
+    follower = _follower(chain, start_block_number=0)
+    await follower.poll()
+
+    chain.fork(depth=2, length=3, fork=1)
+    events = await follower.poll()
+
+    assert _summary(events) == ["-5", "-4", "+4", "+5", "+6"]
+    assert follower.head is not None
+    assert follower.head.block_hash == chain.blocks[6].block_hash
+
+
+@pytest.mark.asyncio
+async def test_reorg_at_same_height():
+    chain = _FakeChain(6)
+    follower = _follower(chain, start_block_number=0)
+    await follower.poll()
+
+    chain.fork(depth=1, length=1, fork=1)
+
+    assert _summary(await follower.poll()) == ["-5", "+5"]
+
+
+@pytest.mark.asyncio
+async def test_lagging_node_is_ignored():
+    chain = _FakeChain(6)
+    follower = _follower(chain, start_block_number=0)
+    await follower.poll()
+
+    lagging_head = chain.blocks.pop(5)
+    assert await follower.poll() == []
+
+    chain.blocks[5] = lagging_head
+    assert await follower.poll() == []
+
+
+@pytest.mark.asyncio
+async def test_reorg_deeper_than_window():
+    chain = _FakeChain(6)
+    follower = _follower(chain, start_block_number=0, window_size=3)
+    await follower.poll()
+
+    chain.fork(depth=4, length=5, fork=1)
+
+    with pytest.raises(ReorgTooDeepError):
+        await follower.poll()
+
+
+@pytest.mark.asyncio
+async def test_catching_up():
+    chain = _FakeChain(10)
+    follower = _follower(chain, start_block_number=0, max_blocks_per_poll=4)
+
+    assert _summary(await follower.poll()) == ["+0", "+1", "+2", "+3"]
+    assert follower.poll_interval == 0.0
+    assert _summary(await follower.poll()) == ["+4", "+5", "+6", "+7"]
+    assert _summary(await follower.poll()) == ["+8", "+9"]
+    assert follower.poll_interval > 0.0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_poll_interval():
+    chain = _FakeChain(5, block_time=20)
+    follower = _follower(
+        chain, start_block_number=0, polls_per_block=4, max_poll_interval=4.0
+    )
+
+    assert follower.poll_interval == follower.min_poll_interval
+    await follower.poll()
+
+    assert follower.block_time == 20
+    assert follower.poll_interval == 4.0
+
+
+@pytest.mark.asyncio
+async def test_pending_transactions():
+    chain = _FakeChain(3)
+    follower = _follower(chain, follow_pending=True)
+
+    chain.pending_transactions = [11, 12]
+    assert (await follower.poll())[-1] == PendingTransactions(
+        parent_hash=chain.blocks[2].block_hash, transaction_hashes=[11, 12]
+    )
+
+    chain.pending_transactions = [11, 12, 13]
+    assert (await follower.poll())[-1] == PendingTransactions(
+        parent_hash=chain.blocks[2].block_hash, transaction_hashes=[13]
+    )
+    assert await follower.poll() == []
+
+    chain.extend(1)
+    chain.pending_transactions = [14]
+    events = await follower.poll()
+
+    assert isinstance(events[0], BlockApplied)
+    assert events[1] == PendingTransactions(
+        parent_hash=chain.blocks[3].block_hash, transaction_hashes=[14]
+    )
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="window_size must be greater than 0"):
+        _follower(_FakeChain(1), window_size=0)
+    with pytest.raises(ValueError, match="min_poll_interval"):
+        _follower(_FakeChain(1), min_poll_interval=5, max_poll_interval=1)
@@ -1,9 +1,11 @@
 import dataclasses
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from starknet_py.constants import ADDR_BOUND
 from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_errors import ClientError
 from starknet_py.net.client_models import (
     Call,
     DAMode,
@@ -12,8 +14,7 @@ from starknet_py.net.client_models import (
     TransactionType,
     TransactionV3,
 )
-from starknet_py.net.client_utils import _create_broadcasted_txn
-from starknet_py.net.full_node_client import _to_storage_key
+from starknet_py.net.client_utils import _create_broadcasted_txn, _to_storage_key
 from starknet_py.net.http_client import RpcHttpClient, ServerError
 from starknet_py.net.models.transaction import (
     DeclareV2,
@@ -64,6 +65,65 @@ def test_handle_rpc_error_server_error():
         RpcHttpClient.handle_rpc_error(no_error_dict)
 
 
+@pytest.mark.parametrize(
+    "response, error",
+    [
+        (
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": 20, "message": "Contract not found"},
+                },
+            ],
+            ClientError,
+        ),
+        ([{"jsonrpc": "2.0", "id": 0, "result": "0x1"}], ServerError),
+        (
+            {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid"}},
+            ClientError,
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_batch_call_errors(response, error):
+    client = RpcHttpClient(url="/rpc")
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request", AsyncMock()
+    ) as mocked_request:
+        mocked_request.return_value = response
+
+        with pytest.raises(error):
+            await client.batch_call([("getNonce", None), ("getNonce", None)])
+
+
+@pytest.mark.asyncio
+async def test_batch_call_return_exceptions():
+    client = RpcHttpClient(url="/rpc")
+    response = [
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": 20, "message": "Not found"}},
+        {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+    ]
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request",
+        AsyncMock(return_value=response),
+    ):
+        result, error = await client.batch_call(
+            [("getNonce", None), ("getNonce", None)], return_exceptions=True
+        )
+
+    assert result == "0x1"
+    assert isinstance(error, ClientError) and error.code == 20
+
+
+@pytest.mark.asyncio
+async def test_batch_call_empty():
+    assert await RpcHttpClient(url="/rpc").batch_call([]) == []
+
+
 @pytest.mark.parametrize(
     "key, expected",
     [
@@ -105,7 +165,9 @@ async def test_broadcasted_txn_declare_v3(
     assert brodcasted_txn["type"] == TransactionType.DECLARE.name
 
     expected_keys = dataclasses.fields(DeclareV3)
-    assert all(key.name in brodcasted_txn for key in expected_keys)
+    assert all(
+        key.name in brodcasted_txn for key in expected_keys if key.name != "class_hash"
+    )
 
 
 @pytest.mark.asyncio
@@ -123,7 +185,9 @@ async def test_broadcasted_txn_declare_v2(
     assert brodcasted_txn["type"] == TransactionType.DECLARE.name
 
     expected_keys = dataclasses.fields(DeclareV2)
-    assert all(key.name in brodcasted_txn for key in expected_keys)
+    assert all(
+        key.name in brodcasted_txn for key in expected_keys if key.name != "class_hash"
+    )
 
 
 @pytest.mark.asyncio
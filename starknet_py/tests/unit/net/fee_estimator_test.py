@@ -0,0 +1,294 @@
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import Call, EstimatedFee, PriceUnit
+from starknet_py.net.fee_estimator import FeeEstimator
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.models.transaction import InvokeV1
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+# Sender of transactions the fake node fails to estimate
+REVERTING_SENDER = 0xDEAD
+
+
+def _invoke(sender_address: int, calldata: List[int], nonce: int = 0) -> InvokeV1:
+    return InvokeV1(
+        version=1,
+        signature=[],
+        nonce=nonce,
+        max_fee=0,
+        sender_address=sender_address,
+        calldata=calldata,
+    )
+
+
+def _estimated_fee(overall_fee: int) -> EstimatedFee:
+    return EstimatedFee(
+        gas_consumed=overall_fee,
+        gas_price=1,
+        data_gas_consumed=0,
+        data_gas_price=1,
+        overall_fee=overall_fee,
+        unit=PriceUnit.WEI,
+    )
+
+
+class _FakeNode:
+    def __init__(self):
+        self.block_number = 10
+        self.requests: List[List[InvokeV1]] = []
+        self.skip_validate: List[bool] = []
+
+    async def get_block_number(self):
+        return self.block_number
+
+    async def estimate_fee_batch(
+        self, transactions, skip_validate=False, return_exceptions=False
+    ):
+        self.requests.append(transactions)
+        self.skip_validate.append(skip_validate)
+        results = [
+            (
+                ClientError("Transaction reverted", code="41")
+                if tx.sender_address == REVERTING_SENDER
+                else _estimated_fee(sum(tx.calldata))
+            )
+            for tx in transactions
+        ]
+        for result in results:
+            if isinstance(result, Exception) and not return_exceptions:
+                raise result
+        return results
+
+
+@pytest.fixture(name="node")
+def create_node():
+    return _FakeNode()
+
+
+@pytest.fixture(name="client")
+def create_client(node):
+    client = FullNodeClient(node_url="")
+    with patch.object(client, "get_block_number", node.get_block_number), patch.object(
+        client, "estimate_fee_batch", node.estimate_fee_batch
+    ):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_estimates_are_batched(client, node):
+    estimator = FeeEstimator(client)
+
+    fees = await estimator.estimate_fees(
+        [_invoke(1, [1]), _invoke(2, [2]), _invoke(1, [1], nonce=1)]
+    )
+
+    assert [fee.overall_fee for fee in fees] == [1, 2, 1]
+    # Transactions of the same shape are estimated once
+    assert len(node.requests) == 1 and len(node.requests[0]) == 2
+    assert estimator.block_number == 10
+    assert estimator.stats.requests == 1
+    assert estimator.stats.estimated_transactions == 2
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size(client, node):
+    estimator = FeeEstimator(client, max_batch_size=2, skip_validate=True)
+
+    await estimator.estimate_fees([_invoke(sender, [sender]) for sender in range(5)])
+
+    assert [len(request) for request in node.requests] == [2, 2, 1]
+    assert node.skip_validate == [True, True, True]
+
+
+@pytest.mark.asyncio
+async def test_cached_estimates(client, node):
+    estimator = FeeEstimator(client, max_age_blocks=2)
+
+    await estimator.estimate_fee(_invoke(1, [1]))
+    assert (await estimator.estimate_fee(_invoke(1, [1], nonce=1))).overall_fee == 1
+    assert estimator.get_cached(_invoke(1, [2])) is None
+
+    estimator.update_block_number(11)
+    assert estimator.get_cached(_invoke(1, [1])) is not None
+
+    estimator.update_block_number(12)
+    assert estimator.get_cached(_invoke(1, [1])) is None
+    await estimator.estimate_fee(_invoke(1, [1]))
+
+    assert len(node.requests) == 2
+    assert estimator.stats.hits == 1
+    assert estimator.stats.misses == 2
+    assert estimator.stats.hit_rate == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_failed_estimate_in_batch(client, node):
+    estimator = FeeEstimator(client)
+
+    good, bad = await asyncio.gather(
+        estimator.estimate_fee(_invoke(1, [1])),
+        estimator.estimate_fee(_invoke(REVERTING_SENDER, [2])),
+        return_exceptions=True,
+    )
+
+    assert isinstance(good, EstimatedFee) and good.overall_fee == 1
+    assert isinstance(bad, ClientError) and bad.code == "41"
+    assert len(node.requests) == 1 and len(node.requests[0]) == 2
+    assert estimator.stats.failed_estimates == 1
+    # Failed estimates are not cached
+    assert estimator.get_cached(_invoke(REVERTING_SENDER, [2])) is None
+    assert estimator.get_cached(_invoke(1, [1])) is not None
+
+
+@pytest.mark.asyncio
+async def test_max_age(client):
+    estimator = FeeEstimator(client, max_age=0.01)
+
+    await estimator.estimate_fee(_invoke(1, [1]))
+    assert estimator.get_cached(_invoke(1, [1])) is not None
+
+    await asyncio.sleep(0.02)
+    assert estimator.get_cached(_invoke(1, [1])) is None
+
+
+@pytest.mark.asyncio
+async def test_block_number_refresh(client, node):
+    estimator = FeeEstimator(client, block_refresh_interval=0.01)
+
+    await estimator.estimate_fee(_invoke(1, [1]))
+    node.block_number = 11
+    await asyncio.sleep(0.02)
+    await estimator.estimate_fee(_invoke(1, [1]))
+
+    # The new block is noticed before the cached estimate is served
+    assert estimator.block_number == 11
+    assert len(node.requests) == 2
+    assert estimator.stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_block_number_without_refresh(client, node):
+    estimator = FeeEstimator(client, block_refresh_interval=None)
+
+    await estimator.estimate_fee(_invoke(1, [1]))
+    node.block_number = 11
+    await estimator.estimate_fee(_invoke(1, [1]))
+
+    # Without refresh, the block number is only updated by batch requests and update_block_number
+    assert len(node.requests) == 1
+    assert estimator.block_number == 10
+    estimator.update_block_number(11)
+    assert estimator.get_cached(_invoke(1, [1])) is None
+
+
+@pytest.mark.asyncio
+async def test_errors_are_propagated(client, node):
+    estimator = FeeEstimator(client)
+
+    with patch.object(
+        client, "estimate_fee_batch", AsyncMock(side_effect=ValueError("Failed"))
+    ):
+        with pytest.raises(ValueError, match="Failed"):
+            await estimator.estimate_fees([_invoke(1, [1]), _invoke(2, [2])])
+
+    assert (await estimator.estimate_fee(_invoke(1, [1]))).overall_fee == 1
+    assert len(node.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_simulate_transactions(client):
+    estimator = FeeEstimator(client, max_batch_size=2)
+
+    with patch.object(
+        client,
+        "simulate_transactions_batch",
+        AsyncMock(side_effect=lambda batch, **_: [tx.sender_address for tx in batch]),
+    ) as simulate_transactions_batch:
+        results = await estimator.simulate_transactions(
+            [_invoke(sender, []) for sender in range(3)]
+        )
+
+    assert results == [0, 1, 2]
+    assert simulate_transactions_batch.await_count == 2
+    assert estimator.stats.simulated_transactions == 3
+
+
+@pytest.mark.asyncio
+async def test_account_auto_estimate(client, node):
+    estimator = FeeEstimator(client)
+    account = Account(
+        address=0x1,
+        client=client,
+        key_pair=KeyPair(123, 456),
+        chain=StarknetChainId.SEPOLIA,
+        fee_estimator=estimator,
+    )
+    account._cairo_version = 1  # pylint: disable=protected-access
+    call = Call(to_addr=0x2, selector=0x3, calldata=[4])
+
+    first = await account.sign_invoke_v1(call, nonce=0, auto_estimate=True)
+    second = await account.sign_invoke_v1(call, nonce=1, auto_estimate=True)
+
+    assert first.max_fee == second.max_fee > 0
+    assert len(node.requests) == 1
+    assert node.requests[0][0].signature
+    assert estimator.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_estimate_fee_batch():
+    client = FullNodeClient(node_url="")
+    estimated_fee = {
+        "gas_consumed": "0x1",
+        "gas_price": "0x2",
+        "data_gas_consumed": "0x0",
+        "data_gas_price": "0x1",
+        "overall_fee": "0x2",
+        "unit": "WEI",
+    }
+
+    with patch(
+        f"{FullNodeClient.__module__}.RpcHttpClient.batch_call",
+        AsyncMock(return_value=[[estimated_fee], [estimated_fee]]),
+    ) as batch_call:
+        fees = await client.estimate_fee_batch(
+            [_invoke(1, [1]), _invoke(2, [2])], skip_validate=True
+        )
+
+    assert [fee.overall_fee for fee in fees] == [2, 2]
+    (calls,) = batch_call.call_args.args
+    assert [len(params["request"]) for _, params in calls] == [1, 1]
+    assert calls[0][1]["simulation_flags"] == ["SKIP_VALIDATE"]
+
+
+@pytest.mark.asyncio
+async def test_estimate_fee_batch_return_exceptions():
+    client = FullNodeClient(node_url="")
+    estimated_fee = {
+        "gas_consumed": "0x1",
+        "gas_price": "0x2",
+        "data_gas_consumed": "0x0",
+        "data_gas_price": "0x1",
+        "overall_fee": "0x2",
+        "unit": "WEI",
+    }
+    error = ClientError("Transaction reverted", code="41")
+
+    with patch(
+        f"{FullNodeClient.__module__}.RpcHttpClient.batch_call",
+        AsyncMock(return_value=[error, [estimated_fee]]),
+    ) as batch_call:
+        results = await client.estimate_fee_batch(
+            [_invoke(1, [1]), _invoke(2, [2])], return_exceptions=True
+        )
+
+    assert results[0] is error
+    assert isinstance(results[1], EstimatedFee) and results[1].overall_fee == 2
+    assert batch_call.call_args.kwargs["return_exceptions"] is True
@@ -0,0 +1,149 @@
+import json
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.instrumentation import (
+    Histogram,
+    Instrumentation,
+    MetricsCollector,
+    RequestMetrics,
+)
+
+
+def _response(body) -> AsyncMock:
+    return AsyncMock(return_value=json.dumps(body).encode())
+
+
+class _RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.requests: List[RequestMetrics] = []
+        self.schema_loads: List[str] = []
+
+    def on_request(self, metrics: RequestMetrics):
+        self.requests.append(metrics)
+
+    def on_schema_load(self, schema: str, duration: float):
+        self.schema_loads.append(schema)
+
+
+@pytest.mark.asyncio
+async def test_request_metrics():
+    instrumentation = _RecordingInstrumentation()
+    client = FullNodeClient(node_url="", instrumentation=instrumentation)
+    body = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "result": {"block_hash": "0x1", "block_number": 2},
+    }
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request_raw", _response(body)
+    ) as request_raw:
+        result = await client.get_block_hash_and_number()
+
+    assert result.block_number == 2
+    assert len(instrumentation.requests) == 1
+    metrics = instrumentation.requests[0]
+    assert metrics.method == "blockHashAndNumber"
+    assert metrics.batch_size == 1
+    assert metrics.request_size == len(request_raw.call_args.kwargs["data"])
+    assert metrics.response_size == len(json.dumps(body))
+    assert metrics.total_time >= metrics.network_time > 0
+    assert metrics.error is None
+    assert instrumentation.schema_loads == ["BlockHashAndNumberSchema"]
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_of_errors():
+    collector = MetricsCollector()
+    client = FullNodeClient(node_url="", instrumentation=collector)
+    body = {"jsonrpc": "2.0", "id": 0, "error": {"code": 32, "message": "Failed"}}
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request_raw", _response(body)
+    ):
+        with pytest.raises(ClientError):
+            await client.get_block_number()
+
+    assert collector.errors() == {("blockNumber", "ClientError"): 1}
+    histogram = collector.histogram("request_duration", "blockNumber")
+    assert histogram is not None and histogram.count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_request_metrics():
+    instrumentation = _RecordingInstrumentation()
+    client = RpcHttpClient(url="", instrumentation=instrumentation)
+    body = [{"jsonrpc": "2.0", "id": index, "result": "0x1"} for index in range(3)]
+
+    with patch(
+        f"{RpcHttpClient.__module__}.RpcHttpClient.request_raw", _response(body)
+    ):
+        await client.batch_call([("getNonce", None), ("getNonce", None)])
+        await client.batch_call([("getNonce", None), ("chainId", None)])
+
+    assert [
+        (metrics.method, metrics.batch_size) for metrics in instrumentation.requests
+    ] == [
+        ("getNonce", 2),
+        ("batch", 2),
+    ]
+
+
+def test_histogram():
+    histogram = Histogram([1, 2])
+
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative_counts() == [(1, 2), (2, 3), (float("inf"), 4)]
+    assert histogram.sum == 6 and histogram.count == 4
+
+
+def test_to_prometheus():
+    collector = MetricsCollector(duration_buckets=[0.1, 1], size_buckets=[100])
+    assert collector.to_prometheus() == ""
+
+    collector.on_request(
+        RequestMetrics(
+            method="getBlockWithTxs",
+            batch_size=1,
+            request_size=80,
+            response_size=300,
+            network_time=0.5,
+            decode_time=0.25,
+            error=ClientError(message="Failed"),
+        )
+    )
+    collector.on_schema_load("StarknetBlockSchema", 0.05)
+    exported = collector.to_prometheus()
+
+    assert "# TYPE starknet_py_rpc_request_duration_seconds histogram" in exported
+    assert (
+        'starknet_py_rpc_request_duration_seconds_bucket{method="getBlockWithTxs",le="0.1"} 0\n'
+        'starknet_py_rpc_request_duration_seconds_bucket{method="getBlockWithTxs",le="1.0"} 1\n'
+        'starknet_py_rpc_request_duration_seconds_bucket{method="getBlockWithTxs",le="+Inf"} 1\n'
+        'starknet_py_rpc_request_duration_seconds_sum{method="getBlockWithTxs"} 0.75\n'
+        'starknet_py_rpc_request_duration_seconds_count{method="getBlockWithTxs"} 1\n'
+    ) in exported
+    assert (
+        'starknet_py_rpc_response_size_bytes_bucket{method="getBlockWithTxs",le="100.0"} 0'
+        in exported
+    )
+    assert (
+        'starknet_py_schema_load_duration_seconds_bucket{schema="StarknetBlockSchema",le="0.1"} 1'
+        in exported
+    )
+    assert (
+        'starknet_py_rpc_errors_total{method="getBlockWithTxs",error="ClientError"} 1\n'
+        in exported
+    )
+
+    collector.reset()
+    assert collector.to_prometheus() == ""
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.cairo.data_types import (
+    ArrayType,
+    BoolType,
+    FeltType,
+    StructType,
+    UintType,
+)
+from starknet_py.hash.storage import get_storage_var_address
+from starknet_py.net.client_models import BlockHashAndNumber
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.storage_reader import StorageQuery, StorageReader
+
+TOKEN = 0x123
+OTHER_TOKEN = 0x456
+HEAD_HASH = 0xABC
+
+_position_type = StructType(
+    "Position", OrderedDict(amount=UintType(256), active=BoolType())
+)
+
+
+def _storage() -> Dict[Tuple[int, int], int]:
+    balance = get_storage_var_address("balances", 1)
+    position = get_storage_var_address("positions", 1, 2)
+    return {
+        (TOKEN, get_storage_var_address("total_supply")): 1000,
+        (TOKEN, balance): 5,
+        (TOKEN, balance + 1): 1,
+        (OTHER_TOKEN, balance): 7,
+        (TOKEN, position): 10,
+        (TOKEN, position + 1): 0,
+        (TOKEN, position + 2): 1,
+    }
+
+
+@pytest.fixture(name="client")
+def create_client():
+    client = FullNodeClient(node_url="")
+    storage = _storage()
+    requests: List[List[Tuple[int, int]]] = []
+
+    async def _get_storage_at_batch(slots, block_hash=None, block_number=None):
+        assert block_hash == HEAD_HASH and block_number is None
+        requests.append(slots)
+        return [storage.get(slot, 0) for slot in slots]
+
+    with patch.object(
+        client, "get_storage_at_batch", _get_storage_at_batch
+    ), patch.object(
+        client,
+        "get_block_hash_and_number",
+        AsyncMock(
+            return_value=BlockHashAndNumber(block_hash=HEAD_HASH, block_number=10)
+        ),
+    ):
+        client.requests = requests  # type: ignore
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_read(client):
+    reader = StorageReader(client, batch_size=2)
+
+    values = await reader.read(
+        [
+            (TOKEN, "total_supply"),
+            StorageQuery(TOKEN, "balances", [1], UintType(256)),
+            StorageQuery(OTHER_TOKEN, "balances", [1], UintType(256)),
+            StorageQuery(TOKEN, "positions", [1, 2], _position_type),
+            (hex(TOKEN), "total_supply", ()),
+            (TOKEN, "missing"),
+        ]
+    )
+
+    assert values[0] == 1000
+    assert values[1] == 5 + 2**128
+    assert values[2] == 7
+    assert values[3] == {"amount": 10, "active": True}
+    assert values[4] == 1000
+    assert values[5] == 0
+
+    # Slots read twice are fetched once
+    requested_slots = [slot for request in client.requests for slot in request]
+    assert len(requested_slots) == len(set(requested_slots)) == 9
+    assert all(len(request) <= 2 for request in client.requests)
+    client.get_block_hash_and_number.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_read_at_block(client):
+    reader = StorageReader(client)
+
+    assert await reader.read(
+        [(TOKEN, "total_supply", (), FeltType())], block_hash=HEAD_HASH
+    ) == [1000]
+    client.get_block_hash_and_number.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_unsupported_type(client):
+    reader = StorageReader(client)
+
+    with pytest.raises(ValueError, match="size is not fixed"):
+        await reader.read([(TOKEN, "items", (), ArrayType(FeltType()))])
+
+
+def test_invalid_arguments(client):
+    with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+        StorageReader(client, batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_get_storage_at_batch():
+    # pylint: disable=protected-access
+    client = FullNodeClient(node_url="")
+
+    with patch.object(
+        client._client, "batch_call", AsyncMock(return_value=["0x1", "0x2"])
+    ) as batch_call:
+        values = await client.get_storage_at_batch(
+            [(TOKEN, 1), (OTHER_TOKEN, 2)], block_hash=HEAD_HASH
+        )
+
+    assert values == [1, 2]
+    (calls,) = batch_call.call_args.args
+    assert [method_name for method_name, _ in calls] == ["getStorageAt"] * 2
+    assert calls[1][1]["contract_address"] == hex(OTHER_TOKEN)
+    assert calls[1][1]["block_id"] == {"block_hash": hex(HEAD_HASH)}
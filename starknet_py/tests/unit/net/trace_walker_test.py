@@ -0,0 +1,208 @@
+from typing import List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.trace_walker import (
+    TraceCall,
+    TraceEvent,
+    TraceMessage,
+    TraceStorageWrite,
+    TraceWalker,
+)
+
+ACCOUNT = 0x1
+TOKEN = 0x2
+ROUTER = 0x3
+TRANSFER = 0x99
+TRANSFER_EVENT = 0x77
+
+
+def _invocation(
+    contract_address: int,
+    selector: int,
+    calls: Optional[List[dict]] = None,
+    events: Optional[List[dict]] = None,
+    messages: Optional[List[dict]] = None,
+) -> dict:
+    return {
+        "contract_address": hex(contract_address),
+        "entry_point_selector": hex(selector),
+        "calldata": ["0x1", hex(selector)],
+        "caller_address": "0x0",
+        "class_hash": hex(contract_address + 0x100),
+        "entry_point_type": "EXTERNAL",
+        "call_type": "CALL",
+        "result": [],
+        "calls": calls or [],
+        "events": events or [],
+        "messages": messages or [],
+        "execution_resources": {"steps": 10},
+    }
+
+
+def _event(order: int, key: int) -> dict:
+    return {"order": order, "keys": [hex(key)], "data": ["0x5"]}
+
+
+_EXECUTION_RESOURCES = {
+    "steps": 100,
+    "data_availability": {"l1_gas": 1, "l1_data_gas": 1},
+}
+
+
+def _traces() -> List[dict]:
+    swap = _invocation(
+        ROUTER,
+        0x10,
+        calls=[
+            _invocation(TOKEN, TRANSFER, events=[_event(0, TRANSFER_EVENT)]),
+            _invocation(
+                TOKEN,
+                TRANSFER,
+                events=[_event(1, TRANSFER_EVENT), _event(2, 0x78)],
+            ),
+        ],
+        messages=[
+            {
+                "order": 0,
+                "from_address": hex(ROUTER),
+                "to_address": "0x8",
+                "payload": [],
+            }
+        ],
+    )
+    return [
+        {
+            "transaction_hash": "0xabc",
+            "trace_root": {
+                "type": "INVOKE",
+                "execution_resources": _EXECUTION_RESOURCES,
+                "validate_invocation": _invocation(ACCOUNT, 0x20),
+                "execute_invocation": _invocation(ACCOUNT, 0x30, calls=[swap]),
+                "fee_transfer_invocation": _invocation(TOKEN, TRANSFER),
+                "state_diff": {
+                    "storage_diffs": [
+                        {
+                            "address": hex(TOKEN),
+                            "storage_entries": [{"key": "0x1", "value": "0x2"}],
+                        }
+                    ],
+                    "deprecated_declared_classes": [],
+                    "declared_classes": [],
+                    "deployed_contracts": [],
+                    "replaced_classes": [],
+                    "nonces": [],
+                },
+            },
+        },
+        {
+            "transaction_hash": "0xdef",
+            "trace_root": {
+                "type": "INVOKE",
+                "execution_resources": _EXECUTION_RESOURCES,
+                "execute_invocation": {"revert_reason": "Failure"},
+            },
+        },
+    ]
+
+
+def test_walk_calls():
+    calls = list(TraceWalker().walk(_traces()))
+
+    assert all(isinstance(call, TraceCall) for call in calls)
+    assert [(call.call_index, call.parent_index, call.depth) for call in calls] == [
+        (0, -1, 0),
+        (1, -1, 0),
+        (2, 1, 1),
+        (3, 2, 2),
+        (4, 2, 2),
+        (5, -1, 0),
+    ]
+    assert [call.invocation for call in calls] == [
+        "validate_invocation",
+        *["execute_invocation"] * 4,
+        "fee_transfer_invocation",
+    ]
+    assert calls[3].contract_address == TOKEN
+    assert calls[3].calldata == [1, TRANSFER]
+    assert calls[3].transaction_hash == 0xABC
+
+
+def test_walk_selected_nodes():
+    walker = TraceWalker(
+        calls=False,
+        events=True,
+        messages=True,
+        storage_writes=True,
+        event_keys=[TRANSFER_EVENT],
+    )
+
+    nodes = list(walker.walk(_traces()))
+
+    assert [type(node) for node in nodes] == [
+        TraceMessage,
+        TraceEvent,
+        TraceEvent,
+        TraceStorageWrite,
+    ]
+    assert [node.order for node in nodes[1:3]] == [0, 1]
+    assert nodes[1].call_index == 3 and nodes[1].contract_address == TOKEN
+    assert nodes[3] == TraceStorageWrite(
+        transaction_index=0,
+        transaction_hash=0xABC,
+        contract_address=TOKEN,
+        key=1,
+        value=2,
+    )
+
+
+def test_walk_filtered_calls():
+    walker = TraceWalker(contract_addresses=[TOKEN], selectors=[TRANSFER])
+
+    calls = list(walker.walk(_traces()))
+
+    assert [call.call_index for call in calls] == [3, 4, 5]
+
+
+def test_walk_simulated_transactions():
+    simulated = [
+        {"transaction_trace": trace["trace_root"], "fee_estimation": {}}
+        for trace in _traces()
+    ]
+
+    calls = list(TraceWalker(selectors=[0x20]).walk(simulated))
+
+    assert len(calls) == 1
+    assert calls[0].transaction_hash is None
+
+
+def test_flatten():
+    table = TraceWalker(contract_addresses=[TOKEN, ROUTER]).flatten(_traces())
+
+    assert len(table) == 4
+    assert table.transaction_hashes == [0xABC, 0xDEF]
+    assert table.transaction_index == [0, 0, 0, 0]
+    assert table.call_index == [2, 3, 4, 5]
+    assert table.parent_index == [1, 2, 2, -1]
+    assert table.entry_point_selector == [0x10, TRANSFER, TRANSFER, TRANSFER]
+
+
+@pytest.mark.asyncio
+async def test_trace_block_transactions_raw():
+    client = FullNodeClient(node_url="")
+
+    with patch(
+        f"{FullNodeClient.__module__}.RpcHttpClient.call",
+        AsyncMock(return_value=_traces()),
+    ):
+        raw = await client.trace_block_transactions_raw(block_number=1)
+        traces = await client.trace_block_transactions(block_number=1)
+
+    calls = list(TraceWalker().walk(raw))
+    execute = traces[0].trace_root.execute_invocation
+    assert calls[3].entry_point_selector == (
+        execute.calls[0].calls[0].entry_point_selector
+    )
+    assert traces[1].trace_root.execute_invocation.revert_reason == "Failure"
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from starknet_py.hash.salt_search import AddressPattern
+from starknet_py.net.udc_deployer.deployer import Deployer
+
+CLASS_HASH = 0x1234
+
+
+def _failing_predicate(address: int) -> bool:
+    raise ValueError(f"Cannot check {address}.")
+
+
+def _exiting_predicate(_address: int) -> bool:
+    os._exit(1)  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("account_address", [None, 0x789])
+def test_compute_addresses(account_address):
+    deployer = Deployer(account_address=account_address)
+    params = [(CLASS_HASH, [1, 2], salt) for salt in range(3)] + [(CLASS_HASH, [], 3)]
+
+    addresses = list(deployer.compute_addresses(params))
+
+    assert addresses == [
+        deployer.create_contract_deployment_raw(
+            class_hash=class_hash, salt=salt, raw_calldata=calldata
+        ).address
+        for class_hash, calldata, salt in params
+    ]
+
+
+@pytest.mark.parametrize("account_address", [None, 0x789])
+def test_search_salts(account_address):
+    deployer = Deployer(account_address=account_address)
+
+    result = deployer.search_salts(
+        AddressPattern(prefix="00"),
+        CLASS_HASH,
+        raw_calldata=[1, 2],
+        matches_count=2,
+        processes=1,
+    )
+
+    assert len(result.matches) == 2
+    for salt, address in result.matches:
+        assert f"{address:064x}".startswith("00")
+        assert (
+            deployer.create_contract_deployment_raw(
+                class_hash=CLASS_HASH, salt=salt, raw_calldata=[1, 2]
+            ).address
+            == address
+        )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_search_salts_predicate_error(processes):
+    with pytest.raises(ValueError, match="Cannot check"):
+        Deployer().search_salts(
+            _failing_predicate, CLASS_HASH, max_salts=1000, processes=processes
+        )
+
+
+def test_search_salts_worker_exited():
+    with pytest.raises(RuntimeError, match="exited unexpectedly with code 1"):
+        Deployer().search_salts(
+            _exiting_predicate, CLASS_HASH, max_salts=1000, processes=2
+        )
@@ -0,0 +1,232 @@
+import asyncio
+import json
+from typing import Dict, Optional
+from unittest.mock import patch
+
+import pytest
+
+from starknet_py.net.client import Client
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import SierraContractClass, SierraEntryPointsByType
+from starknet_py.net.models import Address
+from starknet_py.proxy.contract_abi_resolver import (
+    AbiResolverCache,
+    ContractAbiResolver,
+    ImplementationType,
+    ProxyResolutionError,
+)
+from starknet_py.proxy.proxy_check import ProxyCheck
+
+PROXY_ADDRESS = 0x1
+IMPLEMENTATION_CLASS_HASH = 0x100
+PROXY_CLASS_HASH = 0x200
+
+implementation_abi = [{"type": "function", "name": "implementation_function"}]
+
+
+def _sierra_class(abi) -> SierraContractClass:
+    return SierraContractClass(
+        contract_class_version="0.1.0",
+        sierra_program=[],
+        entry_points_by_type=SierraEntryPointsByType(
+            constructor=[], external=[], l1_handler=[]
+        ),
+        abi=json.dumps(abi),
+    )
+
+
+class _ClassesClient:
+    """
+    Client serving classes of deployed contracts.
+    """
+
+    def __init__(self, class_hashes: Dict[int, int]):
+        self.class_hashes = class_hashes
+        self.get_class_by_hash_calls = []
+
+    async def get_class_hash_at(self, contract_address: Address, **_) -> int:
+        if contract_address not in self.class_hashes:
+            raise ClientError(code=20, message="Contract not found")
+        return self.class_hashes[contract_address]
+
+    async def get_class_by_hash(self, class_hash: int, **_) -> SierraContractClass:
+        self.get_class_by_hash_calls.append(class_hash)
+        await asyncio.sleep(0)
+        if class_hash == IMPLEMENTATION_CLASS_HASH:
+            return _sierra_class(implementation_abi)
+        return _sierra_class([{"type": "function", "name": hex(class_hash)}])
+
+
+class _ProxyCheck(ProxyCheck):
+    def __init__(
+        self,
+        implementation_hash: Optional[int] = None,
+        delay: float = 0,
+        error: Optional[ClientError] = None,
+    ):
+        self._implementation_hash = implementation_hash
+        self._delay = delay
+        self._error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def implementation_address(
+        self, address: Address, client: Client
+    ) -> Optional[int]:
+        return None
+
+    async def implementation_hash(
+        self, address: Address, client: Client
+    ) -> Optional[int]:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self._error is not None:
+            raise self._error
+        return self._implementation_hash
+
+
+@pytest.mark.asyncio
+async def test_resolve_abi_runs_proxy_checks_concurrently():
+    slow_check = _ProxyCheck(delay=10)
+    checks = [
+        _ProxyCheck(error=ClientError(code=40, message="Contract error")),
+        _ProxyCheck(implementation_hash=IMPLEMENTATION_CLASS_HASH),
+        slow_check,
+    ]
+    client = _ClassesClient({PROXY_ADDRESS: PROXY_CLASS_HASH})
+
+    abi, cairo_version = await asyncio.wait_for(
+        ContractAbiResolver(
+            address=PROXY_ADDRESS,
+            client=client,  # pyright: ignore
+            proxy_config={"proxy_checks": checks},
+        ).resolve(),
+        timeout=5,
+    )
+
+    assert abi == implementation_abi
+    assert cairo_version == 1
+    assert slow_check.calls == 1
+    await asyncio.sleep(0)
+    assert slow_check.cancelled
+
+
+@pytest.mark.asyncio
+async def test_resolve_abi_raises_unexpected_proxy_check_errors():
+    checks = [_ProxyCheck(error=ClientError(code=1, message="Unexpected"))]
+    client = _ClassesClient({PROXY_ADDRESS: PROXY_CLASS_HASH})
+
+    with pytest.raises(ClientError, match="Unexpected"):
+        await ContractAbiResolver(
+            address=PROXY_ADDRESS,
+            client=client,  # pyright: ignore
+            proxy_config={"proxy_checks": checks},
+        ).resolve()
+
+
+@pytest.mark.asyncio
+async def test_resolve_abi_no_implementation():
+    client = _ClassesClient({PROXY_ADDRESS: PROXY_CLASS_HASH})
+
+    with pytest.raises(ProxyResolutionError):
+        await ContractAbiResolver(
+            address=PROXY_ADDRESS,
+            client=client,  # pyright: ignore
+            proxy_config={"proxy_checks": [_ProxyCheck()]},
+        ).resolve()
+
+
+@pytest.mark.asyncio
+async def test_resolve_abi_uses_cached_implementation():
+    cache = AbiResolverCache()
+    check = _ProxyCheck(implementation_hash=IMPLEMENTATION_CLASS_HASH)
+    client = _ClassesClient({PROXY_ADDRESS: PROXY_CLASS_HASH})
+    resolver = ContractAbiResolver(
+        address=PROXY_ADDRESS,
+        client=client,  # pyright: ignore
+        proxy_config={"proxy_checks": [check]},
+        cache=cache,
+    )
+
+    assert await resolver.resolve() == (implementation_abi, 1)
+    assert await resolver.resolve() == (implementation_abi, 1)
+
+    assert check.calls == 1
+    assert client.get_class_by_hash_calls == [IMPLEMENTATION_CLASS_HASH]
+    assert cache.get_implementation(PROXY_ADDRESS) == (
+        IMPLEMENTATION_CLASS_HASH,
+        ImplementationType.CLASS_HASH,
+    )
+
+
+def test_cached_implementation_expires():
+    cache = AbiResolverCache(implementation_ttl=10)
+
+    with patch("time.monotonic", return_value=100):
+        cache.set_implementation(
+            PROXY_ADDRESS, IMPLEMENTATION_CLASS_HASH, ImplementationType.CLASS_HASH
+        )
+    with patch("time.monotonic", return_value=109):
+        assert cache.get_implementation(PROXY_ADDRESS) is not None
+    with patch("time.monotonic", return_value=110):
+        assert cache.get_implementation(PROXY_ADDRESS) is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_dedupes_classes():
+    addresses = [0x10, 0x11, 0x12, 0x13]
+    client = _ClassesClient({0x10: 0xA, 0x11: 0xB, 0x12: 0xA, 0x13: 0xA})
+
+    results = await ContractAbiResolver.resolve_many(
+        addresses, client, proxy_config={}  # pyright: ignore
+    )
+
+    assert [abi for abi, _ in results] == [
+        [{"type": "function", "name": hex(class_hash)}]
+        for class_hash in [0xA, 0xB, 0xA, 0xA]
+    ]
+    assert sorted(client.get_class_by_hash_calls) == [0xA, 0xB]
+
+
+@pytest.mark.asyncio
+async def test_cache_propagates_fetch_errors():
+    cache = AbiResolverCache()
+
+    async def fetch(_):
+        await asyncio.sleep(0)
+        raise ClientError(code=28, message="Class hash not found")
+
+    results = await asyncio.gather(
+        cache.get_abi(0xA, fetch), cache.get_abi(0xA, fetch), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ClientError) for result in results)
+    with pytest.raises(ClientError):
+        await cache.get_abi(0xA, fetch)
+
+
+@pytest.mark.asyncio
+async def test_cache_refetches_when_fetching_caller_is_cancelled():
+    cache = AbiResolverCache()
+    fetched = []
+    release = asyncio.Event()
+
+    async def fetch(class_hash):
+        fetched.append(class_hash)
+        await release.wait()
+        return [], 1
+
+    first = asyncio.create_task(cache.get_abi(0xA, fetch))
+    second = asyncio.create_task(cache.get_abi(0xA, fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == ([], 1)
+    assert first.cancelled()
+    assert fetched == [0xA, 0xA]
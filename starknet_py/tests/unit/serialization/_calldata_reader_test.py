@@ -51,3 +51,35 @@ def test_empty_calldata():
     assert err_info.value.position == 0
     assert err_info.value.remaining_len == 0
     assert err_info.value.requested_size == 10
+
+
+def test_reading_single_values():
+    reader = CalldataReader([1, 2])
+
+    assert reader.read_one() == 1
+    assert reader.read_one() == 2
+    assert reader.remaining_len == 0
+
+    with pytest.raises(
+        OutOfBoundsError, match="Requested 1 elements, 0 available."
+    ) as err_info:
+        reader.read_one()
+
+    assert err_info.value.position == 2
+
+
+def test_peek_and_skip():
+    reader = CalldataReader(list(range(0, 10)))
+
+    assert reader.peek(4) == [0, 1, 2, 3]
+    assert reader.remaining_len == 10
+
+    reader.skip(4)
+    assert reader.remaining_len == 6
+    assert reader.read_one() == 4
+
+    with pytest.raises(OutOfBoundsError, match="Requested 6 elements, 5 available."):
+        reader.peek(6)
+
+    with pytest.raises(OutOfBoundsError, match="Requested 6 elements, 5 available."):
+        reader.skip(6)
@@ -1,10 +1,23 @@
+import re
+
 import pytest
 
 from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
+from starknet_py.serialization.data_serializers.bool_serializer import BoolSerializer
 from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.data_serializers.uint256_serializer import (
+    Uint256Serializer,
+)
+from starknet_py.serialization.data_serializers.uint_serializer import UintSerializer
+from starknet_py.serialization.errors import InvalidValueException
 
 felt_array_serializer = ArraySerializer(FeltSerializer())
+u8_array_serializer = ArraySerializer(UintSerializer(bits=8))
+u256_array_serializer = ArraySerializer(UintSerializer(bits=256))
+uint256_array_serializer = ArraySerializer(Uint256Serializer())
+
+SHIFT = 2**128
 
 
 @pytest.mark.parametrize(
@@ -18,6 +31,20 @@ felt_array_serializer = ArraySerializer(FeltSerializer())
             [[[[22, 38]]]],
             [1, 1, 1, 2, 22, 38],
         ),
+        (u8_array_serializer, [0, 1, 255], [3, 0, 1, 255]),
+        (u256_array_serializer, [], [0]),
+        (
+            u256_array_serializer,
+            [1, 2 + 3 * SHIFT, SHIFT - 1],
+            [3, 1, 0, 2, 3, SHIFT - 1, 0],
+        ),
+        (uint256_array_serializer, [4 * SHIFT + 5], [1, 5, 4]),
+        (
+            ArraySerializer(u256_array_serializer),
+            [[1], [SHIFT, 2]],
+            [2, 1, 1, 0, 2, 0, 1, 2, 0],
+        ),
+        (ArraySerializer(BoolSerializer()), [True, False], [2, 1, 0]),
     ],
 )
 def test_valid_values(serializer, value, serialized_value):
@@ -26,3 +53,44 @@ def test_valid_values(serializer, value, serialized_value):
 
     assert deserialized == value
     assert serialized == serialized_value
+
+
+def test_deserialize_large_array():
+    values = list(range(10_000))
+    serialized = [len(values)]
+    for value in values:
+        serialized.extend([value, value])
+
+    assert u256_array_serializer.deserialize(serialized) == [
+        value + (value << 128) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "serializer, serialized_value, error_message",
+    [
+        (
+            felt_array_serializer,
+            [2, 1, FIELD_PRIME],
+            f"Error at path '[1]': invalid value '{FIELD_PRIME}' - must be in [0, {FIELD_PRIME}) range.",
+        ),
+        (
+            u8_array_serializer,
+            [2, 256, 1],
+            "Error at path '[0].uint8': expected value in range [0;2**8).",
+        ),
+        (
+            u256_array_serializer,
+            [2, 1, 2, 3, SHIFT],
+            "Error at path '[1].high': expected value in range [0;2**128).",
+        ),
+        (
+            u256_array_serializer,
+            [2, 1, 2, 3],
+            "Not enough data to deserialize '[1]'. Can't read 2 values at position 3, 1 available.",
+        ),
+    ],
+)
+def test_deserialize_invalid_values(serializer, serialized_value, error_message):
+    with pytest.raises(InvalidValueException, match=re.escape(error_message)):
+        serializer.deserialize(serialized_value)
@@ -0,0 +1,192 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from starknet_py.abi.v0 import AbiParser as AbiParserV0
+from starknet_py.abi.v2 import AbiParser as AbiParserV2
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_models import Event
+from starknet_py.serialization.errors import InvalidValueException
+from starknet_py.serialization.event_decoder import EventDecoder
+
+abi_v2 = [
+    {
+        "type": "event",
+        "name": "erc20::ERC20Component::Transfer",
+        "kind": "struct",
+        "members": [
+            {"name": "from", "type": "core::felt252", "kind": "key"},
+            {"name": "value", "type": "core::integer::u256", "kind": "data"},
+            {"name": "to", "type": "core::felt252", "kind": "key"},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "erc20::ERC20Component::Event",
+        "kind": "enum",
+        "variants": [
+            {
+                "name": "Transfer",
+                "type": "erc20::ERC20Component::Transfer",
+                "kind": "nested",
+            }
+        ],
+    },
+    {
+        "type": "event",
+        "name": "ownable::OwnableComponent::OwnershipTransferred",
+        "kind": "struct",
+        "members": [
+            {"name": "previous_owner", "type": "core::felt252", "kind": "data"},
+            {"name": "new_owner", "type": "core::felt252", "kind": "data"},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "ownable::OwnableComponent::Event",
+        "kind": "enum",
+        "variants": [
+            {
+                "name": "OwnershipTransferred",
+                "type": "ownable::OwnableComponent::OwnershipTransferred",
+                "kind": "nested",
+            }
+        ],
+    },
+    {
+        "type": "event",
+        "name": "token::Token::Upgraded",
+        "kind": "struct",
+        "members": [
+            {
+                "name": "class_hash",
+                "type": "core::array::Array::<core::felt252>",
+                "kind": "data",
+            },
+        ],
+    },
+    {
+        "type": "event",
+        "name": "token::Token::Event",
+        "kind": "enum",
+        "variants": [
+            {
+                "name": "ERC20Event",
+                "type": "erc20::ERC20Component::Event",
+                "kind": "flat",
+            },
+            {
+                "name": "OwnableEvent",
+                "type": "ownable::OwnableComponent::Event",
+                "kind": "nested",
+            },
+            {"name": "Upgraded", "type": "token::Token::Upgraded", "kind": "nested"},
+        ],
+    },
+]
+
+TRANSFER = get_selector_from_name("Transfer")
+OWNABLE_EVENT = get_selector_from_name("OwnableEvent")
+OWNERSHIP_TRANSFERRED = get_selector_from_name("OwnershipTransferred")
+UPGRADED = get_selector_from_name("Upgraded")
+
+transfer_event = Event(from_address=0x1, keys=[TRANSFER, 11, 22], data=[5, 1])
+ownership_event = Event(
+    from_address=0x1, keys=[OWNABLE_EVENT, OWNERSHIP_TRANSFERRED], data=[3, 4]
+)
+upgraded_event = Event(from_address=0x1, keys=[UPGRADED], data=[2, 7, 8])
+unknown_event = Event(from_address=0x1, keys=[0x123], data=[1])
+
+
+@pytest.fixture(name="decoder")
+def fixture_decoder() -> EventDecoder:
+    return EventDecoder(AbiParserV2(abi_v2).parse())
+
+
+def test_decode_flat_component_event_with_keys(decoder):
+    decoded = decoder.decode(transfer_event)
+
+    assert decoded is not None
+    assert decoded.name == "erc20::ERC20Component::Transfer"
+    assert decoded.data == {"from": 11, "value": 5 + (1 << 128), "to": 22}
+    assert list(decoded.data) == ["from", "value", "to"]
+    assert decoded.event == transfer_event
+
+
+def test_decode_nested_component_event(decoder):
+    decoded = decoder.decode(ownership_event)
+
+    assert decoded is not None
+    assert decoded.name == "ownable::OwnableComponent::OwnershipTransferred"
+    assert decoded.data == {"previous_owner": 3, "new_owner": 4}
+
+
+def test_decode_unknown_event(decoder):
+    assert decoder.decode(unknown_event) is None
+    assert decoder.decode(Event(from_address=0x1, keys=[], data=[])) is None
+
+
+def test_decode_invalid_payload(decoder):
+    with pytest.raises(InvalidValueException, match="were not used"):
+        decoder.decode(Event(from_address=0x1, keys=[UPGRADED], data=[0, 1]))
+
+
+def test_decode_many_skips_unknown_events(decoder):
+    decoded = decoder.decode_many(
+        [transfer_event, unknown_event, ownership_event, upgraded_event]
+    )
+
+    assert [event.name for event in decoded] == [
+        "erc20::ERC20Component::Transfer",
+        "ownable::OwnableComponent::OwnershipTransferred",
+        "token::Token::Upgraded",
+    ]
+    assert decoded[2].data == {"class_hash": [7, 8]}
+
+
+@pytest.mark.asyncio
+async def test_decode_stream(decoder):
+    async def events():
+        for event in [unknown_event, upgraded_event, transfer_event]:
+            yield event
+
+    decoded = [event async for event in decoder.decode_stream(events())]
+
+    assert [event.event for event in decoded] == [upgraded_event, transfer_event]
+
+
+def test_decode_parallel(decoder):
+    events = [transfer_event, unknown_event, ownership_event] * 10
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = decoder.decode_parallel(events, executor, chunk_size=4)
+
+    assert decoded == decoder.decode_many(events)
+    assert len(decoded) == 20
+
+
+def test_decoder_can_be_pickled(decoder):
+    unpickled = pickle.loads(pickle.dumps(decoder))
+
+    assert unpickled.decode(transfer_event) == decoder.decode(transfer_event)
+
+
+def test_decode_abi_v0_event():
+    abi = [
+        {
+            "type": "event",
+            "name": "Transfer",
+            "keys": [],
+            "data": [
+                {"name": "amounts_len", "type": "felt"},
+                {"name": "amounts", "type": "felt*"},
+            ],
+        }
+    ]
+    decoder = EventDecoder(AbiParserV0(abi).parse())
+
+    decoded = decoder.decode(Event(from_address=0x1, keys=[TRANSFER], data=[2, 1, 2]))
+
+    assert decoded is not None
+    assert decoded.data == {"amounts": [1, 2]}
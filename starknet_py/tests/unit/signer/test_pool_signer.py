@@ -0,0 +1,77 @@
+import pytest
+
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.models.transaction import InvokeV1
+from starknet_py.net.signer.pool_signer import PoolSigner
+from starknet_py.net.signer.stark_curve_signer import KeyPair, StarkCurveSigner
+from starknet_py.tests.unit.utils.typed_data_test import CasesRev1, load_typed_data
+
+KEY_PAIR = KeyPair.from_private_key(0x1234)
+
+
+def _transactions(count: int):
+    return [
+        InvokeV1(
+            version=1,
+            signature=[],
+            nonce=nonce,
+            max_fee=10**15,
+            calldata=[1, 2, nonce],
+            sender_address=0x1,
+        )
+        for nonce in range(count)
+    ]
+
+
+@pytest.fixture(name="reference_signer")
+def get_reference_signer():
+    return StarkCurveSigner(0x1, KEY_PAIR, StarknetChainId.SEPOLIA)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+@pytest.mark.asyncio
+async def test_sign_transactions(use_processes, reference_signer):
+    transactions = _transactions(5)
+
+    with PoolSigner(
+        0x1,
+        KEY_PAIR,
+        StarknetChainId.SEPOLIA,
+        max_workers=2,
+        use_processes=use_processes,
+    ) as signer:
+        signatures = await signer.sign_transactions(transactions)
+        single_signature = await signer.sign_transaction_async(transactions[0])
+        sync_signature = signer.sign_transaction(transactions[1])
+
+    assert signer.public_key == KEY_PAIR.public_key
+    assert signatures == [reference_signer.sign_transaction(tx) for tx in transactions]
+    assert single_signature == signatures[0]
+    assert sync_signature == signatures[1]
+
+
+@pytest.mark.asyncio
+async def test_sign_message(reference_signer):
+    typed_data = load_typed_data(CasesRev1.TD.value)
+
+    with PoolSigner(
+        0x1, KEY_PAIR, StarknetChainId.SEPOLIA, max_workers=1, use_processes=False
+    ) as signer:
+        signature = await signer.sign_message_async(typed_data, 0x1)
+        sync_signature = signer.sign_message(typed_data, 0x1)
+
+    assert signature == reference_signer.sign_message(typed_data, 0x1)
+    assert sync_signature == signature
+
+
+@pytest.mark.asyncio
+async def test_sign_no_transactions():
+    with PoolSigner(
+        0x1, KEY_PAIR, StarknetChainId.SEPOLIA, max_workers=1, use_processes=False
+    ) as signer:
+        assert await signer.sign_transactions([]) == []
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+        PoolSigner(0x1, KEY_PAIR, StarknetChainId.SEPOLIA, max_workers=0)
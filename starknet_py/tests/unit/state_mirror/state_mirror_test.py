@@ -0,0 +1,170 @@
+from dataclasses import replace
+from typing import List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from starknet_py.net.client_models import (
+    BlockStateUpdate,
+    ContractsNonce,
+    DeployedContract,
+    ReplacedClass,
+    StateDiff,
+    StorageDiffItem,
+    StorageEntry,
+)
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.state_mirror import MirroredClient, StateMirror
+
+CONTRACT = 0x123
+
+
+def _state_update(
+    block_number: int,
+    storage: Optional[List[StorageEntry]] = None,
+    nonce: Optional[int] = None,
+    deployed_class_hash: Optional[int] = None,
+    replaced_class_hash: Optional[int] = None,
+    fork: int = 0,
+) -> BlockStateUpdate:
+    # pylint: disable=too-many-arguments
+    return BlockStateUpdate(
+        block_hash=0x1000 * (fork + 1) + block_number,
+        new_root=0x2000 * (fork + 1) + block_number,
+        old_root=0x2000 + block_number - 1 if block_number > 0 else 0,
+        state_diff=StateDiff(
+            storage_diffs=(
+                [StorageDiffItem(address=CONTRACT, storage_entries=storage)]
+                if storage
+                else []
+            ),
+            deprecated_declared_classes=[],
+            declared_classes=[],
+            deployed_contracts=(
+                [DeployedContract(address=CONTRACT, class_hash=deployed_class_hash)]
+                if deployed_class_hash is not None
+                else []
+            ),
+            replaced_classes=(
+                [
+                    ReplacedClass(
+                        contract_address=CONTRACT, class_hash=replaced_class_hash
+                    )
+                ]
+                if replaced_class_hash is not None
+                else []
+            ),
+            nonces=(
+                [ContractsNonce(contract_address=CONTRACT, nonce=nonce)]
+                if nonce is not None
+                else []
+            ),
+        ),
+    )
+
+
+@pytest.fixture(name="mirror")
+def create_mirror():
+    with StateMirror(":memory:") as mirror:
+        mirror.apply_state_update(
+            0,
+            _state_update(0, [StorageEntry(key=1, value=10)], deployed_class_hash=0xC1),
+        )
+        mirror.apply_state_update(
+            1, _state_update(1, [StorageEntry(key=1, value=11)], nonce=1)
+        )
+        mirror.apply_state_update(
+            2,
+            _state_update(
+                2, [StorageEntry(key=2, value=2**251)], replaced_class_hash=0xC2
+            ),
+        )
+        yield mirror
+
+
+def test_read_state(mirror):
+    assert mirror.head.block_number == 2
+    assert mirror.get_storage_at(CONTRACT, 1) == 11
+    assert mirror.get_storage_at(CONTRACT, 1, block_number=0) == 10
+    assert mirror.get_storage_at(CONTRACT, 2) == 2**251
+    assert mirror.get_storage_at(CONTRACT, 2, block_number=1) == 0
+    assert mirror.get_contract_nonce(CONTRACT, block_number=0) == 0
+    assert mirror.get_contract_nonce(CONTRACT) == 1
+    assert mirror.get_class_hash_at(CONTRACT, block_number=1) == 0xC1
+    assert mirror.get_class_hash_at(CONTRACT) == 0xC2
+    assert mirror.get_class_hash_at(0x456) is None
+    assert mirror.get_storage_at(CONTRACT, 1, block_number=3) is None
+
+
+def test_unknown_values_without_genesis():
+    with StateMirror(":memory:") as mirror:
+        mirror.apply_state_update(5, _state_update(5, [StorageEntry(key=1, value=5)]))
+
+        assert mirror.get_storage_at(CONTRACT, 1) == 5
+        assert mirror.get_storage_at(CONTRACT, 2) is None
+        assert mirror.get_contract_nonce(CONTRACT) is None
+
+
+def test_revert(mirror):
+    mirror.revert_to(0)
+
+    assert mirror.head.block_number == 0
+    assert mirror.get_storage_at(CONTRACT, 1) == 10
+    assert mirror.get_class_hash_at(CONTRACT) == 0xC1
+
+    mirror.apply_state_update(
+        1, _state_update(1, [StorageEntry(key=1, value=99)], fork=1)
+    )
+    assert mirror.get_storage_at(CONTRACT, 1) == 99
+    assert mirror.get_block(block_number=1).block_hash == 0x2001
+
+
+def test_apply_not_following_head(mirror):
+    with pytest.raises(ValueError, match="doesn't follow the head"):
+        mirror.apply_state_update(4, _state_update(4))
+    with pytest.raises(ValueError, match="doesn't follow the head"):
+        mirror.apply_state_update(3, replace(_state_update(3), old_root=0x999))
+
+
+@pytest.mark.asyncio
+async def test_sync():
+    client = FullNodeClient(node_url="")
+
+    async def _iter_blocks(from_block_number, to_block_number, kind, **_):
+        assert kind == "state_update"
+        for number in range(from_block_number, to_block_number + 1):
+            yield number, _state_update(
+                number, [StorageEntry(key=number, value=number)]
+            )
+
+    with StateMirror(":memory:") as mirror, patch.object(
+        client, "iter_blocks", _iter_blocks
+    ):
+        await mirror.sync(client, to_block_number=3)
+        await mirror.sync(client, to_block_number=5)
+
+        assert mirror.first_block.block_number == 0
+        assert mirror.head.block_number == 5
+        assert mirror.get_storage_at(CONTRACT, 4) == 4
+
+
+@pytest.mark.asyncio
+async def test_mirrored_client(mirror):
+    client = MirroredClient(node_url="", mirror=mirror)
+
+    with patch.object(
+        FullNodeClient, "get_storage_at", AsyncMock(return_value=7)
+    ) as remote_get_storage_at:
+        assert await client.get_storage_at(CONTRACT, 1, block_number=1) == 11
+        assert await client.get_storage_at(CONTRACT, 1, block_hash=0x1000) == 10
+        remote_get_storage_at.assert_not_awaited()
+
+        assert await client.get_storage_at(CONTRACT, 1) == 7
+        assert await client.get_storage_at(CONTRACT, 1, block_number=10) == 7
+        assert remote_get_storage_at.await_count == 2
+
+        client.latest_from_mirror = True
+        assert await client.get_storage_at(CONTRACT, 1, block_number="latest") == 11
+
+    assert await client.get_contract_nonce(hex(CONTRACT), block_number=2) == 1
+    assert await client.get_class_hash_at(CONTRACT, block_number=2) == 0xC2
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pytest
@@ -138,3 +139,54 @@ def test_build_from_elements(
     assert tree.levels is not None
     assert tree.root_hash == int(expected_root_hash, 16)
     assert len(tree.levels) == expected_levels_count
+
+
+@pytest.mark.parametrize("leaves_count", [1, 2, 3, 5, 8, 9])
+@pytest.mark.parametrize("hash_method", [HashMethod.PEDERSEN, HashMethod.POSEIDON])
+def test_get_proof(leaves_count: int, hash_method: HashMethod):
+    leaves = list(range(10, 10 + leaves_count))
+    tree = MerkleTree(leaves, hash_method)
+
+    for index, leaf in enumerate(leaves):
+        proof = tree.get_proof(index)
+
+        assert len(proof) == len(tree.levels) - 1
+        assert tree.verify(leaf, proof)
+        assert MerkleTree.verify_proof(tree.root_hash, leaf, proof, hash_method)
+        assert not tree.verify(leaf + 100, proof)
+
+
+@pytest.mark.parametrize("hash_method", [HashMethod.PEDERSEN, HashMethod.POSEIDON])
+def test_update(hash_method: HashMethod):
+    leaves = list(range(1, 8))
+    tree = MerkleTree(leaves, hash_method)
+
+    for index in (0, 3, 6):
+        tree.update(index, 100 + index)
+        expected = MerkleTree(tree.leaves, hash_method)
+
+        assert tree.root_hash == expected.root_hash
+        assert tree.levels == expected.levels
+        assert tree.verify(100 + index, tree.get_proof(index))
+
+    # Leaves passed to the tree are not modified
+    assert leaves == list(range(1, 8))
+
+
+def test_build_with_executor():
+    leaves = list(range(1, 12))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tree = MerkleTree(leaves, HashMethod.POSEIDON, executor=executor, chunk_size=3)
+
+    assert tree.levels == MerkleTree(leaves, HashMethod.POSEIDON).levels
+
+
+@pytest.mark.parametrize("index", [-1, 3])
+def test_invalid_leaf_index(index: int):
+    tree = MerkleTree([1, 2, 3], HashMethod.POSEIDON)
+
+    with pytest.raises(ValueError, match="out of range"):
+        tree.get_proof(index)
+    with pytest.raises(ValueError, match="out of range"):
+        tree.update(index, 1)
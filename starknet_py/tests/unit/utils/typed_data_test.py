@@ -2,12 +2,14 @@
 # fmt: off
 
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Union
 
 import pytest
 
+from starknet_py.hash.utils import message_signature, private_to_stark_key
 from starknet_py.net.models.typed_data import Revision
 from starknet_py.tests.e2e.fixtures.constants import TYPED_DATA_DIR
 from starknet_py.utils.typed_data import (
@@ -17,6 +19,7 @@ from starknet_py.utils.typed_data import (
     PresetType,
     StandardParameter,
     TypedData,
+    TypedDataHasher,
     encode_bool,
     encode_i128,
     encode_u128,
@@ -184,6 +187,82 @@ def test_message_hash(example, account_address, msg_hash):
     assert hex(res) == msg_hash
 
 
+@pytest.mark.parametrize("example", [*CasesRev0, *CasesRev1])
+def test_typed_data_hasher(example):
+    typed_data = load_typed_data(example.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    account_address = 0xcd2a3d9f938e13cd947ec05abc7fe734df8dd826
+
+    assert hasher.message_hash(typed_data.message, account_address) == typed_data.message_hash(account_address)
+    assert hasher.message_hashes([typed_data.message] * 2, account_address) == [
+        typed_data.message_hash(account_address)
+    ] * 2
+    assert hasher.struct_hash(typed_data.message) == typed_data.struct_hash(
+        typed_data.primary_type, typed_data.message
+    )
+
+
+@pytest.mark.parametrize("executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_iter_message_hashes(executor_class):
+    typed_data = load_typed_data(CasesRev1.TD.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    messages = [(typed_data.message, address) for address in range(1, 8)]
+    expected = [typed_data.message_hash(address) for address in range(1, 8)]
+
+    if executor_class is None:
+        assert list(hasher.iter_message_hashes(messages, chunk_size=3)) == expected
+    else:
+        with executor_class(max_workers=2) as executor:
+            assert list(
+                hasher.iter_message_hashes(iter(messages), executor=executor, chunk_size=3)
+            ) == expected
+
+
+@pytest.mark.parametrize("executor_class", [None, ProcessPoolExecutor])
+def test_iter_verify_messages(executor_class):
+    typed_data = load_typed_data(CasesRev0.TD.value)
+    hasher = TypedDataHasher.from_typed_data(typed_data)
+    private_key = 0x1234
+    public_key = private_to_stark_key(private_key)
+    valid_signature = list(message_signature(typed_data.message_hash(0x1), private_key))
+
+    messages = [
+        (typed_data.message, 0x1, valid_signature, public_key),
+        (typed_data.message, 0x2, valid_signature, public_key),
+        (typed_data.message, 0x1, [1], public_key),
+    ]
+    expected = [
+        (typed_data.message_hash(0x1), True),
+        (typed_data.message_hash(0x2), False),
+        (typed_data.message_hash(0x1), False),
+    ]
+
+    if executor_class is None:
+        assert list(hasher.iter_verify_messages(messages, chunk_size=2)) == expected
+    else:
+        with executor_class(max_workers=2) as executor:
+            assert list(
+                hasher.iter_verify_messages(messages, executor=executor, chunk_size=2)
+            ) == expected
+
+
+def test_iter_message_hashes_invalid_chunk_size():
+    hasher = TypedDataHasher.from_typed_data(load_typed_data(CasesRev1.TD.value))
+
+    with pytest.raises(ValueError, match="chunk_size must be greater than 0"):
+        list(hasher.iter_message_hashes([], chunk_size=0))
+
+
+def test_type_hashes_are_shared():
+    typed_data = load_typed_data(CasesRev1.TD.value)
+    other_typed_data = load_typed_data(CasesRev1.TD.value)
+    typed_data.type_hash(typed_data.primary_type)
+
+    # pylint: disable=protected-access
+    assert other_typed_data._types_cache is typed_data._types_cache
+    assert typed_data.primary_type in other_typed_data._types_cache.type_hashes
+
+
 domain_type_v0 = {
     "StarkNetDomain": [
         StandardParameter(name="name", type="felt"),
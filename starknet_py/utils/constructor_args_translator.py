@@ -1,17 +1,13 @@
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import starknet_py.abi.v2.shape as ShapeV2
-from starknet_py.abi.v0 import AbiParser as AbiParserV0
-from starknet_py.abi.v1 import AbiParser as AbiParserV1
-from starknet_py.abi.v2 import AbiParser as AbiParserV2
-from starknet_py.serialization import (
-    FunctionSerializationAdapter,
-    serializer_for_function,
-)
-from starknet_py.serialization.factory import (
-    serializer_for_constructor_v2,
-    serializer_for_function_v1,
-)
+
+if TYPE_CHECKING:
+    from starknet_py.serialization import FunctionSerializationAdapter
+
+# _is_abi_v2 is used by client models, so ABI parsers and serializers are imported
+# only when constructor args are translated.
+# pylint: disable=import-outside-toplevel
 
 
 def translate_constructor_args(
@@ -39,7 +35,16 @@ def translate_constructor_args(
     return serializer.serialize(*args, **kwargs)
 
 
-def _get_constructor_serializer_v1(abi: List) -> Optional[FunctionSerializationAdapter]:
+def _get_constructor_serializer_v1(
+    abi: List,
+) -> Optional["FunctionSerializationAdapter"]:
+    from starknet_py.abi.v1 import AbiParser as AbiParserV1
+    from starknet_py.abi.v2 import AbiParser as AbiParserV2
+    from starknet_py.serialization.factory import (
+        serializer_for_constructor_v2,
+        serializer_for_function_v1,
+    )
+
     if _is_abi_v2(abi):
         parsed = AbiParserV2(abi).parse()
         constructor = parsed.constructor
@@ -76,7 +81,12 @@ def _is_abi_v2(abi: List) -> bool:
     return False
 
 
-def _get_constructor_serializer_v0(abi: List) -> Optional[FunctionSerializationAdapter]:
+def _get_constructor_serializer_v0(
+    abi: List,
+) -> Optional["FunctionSerializationAdapter"]:
+    from starknet_py.abi.v0 import AbiParser as AbiParserV0
+    from starknet_py.serialization import serializer_for_function
+
     parsed = AbiParserV0(abi).parse()
 
     # Constructor might not accept any arguments
@@ -1,45 +1,165 @@
-from dataclasses import dataclass, field
-from typing import List, Tuple
+from concurrent.futures import Executor
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from poseidon_py.poseidon_hash import poseidon_hash
 
 from starknet_py.hash.hash_method import HashMethod
+from starknet_py.hash.utils import pedersen_hash
 
 
 @dataclass
 class MerkleTree:
     """
     Dataclass representing a MerkleTree object.
+
+    Pairs of nodes are hashed in ascending order and a node without a pair is hashed with 0.
+    All levels are kept, from the leaves to the root, so proofs are read from the levels
+    and updating a leaf only rehashes its path to the root.
     """
 
     leaves: List[int]
     hash_method: HashMethod
     root_hash: int = field(init=False)
     levels: List[List[int]] = field(init=False)
+    executor: InitVar[Optional[Executor]] = None
+    """Optional executor (e.g. ProcessPoolExecutor) hashing chunks of large levels in parallel."""
+    chunk_size: InitVar[int] = 4096
+    """Number of nodes of a level hashed in a single task of the executor."""
+
+    def __post_init__(self, executor: Optional[Executor], chunk_size: int):
+        if chunk_size <= 0:
+            raise ValueError("Argument chunk_size must be greater than 0.")
 
-    def __post_init__(self):
-        self.root_hash, self.levels = self._build()
+        # Leaves are copied once, so that updates don't modify the list passed by the caller
+        self.leaves = list(self.leaves)
+        self.root_hash, self.levels = self._build(executor, chunk_size)
 
-    def _build(self) -> Tuple[int, List[List[int]]]:
+    def _build(
+        self, executor: Optional[Executor], chunk_size: int
+    ) -> Tuple[int, List[List[int]]]:
         if not self.leaves:
             raise ValueError("Cannot build Merkle tree from an empty list of leaves.")
 
-        if len(self.leaves) == 1:
-            return self.leaves[0], [self.leaves]
+        levels = [self.leaves]
+        while len(levels[-1]) > 1:
+            nodes = levels[-1]
+            if executor is None or len(nodes) <= chunk_size:
+                levels.append(_hash_level(self.hash_method, nodes))
+                continue
+
+            # Chunks have even length, so that pairs are never split between them
+            chunk_size += chunk_size % 2
+            chunks = [
+                nodes[start : start + chunk_size]
+                for start in range(0, len(nodes), chunk_size)
+            ]
+            levels.append(
+                [
+                    node
+                    for chunk_nodes in executor.map(
+                        _hash_level, [self.hash_method] * len(chunks), chunks
+                    )
+                    for node in chunk_nodes
+                ]
+            )
+
+        return levels[-1][0], levels
+
+    def get_proof(self, index: int) -> List[int]:
+        """
+        Get the proof of a leaf, i.e. the siblings of nodes on the path from the leaf to the root.
+
+        :param index: Index of the leaf.
+        :return: List of sibling hashes, starting at the leaves level.
+        """
+        self._check_index(index)
+
+        proof = []
+        for nodes in self.levels[:-1]:
+            sibling = index ^ 1
+            proof.append(nodes[sibling] if sibling < len(nodes) else 0)
+            index //= 2
+        return proof
+
+    def verify(self, leaf: int, proof: Sequence[int]) -> bool:
+        """
+        Verify that a leaf with a proof belongs to the tree.
+
+        :param leaf: Value of the leaf.
+        :param proof: Proof returned by :meth:`get_proof`.
+        :return: True if the proof leads to the root of the tree.
+        """
+        return MerkleTree.verify_proof(self.root_hash, leaf, proof, self.hash_method)
+
+    @staticmethod
+    def verify_proof(
+        root_hash: int, leaf: int, proof: Sequence[int], hash_method: HashMethod
+    ) -> bool:
+        """
+        Verify that a leaf with a proof belongs to a tree with a given root, without building the tree.
+
+        :param root_hash: Root hash of the tree.
+        :param leaf: Value of the leaf.
+        :param proof: Proof returned by :meth:`get_proof`.
+        :param hash_method: Hash method of the tree.
+        :return: True if the proof leads to the root.
+        """
+        hash_pair = _pair_hash_function(hash_method)
+        node = leaf
+        for sibling in proof:
+            node = (
+                hash_pair(node, sibling)
+                if node <= sibling
+                else hash_pair(sibling, node)
+            )
+        return node == root_hash
+
+    def update(self, index: int, leaf: int):
+        """
+        Replace a leaf and rehash the nodes on its path to the root.
+
+        :param index: Index of the leaf.
+        :param leaf: New value of the leaf.
+        """
+        self._check_index(index)
+
+        hash_pair = _pair_hash_function(self.hash_method)
+        self.leaves[index] = leaf
+        for nodes, parents in zip(self.levels, self.levels[1:]):
+            left = nodes[index & ~1]
+            right = nodes[index | 1] if index | 1 < len(nodes) else 0
+            index //= 2
+            parents[index] = (
+                hash_pair(left, right) if left <= right else hash_pair(right, left)
+            )
+
+        self.root_hash = self.levels[-1][0]
+
+    def _check_index(self, index: int):
+        if not 0 <= index < len(self.leaves):
+            raise ValueError(
+                f"Leaf index {index} is out of range for a tree with {len(self.leaves)} leaves."
+            )
 
-        curr_level_nodes = self.leaves[:]
-        levels: List[List[int]] = []
 
-        while len(curr_level_nodes) > 1:
-            if len(curr_level_nodes) != len(self.leaves):
-                levels.append(curr_level_nodes[:])
+def _pair_hash_function(hash_method: HashMethod) -> Callable[[int, int], int]:
+    if hash_method == HashMethod.PEDERSEN:
+        return pedersen_hash
+    if hash_method == HashMethod.POSEIDON:
+        return poseidon_hash
+    raise ValueError(f"Unsupported hash method: {hash_method}.")
 
-            new_nodes = []
-            for i in range(0, len(curr_level_nodes), 2):
-                a, b = (
-                    curr_level_nodes[i],
-                    curr_level_nodes[i + 1] if i + 1 < len(curr_level_nodes) else 0,
-                )
-                new_nodes.append(self.hash_method.hash(*sorted([a, b])))
 
-            curr_level_nodes = new_nodes
-        levels = [self.leaves] + levels + [curr_level_nodes]
-        return curr_level_nodes[0], levels
+def _hash_level(hash_method: HashMethod, nodes: List[int]) -> List[int]:
+    hash_pair = _pair_hash_function(hash_method)
+    parents = []
+    for i in range(0, len(nodes) - 1, 2):
+        left, right = nodes[i], nodes[i + 1]
+        parents.append(
+            hash_pair(left, right) if left <= right else hash_pair(right, left)
+        )
+    if len(nodes) % 2 == 1:
+        # 0 is never greater than the node it is paired with
+        parents.append(hash_pair(0, nodes[-1]))
+    return parents
@@ -1,8 +1,26 @@
+import itertools
 import re
+import threading
 from abc import ABC
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Union, cast
+from functools import cached_property
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from marshmallow import Schema, fields, post_load
 
@@ -10,12 +28,26 @@ from starknet_py.cairo.felt import encode_shortstring
 from starknet_py.constants import FIELD_PRIME
 from starknet_py.hash.hash_method import HashMethod
 from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.hash.utils import verify_many
 from starknet_py.net.client_utils import _to_rpc_felt
 from starknet_py.net.models.typed_data import DomainDict, Revision, TypedDataDict
 from starknet_py.net.schemas.common import RevisionField
 from starknet_py.serialization.data_serializers import ByteArraySerializer
 from starknet_py.utils.merkle_tree import MerkleTree
 
+_MESSAGE_PREFIX = encode_shortstring("StarkNet Message")
+
+# Message and address of the account signing it
+TypedMessage = Tuple[dict, int]
+# Message, address of the account, signature and public key of the account
+SignedTypedMessage = Tuple[dict, int, Sequence[int], int]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximal number of chunks of messages submitted to an executor and not yet yielded
+_MAX_PENDING_CHUNKS = 16
+
 
 @dataclass(frozen=True)
 class Parameter(ABC):
@@ -126,13 +158,13 @@ class TypedData:
     def __post_init__(self):
         self._verify_types()
 
+    @cached_property
+    def _types_cache(self) -> "_TypesCache":
+        return _get_types_cache(self.types, self.domain.resolved_revision)
+
     @property
-    def _all_types(self):
-        preset_types = _get_preset_types(self.domain.resolved_revision)
-        return {
-            **preset_types,
-            **self.types,
-        }
+    def _all_types(self) -> Dict[str, List[Parameter]]:
+        return self._types_cache.all_types
 
     @property
     def _hash_method(self) -> HashMethod:
@@ -335,6 +367,10 @@ class TypedData:
             )
 
     def _get_dependencies(self, type_name: str) -> List[str]:
+        cached_dependencies = self._types_cache.dependencies.get(type_name)
+        if cached_dependencies is not None:
+            return list(cached_dependencies)
+
         dependencies = [type_name]
         to_visit = [type_name]
 
@@ -361,6 +397,7 @@ class TypedData:
                         dependencies.append(extracted_type)
                         to_visit.append(extracted_type)
 
+        self._types_cache.dependencies[type_name] = dependencies
         return list(dependencies)
 
     def _encode_type(self, type_name: str) -> str:
@@ -406,7 +443,12 @@ class TypedData:
         :param type_name: Name of the type.
         :return: Hash of the type name.
         """
-        return get_selector_from_name(self._encode_type(type_name))
+        type_hashes = self._types_cache.type_hashes
+        if type_name not in type_hashes:
+            type_hashes[type_name] = get_selector_from_name(
+                self._encode_type(type_name)
+            )
+        return type_hashes[type_name]
 
     def struct_hash(self, type_name: str, data: dict) -> int:
         """
@@ -427,14 +469,21 @@ class TypedData:
         :param account_address: Address of an account.
         :return: Hash of the message.
         """
-        message = [
-            encode_shortstring("StarkNet Message"),
-            self.struct_hash(self.domain.separator_name, self.domain.to_dict()),
-            account_address,
-            self.struct_hash(self.primary_type, self.message),
-        ]
+        return self._message_hash(self.message, account_address)
+
+    @cached_property
+    def _domain_hash(self) -> int:
+        return self.struct_hash(self.domain.separator_name, self.domain.to_dict())
 
-        return self._hash_method.hash_many(message)
+    def _message_hash(self, message: dict, account_address: int) -> int:
+        return self._hash_method.hash_many(
+            [
+                _MESSAGE_PREFIX,
+                self._domain_hash,
+                account_address,
+                self.struct_hash(self.primary_type, message),
+            ]
+        )
 
     def _prepare_merkle_tree_root(self, value: List, context: TypeContext) -> int:
         merkle_tree_type = self._get_merkle_tree_leaves_type(context)
@@ -513,6 +562,218 @@ class TypedData:
         return self._hash_method.hash_many(serialized_values)
 
 
+class TypedDataHasher:
+    """
+    Compiled schema of typed data, hashing many messages of the same primary type and domain.
+
+    Types are validated, type hashes of all types are computed and the domain is hashed once,
+    when the hasher is created. Hashing a message then only encodes the message itself.
+    """
+
+    def __init__(
+        self, types: Dict[str, List[Parameter]], primary_type: str, domain: Domain
+    ):
+        """
+        :param types: Types of the typed data.
+        :param primary_type: Type of the hashed messages.
+        :param domain: Domain of the typed data.
+        """
+        self._typed_data = TypedData(
+            types=types, primary_type=primary_type, domain=domain, message={}
+        )
+        for type_name in types:
+            self._typed_data.type_hash(type_name)
+        self.domain_hash = (
+            self._typed_data._domain_hash
+        )  # pylint: disable=protected-access
+        """Hash of the domain separator struct."""
+
+    @staticmethod
+    def from_typed_data(typed_data: TypedData) -> "TypedDataHasher":
+        """
+        Create TypedDataHasher with the types, primary type and domain of a TypedData.
+
+        :param typed_data: TypedData, its message is ignored.
+        :return: TypedDataHasher instance.
+        """
+        return TypedDataHasher(
+            types=typed_data.types,
+            primary_type=typed_data.primary_type,
+            domain=typed_data.domain,
+        )
+
+    @property
+    def types(self) -> Dict[str, List[Parameter]]:
+        """Types of the typed data."""
+        return self._typed_data.types
+
+    @property
+    def primary_type(self) -> str:
+        """Type of the hashed messages."""
+        return self._typed_data.primary_type
+
+    @property
+    def domain(self) -> Domain:
+        """Domain of the typed data."""
+        return self._typed_data.domain
+
+    def struct_hash(self, message: dict) -> int:
+        """
+        Calculate the hash of a message as a struct of the primary type.
+
+        :param message: Message to hash.
+        :return: Hash of the struct.
+        """
+        return self._typed_data.struct_hash(self.primary_type, message)
+
+    def message_hash(self, message: dict, account_address: int) -> int:
+        """
+        Calculate the hash of a message, the same as :meth:`TypedData.message_hash`.
+
+        :param message: Message to hash.
+        :param account_address: Address of an account.
+        :return: Hash of the message.
+        """
+        # pylint: disable=protected-access
+        return self._typed_data._message_hash(message, account_address)
+
+    def message_hashes(
+        self, messages: Iterable[dict], account_address: int
+    ) -> List[int]:
+        """
+        Calculate hashes of many messages signed by the same account.
+
+        :param messages: Messages to hash.
+        :param account_address: Address of an account.
+        :return: List of message hashes, in the same order as messages.
+        """
+        return [self.message_hash(message, account_address) for message in messages]
+
+    def iter_message_hashes(
+        self,
+        messages: Iterable[TypedMessage],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 256,
+    ) -> Iterator[int]:
+        """
+        Lazily calculate hashes of a stream of messages signed by any accounts.
+
+        :param messages: Tuples of message and address of the account signing it.
+        :param executor: Optional executor (e.g. ProcessPoolExecutor) hashing chunks of messages in parallel.
+        :param chunk_size: Number of messages hashed in a single task of the executor.
+        :return: Iterator of message hashes, in the same order as messages.
+        """
+        return _iter_chunk_results(
+            self._hash_chunk, messages, executor=executor, chunk_size=chunk_size
+        )
+
+    def iter_verify_messages(
+        self,
+        messages: Iterable[SignedTypedMessage],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 256,
+    ) -> Iterator[Tuple[int, bool]]:
+        """
+        Lazily calculate hashes of a stream of signed messages and verify their signatures in the same pass.
+        Signatures are verified with :func:`~starknet_py.hash.utils.verify_many`.
+
+        :param messages: Tuples of message, address of the account, signature and public key of the account.
+        :param executor: Optional executor (e.g. ProcessPoolExecutor) processing chunks of messages in parallel.
+        :param chunk_size: Number of messages processed in a single task of the executor.
+        :return: Iterator of tuples of message hash and verification result, in the same order as messages.
+        """
+        return _iter_chunk_results(
+            self._verify_chunk, messages, executor=executor, chunk_size=chunk_size
+        )
+
+    def _hash_chunk(self, messages: List[TypedMessage]) -> List[int]:
+        return [
+            self.message_hash(message, account_address)
+            for message, account_address in messages
+        ]
+
+    def _verify_chunk(
+        self, messages: List[SignedTypedMessage]
+    ) -> List[Tuple[int, bool]]:
+        hashes = [
+            self.message_hash(message, account_address)
+            for message, account_address, _, _ in messages
+        ]
+        results = verify_many(
+            (msg_hash, signature, public_key)
+            for msg_hash, (_, _, signature, public_key) in zip(hashes, messages)
+        )
+        return list(zip(hashes, results))
+
+
+def _iter_chunk_results(
+    process_chunk: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    executor: Optional[Executor],
+    chunk_size: int,
+) -> Iterator[R]:
+    """
+    Processes items in chunks, keeping at most _MAX_PENDING_CHUNKS chunks in the executor,
+    and yields results in the order of items.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Argument chunk_size must be greater than 0.")
+
+    items_iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items_iterator, chunk_size)), [])
+
+    if executor is None:
+        for chunk in chunks:
+            yield from process_chunk(chunk)
+        return
+
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(process_chunk, chunk))
+            if len(pending) >= _MAX_PENDING_CHUNKS:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@dataclass
+class _TypesCache:
+    all_types: Dict[str, List[Parameter]]
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+    type_hashes: Dict[str, int] = field(default_factory=dict)
+
+
+_TypesKey = Tuple[Revision, Tuple[Tuple[str, Tuple[Parameter, ...]], ...]]
+
+# Maximal number of distinct types whose type hashes are kept
+_TYPES_CACHE_SIZE = 256
+_types_caches: "OrderedDict[_TypesKey, _TypesCache]" = OrderedDict()
+_types_caches_lock = threading.Lock()
+
+
+def _get_types_cache(
+    types: Dict[str, List[Parameter]], revision: Revision
+) -> _TypesCache:
+    """
+    Returns cache of type hashes and dependencies shared by all typed data with the same types and revision.
+    """
+    key = (revision, tuple((name, tuple(params)) for name, params in types.items()))
+    with _types_caches_lock:
+        cache = _types_caches.get(key)
+        if cache is None:
+            cache = _TypesCache(all_types={**_get_preset_types(revision), **types})
+            _types_caches[key] = cache
+            if len(_types_caches) > _TYPES_CACHE_SIZE:
+                _types_caches.popitem(last=False)
+        else:
+            _types_caches.move_to_end(key)
+    return cache
+
+
 def _extract_enum_types(value: str) -> List[str]:
     if not is_enum_variant_type(value):
         raise ValueError(f"Type [{value}] is not an enum.")
@@ -617,19 +878,23 @@ def encode_i128(value: Union[str, int]) -> int:
     raise ValueError(f"Value [{value}] is out of range for '{BasicType.I128}'.")
 
 
-def _get_basic_type_names(revision: Revision) -> List[str]:
-    basic_types_v0 = [
+_BASIC_TYPE_NAMES_V0 = [
+    basic_type.value
+    for basic_type in (
         BasicType.FELT,
         BasicType.SELECTOR,
         BasicType.MERKLE_TREE,
         BasicType.STRING,
         BasicType.BOOL,
-    ]
+    )
+]
+_BASIC_TYPE_NAMES_V1 = [basic_type.value for basic_type in BasicType]
 
-    basic_types_v1 = list(BasicType)
 
-    basic_types = basic_types_v0 if revision == Revision.V0 else basic_types_v1
-    return [basic_type.value for basic_type in basic_types]
+def _get_basic_type_names(revision: Revision) -> List[str]:
+    return list(
+        _BASIC_TYPE_NAMES_V0 if revision == Revision.V0 else _BASIC_TYPE_NAMES_V1
+    )
 
 
 def _get_preset_types(